@@ -0,0 +1,45 @@
+import asyncio
+
+from netspresso import NetsPresso
+from netspresso.enums import DeviceName, Framework
+
+EMAIL = "YOUR_EMAIL"
+PASSWORD = "YOUR_PASSWORD"
+
+netspresso = NetsPresso(email=EMAIL, password=PASSWORD)
+
+# 1. Declare async converter and benchmarker (they share one executor)
+converter = netspresso.async_converter()
+benchmarker = netspresso.async_benchmarker()
+
+# 2. Set variables for convert
+INPUT_MODEL_PATH = "./examples/sample_models/test.onnx"
+TARGET_FRAMEWORK = Framework.TENSORFLOW_LITE
+TARGET_DEVICE_NAMES = [
+    DeviceName.RASPBERRY_PI_4B,
+    DeviceName.RASPBERRY_PI_3B_PLUS,
+    DeviceName.RASPBERRY_PI_ZERO_2W,
+]
+
+
+async def convert_and_benchmark(target_device_name):
+    conversion_result = await converter.convert_model(
+        input_model_path=INPUT_MODEL_PATH,
+        output_dir=f"./outputs/converted/TFLITE_{target_device_name}",
+        target_framework=TARGET_FRAMEWORK,
+        target_device_name=target_device_name,
+    )
+    return await benchmarker.benchmark_model(
+        input_model_path=conversion_result["converted_model_path"],
+        target_device_name=target_device_name,
+    )
+
+
+async def main():
+    # 3. Run convert and benchmark for every device at once
+    return await asyncio.gather(*[convert_and_benchmark(device) for device in TARGET_DEVICE_NAMES])
+
+
+benchmark_results = asyncio.run(main())
+for device, benchmark_result in zip(TARGET_DEVICE_NAMES, benchmark_results):
+    print(f"{device} model inference latency: {benchmark_result['result']['latency']} ms")
@@ -1,3 +1,5 @@
+from .async_benchmarker import AsyncBenchmarker
+from .backends import BenchmarkBackend, DeviceFarmBackend, LocalBackend
 from .benchmarker import Benchmarker
 
-__all__ = ["Benchmarker"]
+__all__ = ["Benchmarker", "AsyncBenchmarker", "BenchmarkBackend", "DeviceFarmBackend", "LocalBackend"]
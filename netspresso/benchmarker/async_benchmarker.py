@@ -0,0 +1,110 @@
+from typing import Dict, List, Optional, Union
+
+from netspresso.clients.auth import TokenHandler
+from netspresso.clients.auth.schemas.auth import UserInfo
+from netspresso.clients.launcher.schemas import BenchmarkTask
+from netspresso.enums.device import DeviceName, HardwareType, SoftwareVersion
+from netspresso.enums.model import DataType
+
+from ..utils.executor import AsyncExecutor
+from .backends import BenchmarkBackend
+from .benchmarker import Benchmarker
+
+
+class AsyncBenchmarker:
+    def __init__(
+        self,
+        token_handler: TokenHandler,
+        user_info: UserInfo,
+        executor: Optional[AsyncExecutor] = None,
+        backend: Optional[BenchmarkBackend] = None,
+    ) -> None:
+        """Initialize the AsyncBenchmarker.
+
+        Args:
+            token_handler (TokenHandler): The token handler of the logged in user.
+            user_info (UserInfo): The information of the logged in user.
+            executor (AsyncExecutor, optional): The executor shared by the async modules. A new one is created if None.
+            backend (BenchmarkBackend, optional): The backend running benchmark_model. Defaults to the device farm.
+        """
+
+        self.benchmarker = Benchmarker(token_handler=token_handler, user_info=user_info, backend=backend)
+        self.executor = executor if executor is not None else AsyncExecutor()
+
+    async def benchmark_model(
+        self,
+        input_model_path: str,
+        target_device_name: Optional[DeviceName] = None,
+        target_data_type: DataType = DataType.FP16,
+        target_software_version: Optional[Union[str, SoftwareVersion]] = None,
+        target_hardware_type: Optional[Union[str, HardwareType]] = None,
+        wait_until_done: bool = True,
+        iterations: Optional[int] = None,
+        warmup: Optional[int] = None,
+    ) -> Dict:
+        """Benchmark the specified model on the specified device without blocking the event loop.
+
+        Args:
+            input_model_path (str): The file path where the model is located.
+            target_device_name (DeviceName, optional): Target device name. Required by the device farm backend.
+            target_data_type (DataType): Data type of the model.
+            target_software_version (Union[str, SoftwareVersion], optional): Target software version. Required if target_device_name is one of the Jetson devices.
+            target_hardware_type (Union[str, HardwareType], optional): Hardware type. Acceleration options for processing the model inference.
+            wait_until_done (bool): If True, wait for the benchmark result before returning the function.
+            iterations (int, optional): The number of timed runs. Defaults to the setting of the backend.
+            warmup (int, optional): The number of untimed runs excluded from the latencies. Defaults to the setting of the backend.
+
+        Returns:
+            Dict: Model benchmark task dictionary.
+        """
+
+        return await self.executor.run(
+            self.benchmarker.benchmark_model,
+            input_model_path=input_model_path,
+            target_device_name=target_device_name,
+            target_data_type=target_data_type,
+            target_software_version=target_software_version,
+            target_hardware_type=target_hardware_type,
+            wait_until_done=wait_until_done,
+            iterations=iterations,
+            warmup=warmup,
+        )
+
+    async def benchmark_matrix(
+        self,
+        input_model_path: str,
+        target_device_names: Optional[List[DeviceName]] = None,
+        target_data_types: Optional[List[DataType]] = None,
+        max_workers: int = 8,
+    ) -> List[Dict]:
+        """Benchmark the specified model on many devices and data types with a single upload.
+
+        Args:
+            input_model_path (str): The file path where the model is located.
+            target_device_names (List[DeviceName], optional): Target device names. All available devices are used if None.
+            target_data_types (List[DataType], optional): Data types of the model. Defaults to [DataType.FP16].
+            max_workers (int): The maximum number of benchmark tasks running at the same time. Defaults to 8.
+
+        Returns:
+            List[Dict]: Model benchmark task dictionaries in the order of the combinations.
+        """
+
+        return await self.executor.run(
+            self.benchmarker.benchmark_matrix,
+            input_model_path=input_model_path,
+            target_device_names=target_device_names,
+            target_data_types=target_data_types,
+            max_workers=max_workers,
+        )
+
+    async def get_benchmark_task(self, benchmark_task: Union[str, BenchmarkTask]) -> BenchmarkTask:
+        """Get information about the specified benchmark task using either the benchmark task object or its UUID.
+
+        Args:
+            benchmark_task (Union[BenchmarkTask, str]): Benchmark task object or the UUID of the benchmark task.
+
+        Returns:
+            BenchmarkTask: Model benchmark task object.
+        """
+
+        return await self.executor.run(self.benchmarker.get_benchmark_task, benchmark_task)
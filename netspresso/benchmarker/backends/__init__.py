@@ -0,0 +1,5 @@
+from .base import BenchmarkBackend
+from .device_farm import DeviceFarmBackend
+from .local import LocalBackend
+
+__all__ = ["BenchmarkBackend", "DeviceFarmBackend", "LocalBackend"]
@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+from typing import Optional, Union
+
+from netspresso.enums.device import DeviceName, HardwareType, SoftwareVersion
+from netspresso.enums.model import DataType
+
+from ...utils.metadata.default import BenchmarkerMetadata
+
+
+class BenchmarkBackend(ABC):
+    """Runs the benchmarks requested through the Benchmarker.
+
+    Attributes:
+        consumes_credit (bool): If True, the Benchmarker checks and consumes credits for every benchmark.
+    """
+
+    consumes_credit: bool = False
+
+    @abstractmethod
+    def benchmark(
+        self,
+        input_model_path: str,
+        metadata: BenchmarkerMetadata,
+        target_device_name: Optional[Union[str, DeviceName]],
+        target_data_type: Union[str, DataType],
+        target_software_version: Optional[Union[str, SoftwareVersion]] = None,
+        target_hardware_type: Optional[Union[str, HardwareType]] = None,
+        wait_until_done: bool = True,
+        iterations: Optional[int] = None,
+        warmup: Optional[int] = None,
+    ) -> None:
+        """Benchmark the model and fill the benchmark info and result of the metadata.
+
+        Args:
+            input_model_path (str): The file path where the model is located.
+            metadata (BenchmarkerMetadata): The metadata to fill.
+            target_device_name (Union[str, DeviceName], optional): Target device name.
+            target_data_type (Union[str, DataType]): Data type of the model.
+            target_software_version (Union[str, SoftwareVersion], optional): Target software version.
+            target_hardware_type (Union[str, HardwareType], optional): Hardware type.
+            wait_until_done (bool): If True, wait for the benchmark result before returning.
+            iterations (int, optional): The number of timed runs. Defaults to the setting of the backend.
+            warmup (int, optional): The number of untimed runs before the timed runs. Defaults to the setting of the backend.
+        """
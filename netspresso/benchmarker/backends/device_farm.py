@@ -0,0 +1,62 @@
+from typing import TYPE_CHECKING, Optional, Union
+
+from loguru import logger
+
+from netspresso.enums.device import DeviceName, HardwareType, SoftwareVersion
+from netspresso.enums.model import DataType
+
+from ...utils.metadata.default import BenchmarkerMetadata
+from .base import BenchmarkBackend
+
+if TYPE_CHECKING:
+    from ..benchmarker import Benchmarker
+
+
+class DeviceFarmBackend(BenchmarkBackend):
+    """Benchmark on the real devices of the NetsPresso device farm. Every benchmark consumes credits.
+
+    The device farm reports only the mean latency, so the latency distribution of the result stays empty.
+
+    Args:
+        benchmarker (Benchmarker): The benchmarker holding the credentials of the user.
+    """
+
+    consumes_credit = True
+
+    def __init__(self, benchmarker: "Benchmarker") -> None:
+        self.benchmarker = benchmarker
+
+    def benchmark(
+        self,
+        input_model_path: str,
+        metadata: BenchmarkerMetadata,
+        target_device_name: Optional[Union[str, DeviceName]],
+        target_data_type: Union[str, DataType],
+        target_software_version: Optional[Union[str, SoftwareVersion]] = None,
+        target_hardware_type: Optional[Union[str, HardwareType]] = None,
+        wait_until_done: bool = True,
+        iterations: Optional[int] = None,
+        warmup: Optional[int] = None,
+    ) -> None:
+        if target_device_name is None:
+            raise ValueError("The target_device_name is required to benchmark on the device farm.")
+        if iterations is not None or warmup is not None:
+            logger.warning("The device farm reports only the mean latency. The iterations and warmup are ignored.")
+
+        benchmarker = self.benchmarker
+        model = benchmarker._upload_model(input_model_path)
+
+        benchmarker._validate_target(
+            target_device_name, target_data_type, target_software_version, target_hardware_type
+        )
+        target_device = benchmarker._select_target_device(
+            model, target_device_name, target_software_version, target_hardware_type
+        )
+
+        model_benchmark = benchmarker._run_benchmark(
+            model_uuid=model.model_uuid,
+            target_device=target_device,
+            target_data_type=target_data_type,
+            wait_until_done=wait_until_done,
+        )
+        benchmarker._update_metadata(metadata, model_benchmark)
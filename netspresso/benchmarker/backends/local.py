@@ -0,0 +1,310 @@
+import importlib
+import os
+import platform
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
+
+from loguru import logger
+
+from netspresso.enums.device import DeviceName, HardwareType, SoftwareVersion
+from netspresso.enums.metadata import Status
+from netspresso.enums.model import DataType
+
+from ...utils.metadata.default import BenchmarkerMetadata, LatencyDistribution
+from .base import BenchmarkBackend
+
+LOCAL_DEVICE_NAME = "local_cpu"
+RUNTIME_MODULES = {".onnx": ["onnxruntime"], ".tflite": ["tflite_runtime.interpreter", "tensorflow"]}
+ONNX_TYPES = {
+    "tensor(float)": "float32",
+    "tensor(float16)": "float16",
+    "tensor(double)": "float64",
+    "tensor(int8)": "int8",
+    "tensor(uint8)": "uint8",
+    "tensor(int16)": "int16",
+    "tensor(int32)": "int32",
+    "tensor(int64)": "int64",
+    "tensor(bool)": "bool",
+}
+
+
+def _random_input(np, shape: List[Any], dtype: Any) -> Any:
+    # Dynamic dimensions (None, -1 or symbolic names) are benchmarked with 1.
+    shape = [dim if isinstance(dim, int) and dim > 0 else 1 for dim in shape]
+    dtype = np.dtype(dtype)
+    if dtype == np.bool_:
+        return np.random.randint(0, 2, size=shape).astype(dtype)
+    if np.issubdtype(dtype, np.integer):
+        info = np.iinfo(dtype)
+        return np.random.randint(max(info.min, -128), min(info.max, 127) + 1, size=shape).astype(dtype)
+    return np.random.random_sample(shape).astype(dtype)
+
+
+def get_peak_rss() -> Optional[float]:
+    """Get the peak resident set size of the current process in MB, or None if it cannot be read."""
+    try:
+        import resource
+
+        peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in kilobytes on Linux.
+        return peak_rss / 1024**2 if sys.platform == "darwin" else peak_rss / 1024
+    except ImportError:  # Windows
+        pass
+    try:
+        import psutil
+
+        memory_info = psutil.Process().memory_info()
+        return getattr(memory_info, "peak_wset", memory_info.rss) / 1024**2
+    except ImportError:
+        return None
+
+
+def get_rss() -> Optional[float]:
+    """Get the current resident set size of the current process in MB, or None if it cannot be read."""
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / 1024**2
+    except ImportError:
+        pass
+    try:
+        with open("/proc/self/statm", "r") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 1024**2
+    except (OSError, ValueError, AttributeError):
+        return None
+
+
+class MemorySampler:
+    """Measure the memory used by the model, as the peak RSS above the RSS before the model was loaded.
+
+    The RSS is sampled by a background thread while the sampler is running. Where the current RSS
+    cannot be read, the increase of the peak RSS of the process is used instead, which misses the
+    memory of a model that stays below an earlier peak of the process. If neither can be read, as on
+    Windows without psutil, the memory is not measured.
+
+    Args:
+        interval (float): The seconds between two samples.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.baseline = get_rss()
+        self.peak = self.baseline
+        self._baseline_peak = get_peak_rss() if self.baseline is None else None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def sample(self) -> None:
+        rss = get_rss()
+        if rss is not None and rss > self.peak:
+            self.peak = rss
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def __enter__(self) -> "MemorySampler":
+        if self.baseline is not None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self.sample()
+
+    @property
+    def memory_footprint(self) -> Optional[float]:
+        """The memory used by the model in MB, or None if it cannot be measured."""
+        if self.baseline is None:
+            if self._baseline_peak is None:
+                return None
+            return max(get_peak_rss() - self._baseline_peak, 0.0)
+        return max(self.peak - self.baseline, 0.0)
+
+
+class LocalBackend(BenchmarkBackend):
+    """Benchmark ONNX and TFLite models on the CPU of the local machine. It does not consume credits.
+
+    ONNX models run with onnxruntime, and TFLite models run with tflite_runtime or tensorflow.
+    The model runs on random inputs `warmup` times untimed, then `iterations` times timed.
+    The mean latency and the latency distribution are saved in ms. The memory footprint is the peak RSS
+    of the process while the model is loaded and run, above the RSS before it was loaded, in MB.
+
+    Args:
+        num_threads (int, optional): The number of threads used by the runtime. The runtime decides if None.
+        warmup (int): The number of untimed runs before the measurement.
+        iterations (int): The number of timed runs.
+        histogram_buckets (int): The number of buckets of the saved latency histogram.
+    """
+
+    consumes_credit = False
+
+    def __init__(
+        self, num_threads: Optional[int] = None, warmup: int = 10, iterations: int = 100, histogram_buckets: int = 20
+    ) -> None:
+        if iterations < 1:
+            raise ValueError("The iterations should be at least 1.")
+        self.num_threads = num_threads
+        self.warmup = warmup
+        self.iterations = iterations
+        self.histogram_buckets = histogram_buckets
+
+    def _load_onnx(self, input_model_path: str) -> Tuple[Callable[[], Any], str]:
+        try:
+            import numpy as np
+            import onnxruntime as ort
+        except ImportError as e:
+            raise ImportError(
+                "Benchmarking ONNX models locally requires onnxruntime. Please run `pip install onnxruntime`."
+            ) from e
+
+        options = ort.SessionOptions()
+        if self.num_threads is not None:
+            options.intra_op_num_threads = self.num_threads
+            options.inter_op_num_threads = 1
+        session = ort.InferenceSession(input_model_path, sess_options=options, providers=["CPUExecutionProvider"])
+        feeds = {
+            node.name: _random_input(np, node.shape, ONNX_TYPES.get(node.type, "float32"))
+            for node in session.get_inputs()
+        }
+
+        return lambda: session.run(None, feeds), f"onnxruntime {ort.__version__}"
+
+    def _load_tflite(self, input_model_path: str) -> Tuple[Callable[[], Any], str]:
+        try:
+            import numpy as np
+            import tflite_runtime
+            from tflite_runtime.interpreter import Interpreter
+
+            software_version = f"tflite_runtime {tflite_runtime.__version__}"
+        except ImportError:
+            try:
+                import numpy as np
+                import tensorflow as tf
+
+                Interpreter = tf.lite.Interpreter
+                software_version = f"tensorflow {tf.__version__}"
+            except ImportError as e:
+                raise ImportError(
+                    "Benchmarking TFLite models locally requires tflite_runtime or tensorflow. "
+                    "Please run `pip install tflite-runtime`."
+                ) from e
+
+        interpreter = Interpreter(model_path=input_model_path, num_threads=self.num_threads)
+        for detail in interpreter.get_input_details():
+            shape = [dim if dim > 0 else 1 for dim in detail.get("shape_signature", detail["shape"])]
+            interpreter.resize_tensor_input(detail["index"], shape)
+        interpreter.allocate_tensors()
+        for detail in interpreter.get_input_details():
+            interpreter.set_tensor(detail["index"], _random_input(np, list(detail["shape"]), detail["dtype"]))
+
+        return interpreter.invoke, software_version
+
+    def measure(
+        self, input_model_path: str, iterations: Optional[int] = None, warmup: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Run the model and measure its latency and memory.
+
+        Args:
+            input_model_path (str): The file path of the ONNX or TFLite model.
+            iterations (int, optional): The number of timed runs. Defaults to the iterations of the backend.
+            warmup (int, optional): The number of untimed runs. Defaults to the warmup of the backend.
+
+        Raises:
+            NotImplementedError: If the model format is not supported.
+
+        Returns:
+            Dict[str, Any]: The latencies of every timed run in ms, the memory used by the model in MB
+                (None if it cannot be measured) and the runtime version.
+        """
+        suffix = Path(input_model_path).suffix.lower()
+        if suffix not in [".onnx", ".tflite"]:
+            raise NotImplementedError(f"The local backend supports only .onnx and .tflite models, not {suffix}.")
+
+        iterations = self.iterations if iterations is None else iterations
+        warmup = self.warmup if warmup is None else warmup
+        if iterations < 1:
+            raise ValueError("The iterations should be at least 1.")
+
+        # The runtime libraries and the memory of the process before the model is loaded are not part of the footprint.
+        for module in RUNTIME_MODULES[suffix]:
+            try:
+                importlib.import_module(module)
+                break
+            except ImportError:
+                continue  # The loader raises the installation hint.
+
+        with MemorySampler() as memory:
+            if suffix == ".onnx":
+                run, software_version = self._load_onnx(input_model_path)
+            else:
+                run, software_version = self._load_tflite(input_model_path)
+
+            for _ in range(warmup):
+                run()
+
+            latencies = []
+            for _ in range(iterations):
+                start = time.perf_counter()
+                run()
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        return {
+            "latencies": latencies,
+            "warmup": warmup,
+            "memory_footprint": memory.memory_footprint,
+            "software_version": software_version,
+        }
+
+    def benchmark(
+        self,
+        input_model_path: str,
+        metadata: BenchmarkerMetadata,
+        target_device_name: Optional[Union[str, DeviceName]],
+        target_data_type: Union[str, DataType],
+        target_software_version: Optional[Union[str, SoftwareVersion]] = None,
+        target_hardware_type: Optional[Union[str, HardwareType]] = None,
+        wait_until_done: bool = True,
+        iterations: Optional[int] = None,
+        warmup: Optional[int] = None,
+    ) -> None:
+        measurement = self.measure(input_model_path, iterations=iterations, warmup=warmup)
+        distribution = LatencyDistribution.from_latencies(
+            measurement["latencies"], warmup=measurement["warmup"], num_buckets=self.histogram_buckets
+        )
+        memory_footprint = measurement["memory_footprint"]
+        memory = f"{memory_footprint:.1f} MB" if memory_footprint is not None else "unavailable"
+        logger.info(
+            f"Local benchmark of {Path(input_model_path).name}: mean {distribution.mean:.3f} ms, "
+            f"p50 {distribution.p50:.3f} ms, p90 {distribution.p90:.3f} ms, p99 {distribution.p99:.3f} ms, "
+            f"memory {memory}"
+        )
+
+        metadata.update_benchmark_info(
+            target_device=target_device_name or LOCAL_DEVICE_NAME,
+            file_name=Path(input_model_path).name,
+            data_type=target_data_type,
+            processor=platform.processor() or platform.machine(),
+            software_version=measurement["software_version"],
+            hardware_type="cpu",
+            input_model_uuid="",
+            benchmark_task_uuid="",
+            devicefarm_benchmark_task_uuid="",
+            devicefarm_model_uuid="",
+        )
+        metadata.update_result(
+            memory_footprint_gpu=0,
+            memory_footprint_cpu=memory_footprint,
+            latency=distribution.mean,
+            ram_size=0,
+            power_consumption=0,
+            file_size=Path(input_model_path).stat().st_size / 1024**2,
+        )
+        metadata.update_latency_distribution(distribution)
+        metadata.update_status(status=Status.COMPLETED)
@@ -1,13 +1,14 @@
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, List, Optional, Union
 
 from loguru import logger
 
-from netspresso.clients.auth import TokenHandler, auth_client
+from netspresso.clients.auth import TokenHandler
 from netspresso.clients.auth.schemas.auth import UserInfo
 from netspresso.clients.launcher import launcher_client
-from netspresso.clients.launcher.schemas import BenchmarkTask, TargetDeviceFilter
+from netspresso.clients.launcher.schemas import BenchmarkTask, TargetDevice, TargetDeviceFilter
+from netspresso.clients.launcher.schemas.model import Model
 from netspresso.enums.credit import ServiceCredit
 from netspresso.enums.device import DeviceName, HardwareType, SoftwareVersion, TaskStatus
 from netspresso.enums.metadata import Status, TaskType
@@ -15,35 +16,189 @@ from netspresso.enums.model import DataType
 from netspresso.enums.module import Module
 
 from ..utils import FileHandler, check_credit_balance
-from ..utils.metadata import MetadataHandler
+from ..utils.metadata import BenchmarkResultWriter, MetadataHandler
+from ..utils.metadata.default import BenchmarkerMetadata
+from ..utils.poller import BackoffPolicy, JobPoller
+from .backends import BenchmarkBackend, DeviceFarmBackend
 
 
 class Benchmarker:
-    def __init__(self, token_handler: TokenHandler, user_info: UserInfo) -> None:
-        """Initialize the Benchmarker."""
+    def __init__(
+        self,
+        token_handler: TokenHandler,
+        user_info: UserInfo,
+        polling_policy: Optional[BackoffPolicy] = None,
+        backend: Optional[BenchmarkBackend] = None,
+    ) -> None:
+        """Initialize the Benchmarker.
+
+        Args:
+            token_handler (TokenHandler): The token handler of the logged in user.
+            user_info (UserInfo): The information of the logged in user.
+            polling_policy (BackoffPolicy, optional): The intervals and timeout used while waiting for benchmarks.
+            backend (BenchmarkBackend, optional): The backend running benchmark_model. Defaults to the device farm.
+        """
 
         self.token_handler = token_handler
         self.user_info = user_info
+        self.polling_policy = polling_policy if polling_policy is not None else BackoffPolicy()
+        self.backend = backend if backend is not None else DeviceFarmBackend(self)
+
+    def _create_poller(self, on_status_change=None) -> JobPoller:
+        def _log_status_change(task_uuid, previous_status, status, benchmark_task):
+            logger.info(f"Benchmark task {task_uuid} status: {status}")
+            if on_status_change is not None:
+                on_status_change(task_uuid, previous_status, status, benchmark_task)
+
+        return JobPoller(
+            fetch=self.get_benchmark_task,
+            is_done=lambda task: task.status not in [TaskStatus.IN_QUEUE, TaskStatus.IN_PROGRESS],
+            get_status=lambda task: task.status,
+            policy=self.polling_policy,
+            on_status_change=_log_status_change,
+        )
+
+    def _upload_model(self, input_model_path: str) -> Model:
+        return launcher_client.upload_model(
+            model_file_path=input_model_path,
+            target_function=Module.BENCHMARK,
+            access_token=self.token_handler.tokens.access_token,
+            verify_ssl=self.token_handler.verify_ssl,
+        )
+
+    @staticmethod
+    def _validate_target(
+        target_device_name: DeviceName,
+        target_data_type: DataType,
+        target_software_version: Optional[Union[str, SoftwareVersion]],
+        target_hardware_type: Optional[Union[str, HardwareType]],
+    ) -> None:
+        if target_device_name in DeviceName.JETSON_DEVICES and target_software_version is None:
+            raise ValueError(
+                "The benchmark is unavailable. Please set JetPack version with target_software_version for Jetson Devices."
+            )
+
+        # Check available int8 converting devices
+        if target_data_type == DataType.INT8:
+            if target_device_name not in DeviceName.AVAILABLE_INT8_DEVICES:
+                raise ValueError(f"int8 converting supports only {DeviceName.AVAILABLE_INT8_DEVICES}.")
+        else:  # FP16, FP32
+            if target_device_name in DeviceName.ONLY_INT8_DEVICES:
+                raise ValueError(f"{DeviceName.ONLY_INT8_DEVICES} only support int8 data types.")
+
+        if target_hardware_type == HardwareType.HELIUM and target_device_name not in DeviceName.ONLY_INT8_DEVICES:
+            raise ValueError(f"{DeviceName.ONLY_INT8_DEVICES} only support helium hardware type.")
+
+    @staticmethod
+    def _select_target_device(
+        model: Model,
+        target_device_name: DeviceName,
+        target_software_version: Optional[Union[str, SoftwareVersion]],
+        target_hardware_type: Optional[Union[str, HardwareType]],
+    ) -> TargetDevice:
+        devices = TargetDeviceFilter.filter_devices_with_device_name(
+            name=target_device_name, devices=model.available_devices
+        )
+        if target_device_name in DeviceName.JETSON_DEVICES:
+            devices = TargetDeviceFilter.filter_devices_with_device_software_version(
+                software_version=target_software_version, devices=devices
+            )
+        devices = TargetDeviceFilter.filter_devices_with_hardware_type(
+            hardware_type=target_hardware_type, devices=devices
+        )
+
+        if not devices:
+            raise NotImplementedError(
+                "The benchmark is unavailable. There is no available device with given target_device_name and target_software_version."
+            )
+
+        target_device = devices[0]
+
+        if target_device.device_name is None:
+            raise NotImplementedError(
+                "There is no avaliable function for given paremeter. Please specify the target device."
+            )
+
+        return target_device
+
+    def _request_benchmark(
+        self, model_uuid: str, target_device: TargetDevice, target_data_type: DataType
+    ) -> BenchmarkTask:
+        return launcher_client.benchmark_model(
+            user_uuid=self.user_info.user_id,
+            model_uuid=model_uuid,
+            target_device=target_device.device_name,
+            data_type=target_data_type,
+            software_version=target_device.software_version,
+            hardware_type=target_device.hardware_type,
+            access_token=self.token_handler.tokens.access_token,
+            verify_ssl=self.token_handler.verify_ssl,
+        )
+
+    def _run_benchmark(
+        self,
+        model_uuid: str,
+        target_device: TargetDevice,
+        target_data_type: DataType,
+        wait_until_done: bool = True,
+    ) -> BenchmarkTask:
+        model_benchmark = self._request_benchmark(model_uuid, target_device, target_data_type)
+
+        if wait_until_done:
+            return self._create_poller().wait(model_benchmark.benchmark_task_uuid)
+
+        return self.get_benchmark_task(benchmark_task=model_benchmark)
+
+    @staticmethod
+    def _update_metadata(metadata: BenchmarkerMetadata, model_benchmark: BenchmarkTask) -> None:
+        metadata.update_benchmark_info(
+            target_device=model_benchmark.target_device,
+            file_name=model_benchmark.filename,
+            data_type=model_benchmark.data_type,
+            processor=model_benchmark.processor,
+            software_version=model_benchmark.software_version,
+            hardware_type=model_benchmark.hardware_type,
+            input_model_uuid=model_benchmark.input_model_uuid,
+            benchmark_task_uuid=model_benchmark.benchmark_task_uuid,
+            devicefarm_benchmark_task_uuid=model_benchmark.devicefarm_benchmark_task_uuid,
+            devicefarm_model_uuid=model_benchmark.devicefarm_model_uuid,
+        )
+        metadata.update_result(
+            memory_footprint_gpu=model_benchmark.memory_footprint_gpu,
+            memory_footprint_cpu=model_benchmark.memory_footprint_cpu,
+            latency=model_benchmark.latency,
+            ram_size=model_benchmark.ram_size,
+            power_consumption=model_benchmark.power_consumption,
+            file_size=model_benchmark.file_size,
+        )
+        metadata.update_status(status=Status.COMPLETED)
 
     def benchmark_model(
         self,
         input_model_path: str,
-        target_device_name: DeviceName,
+        target_device_name: Optional[DeviceName] = None,
         target_data_type: DataType = DataType.FP16,
         target_software_version: Optional[Union[str, SoftwareVersion]] = None,
         target_hardware_type: Optional[Union[str, HardwareType]] = None,
         wait_until_done: bool = True,
+        iterations: Optional[int] = None,
+        warmup: Optional[int] = None,
     ) -> Dict:
-        """Benchmark the specified model on the specified device.
+        """Benchmark the specified model on the specified device with the backend of the Benchmarker.
+
+        Backends that time the runs themselves, like LocalBackend, save the latency distribution of the timed runs
+        (mean, std, min, max, p50, p90, p99 and a histogram) under result.latency_distribution.
 
         Args:
             input_model_path (str): The file path where the model is located.
-            target_device_name (DeviceName): Target device name.
+            target_device_name (DeviceName, optional): Target device name. Required by the device farm backend.
             target_data_type (DataType): Data type of the model.
             target_software_version (Union[str, SoftwareVersion], optional): Target software version. Required if target_device_name is one of the Jetson devices.
             target_hardware_type (Union[str, HardwareType], optional): Hardware type. Acceleration options for processing the model inference.
             wait_until_done (bool): If True, wait for the conversion result before returning the function.
                                 If False, request the conversion and return the function immediately.
+            iterations (int, optional): The number of timed runs. Defaults to the setting of the backend.
+            warmup (int, optional): The number of untimed runs excluded from the latencies. Defaults to the setting of the backend.
 
         Raises:
             e: If an error occurs during the benchmarking of the model.
@@ -54,137 +209,215 @@ class Benchmarker:
 
         FileHandler.check_input_model_path(input_model_path)
 
-        self.token_handler.validate_token()
+        consumes_credit = self.backend.consumes_credit
+        if consumes_credit:
+            self.token_handler.validate_token()
+
+        folder_path = Path(input_model_path).parent
+        store = MetadataHandler.get_benchmark_store(folder_path)
+        metadata = MetadataHandler.get_default_metadata(TaskType.BENCHMARK)
+        record_id = store.append(metadata.asdict())
 
         try:
-            folder_path = Path(input_model_path).parent
+            if consumes_credit:
+                current_credit = self.token_handler.get_credit()
+                check_credit_balance(user_credit=current_credit, service_credit=ServiceCredit.MODEL_BENCHMARK)
+
+            self.backend.benchmark(
+                input_model_path=input_model_path,
+                metadata=metadata,
+                target_device_name=target_device_name,
+                target_data_type=target_data_type,
+                target_software_version=target_software_version,
+                target_hardware_type=target_hardware_type,
+                wait_until_done=wait_until_done,
+                iterations=iterations,
+                warmup=warmup,
+            )
+            store.update(record_id, metadata.asdict())
 
-            metadata = MetadataHandler.get_default_metadata(TaskType.BENCHMARK)
-            if FileHandler.check_exists(folder_path / "benchmark.json"):
-                metadatas = MetadataHandler.load_json(folder_path / "benchmark.json")
-                metadatas.append(metadata.asdict())
-            else:
-                metadatas = [metadata.asdict()]
-            MetadataHandler.save_json(metadatas, folder_path, file_name="benchmark")
+            if consumes_credit:
+                self.token_handler.consume_credit(ServiceCredit.MODEL_BENCHMARK)
 
-            current_credit = auth_client.get_credit(
-                self.token_handler.tokens.access_token, self.token_handler.verify_ssl
-            )
-            check_credit_balance(user_credit=current_credit, service_credit=ServiceCredit.MODEL_BENCHMARK)
-            model = launcher_client.upload_model(
-                model_file_path=input_model_path,
-                target_function=Module.BENCHMARK,
-                access_token=self.token_handler.tokens.access_token,
-                verify_ssl=self.token_handler.verify_ssl,
-            )
-            model_uuid = model.model_uuid
+        except Exception as e:
+            logger.error(f"Benchmark failed. Error: {e}")
+            metadata.update_status(status=Status.ERROR)
+            store.update(record_id, metadata.asdict())
+            raise e
 
-            if target_device_name in DeviceName.JETSON_DEVICES and target_software_version is None:
-                raise ValueError(
-                    "The benchmark is unavailable. Please set JetPack version with target_software_version for Jetson Devices."
-                )
+        except KeyboardInterrupt:
+            metadata.update_status(status=Status.STOPPED)
+            store.update(record_id, metadata.asdict())
 
-            # Check available int8 converting devices
-            if target_data_type == DataType.INT8:
-                if target_device_name not in DeviceName.AVAILABLE_INT8_DEVICES:
-                    raise ValueError(f"int8 converting supports only {DeviceName.AVAILABLE_INT8_DEVICES}.")
-            else:  # FP16, FP32
-                if target_device_name in DeviceName.ONLY_INT8_DEVICES:
-                    raise ValueError(f"{DeviceName.ONLY_INT8_DEVICES} only support int8 data types.")
+        return metadata.asdict()
 
-            if target_hardware_type == HardwareType.HELIUM and target_device_name not in DeviceName.ONLY_INT8_DEVICES:
-                raise ValueError(f"{DeviceName.ONLY_INT8_DEVICES} only support helium hardware type.")
+    def benchmark_matrix(
+        self,
+        input_model_path: str,
+        target_device_names: Optional[List[DeviceName]] = None,
+        target_data_types: Optional[List[DataType]] = None,
+        max_workers: int = 8,
+    ) -> List[Dict]:
+        """Benchmark the specified model on many devices and data types with a single upload.
 
-            devices = TargetDeviceFilter.filter_devices_with_device_name(
-                name=target_device_name, devices=model.available_devices
-            )
-            if target_device_name in DeviceName.JETSON_DEVICES:
-                devices = TargetDeviceFilter.filter_devices_with_device_software_version(
-                    software_version=target_software_version, devices=devices
-                )
-            devices = TargetDeviceFilter.filter_devices_with_hardware_type(
-                hardware_type=target_hardware_type, devices=devices
-            )
+        Every (device, software version, hardware type) entry in the available devices of the uploaded model
+        is combined with every requested data type. Combinations that the device does not support are skipped.
+        The benchmark tasks run concurrently and each result is appended to `benchmark.jsonl` as soon as it finishes.
 
-            if not devices:
-                raise NotImplementedError(
-                    "The benchmark is unavailable. There is no available device with given target_device_name and target_software_version."
-                )
+        Args:
+            input_model_path (str): The file path where the model is located.
+            target_device_names (List[DeviceName], optional): Target device names. All available devices are used if None.
+            target_data_types (List[DataType], optional): Data types of the model. Defaults to [DataType.FP16].
+            max_workers (int): The maximum number of benchmark tasks running at the same time. Defaults to 8.
+
+        Raises:
+            e: If an error occurs before the benchmark tasks are requested.
+
+        Returns:
+            List[Dict]: Model benchmark task dictionaries in the order of the combinations.
+        """
+
+        FileHandler.check_input_model_path(input_model_path)
 
-            target_device = devices[0]
-            target_device_name = target_device.device_name
-            target_software_version = target_device.software_version
-            target_hardware_type = target_device.hardware_type
+        if target_data_types is None:
+            target_data_types = [DataType.FP16]
 
-            if target_device_name is None:
+        self.token_handler.validate_token()
+
+        try:
+            folder_path = Path(input_model_path).parent
+
+            logger.info("Uploading model for benchmark matrix...")
+            model = self._upload_model(input_model_path)
+
+            combinations = []
+            for target_device in model.available_devices:
+                if target_device_names is not None and target_device.device_name not in target_device_names:
+                    continue
+                for target_data_type in target_data_types:
+                    try:
+                        self._validate_target(
+                            target_device.device_name,
+                            target_data_type,
+                            target_device.software_version,
+                            target_device.hardware_type,
+                        )
+                    except ValueError as e:
+                        logger.warning(f"Skip {target_device.device_name} ({target_data_type}). {e}")
+                        continue
+                    combinations.append((target_device, target_data_type))
+
+            if not combinations:
                 raise NotImplementedError(
-                    "There is no avaliable function for given paremeter. Please specify the target device."
+                    "The benchmark is unavailable. There is no available device with given target_device_names and target_data_types."
                 )
 
-            model_benchmark: BenchmarkTask = launcher_client.benchmark_model(
-                user_uuid=self.user_info.user_id,
-                model_uuid=model_uuid,
-                target_device=target_device_name,
-                data_type=target_data_type,
-                software_version=target_software_version,
-                hardware_type=target_hardware_type,
-                access_token=self.token_handler.tokens.access_token,
-                verify_ssl=self.token_handler.verify_ssl,
-            )
-            model_benchmark = self.get_benchmark_task(benchmark_task=model_benchmark)
-
-            if wait_until_done:
-                while model_benchmark.status in [
-                    TaskStatus.IN_QUEUE,
-                    TaskStatus.IN_PROGRESS,
-                ]:
-                    model_benchmark = self.get_benchmark_task(benchmark_task=model_benchmark)
-                    time.sleep(1)
-
-            metadata.update_benchmark_info(
-                target_device=model_benchmark.target_device,
-                file_name=model_benchmark.filename,
-                data_type=model_benchmark.data_type,
-                processor=model_benchmark.processor,
-                software_version=model_benchmark.software_version,
-                hardware_type=model_benchmark.hardware_type,
-                input_model_uuid=model_benchmark.input_model_uuid,
-                benchmark_task_uuid=model_benchmark.benchmark_task_uuid,
-                devicefarm_benchmark_task_uuid=model_benchmark.devicefarm_benchmark_task_uuid,
-                devicefarm_model_uuid=model_benchmark.devicefarm_model_uuid,
-            )
-            metadata.update_result(
-                memory_footprint_gpu=model_benchmark.memory_footprint_gpu,
-                memory_footprint_cpu=model_benchmark.memory_footprint_cpu,
-                latency=model_benchmark.latency,
-                ram_size=model_benchmark.ram_size,
-                power_consumption=model_benchmark.power_consumption,
-                file_size=model_benchmark.file_size,
+            current_credit = self.token_handler.get_credit()
+            check_credit_balance(
+                user_credit=current_credit,
+                service_credit=ServiceCredit.MODEL_BENCHMARK,
+                task_count=len(combinations),
             )
-            metadata.update_status(status=Status.COMPLETED)
-            metadatas[-1] = metadata.asdict()
-            MetadataHandler.save_json(data=metadatas, folder_path=folder_path, file_name="benchmark")
 
-            remaining_credit = auth_client.get_credit(
-                self.token_handler.tokens.access_token, self.token_handler.verify_ssl
-            )
-            logger.info(
-                f"{ServiceCredit.MODEL_BENCHMARK} credits have been consumed. Remaining Credit: {remaining_credit}"
-            )
+            metadata_list = []
+            for target_device, target_data_type in combinations:
+                metadata = MetadataHandler.get_default_metadata(TaskType.BENCHMARK)
+                metadata.benchmark_info.target_device = target_device.device_name
+                metadata.benchmark_info.data_type = target_data_type
+                metadata.benchmark_info.software_version = target_device.software_version
+                metadata.benchmark_info.hardware_type = target_device.hardware_type
+                metadata_list.append(metadata)
+            store = MetadataHandler.get_benchmark_store(folder_path)
+            record_ids = store.append_many([metadata.asdict() for metadata in metadata_list])
 
         except Exception as e:
-            logger.error(f"Benchmark failed. Error: {e}")
-            metadata.update_status(status=Status.ERROR)
-            metadatas[-1] = metadata.asdict()
-            MetadataHandler.save_json(data=metadatas, folder_path=folder_path, file_name="benchmark")
+            logger.error(f"Benchmark matrix failed. Error: {e}")
             raise e
 
-        except KeyboardInterrupt:
-            metadata.update_status(status=Status.STOPPED)
-            metadatas[-1] = metadata.asdict()
-            MetadataHandler.save_json(data=metadatas, folder_path=folder_path, file_name="benchmark")
+        # The results finishing together are appended to benchmark.jsonl in a single write.
+        results = BenchmarkResultWriter(store)
+
+        def _save_result(idx: int, metadata: BenchmarkerMetadata) -> None:
+            results.save(record_ids[idx], metadata.asdict())
+
+        logger.info(f"Requesting {len(combinations)} benchmark tasks...")
+        task_indices = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._request_benchmark,
+                    model_uuid=model.model_uuid,
+                    target_device=target_device,
+                    target_data_type=target_data_type,
+                ): idx
+                for idx, (target_device, target_data_type) in enumerate(combinations)
+            }
+            for future in as_completed(futures):
+                idx = futures[future]
+                target_device, target_data_type = combinations[idx]
+                try:
+                    task_indices[future.result().benchmark_task_uuid] = idx
+                except Exception as e:
+                    logger.error(f"Benchmark failed on {target_device.device_name} ({target_data_type}). Error: {e}")
+                    metadata_list[idx].update_status(status=Status.ERROR)
+                    _save_result(idx, metadata_list[idx])
+
+        # Only the benchmark tasks that finished are charged.
+        finished_indices = []
+
+        def _on_status_change(task_uuid, previous_status, status, model_benchmark):
+            if status in [TaskStatus.IN_QUEUE, TaskStatus.IN_PROGRESS]:
+                return
+            idx = task_indices[task_uuid]
+            metadata = metadata_list[idx]
+            if status == TaskStatus.FINISHED:
+                self._update_metadata(metadata, model_benchmark)
+                finished_indices.append(idx)
+            else:
+                metadata.update_status(status=Status.ERROR)
+            _save_result(idx, metadata)
 
-        return metadata.asdict()
+        logger.info(f"Waiting for {len(task_indices)} benchmark tasks...")
+        try:
+            self._create_poller(on_status_change=_on_status_change).wait_all(task_indices)
+        except Exception as e:
+            logger.error(f"Benchmark matrix failed. Error: {e}")
+            for idx in task_indices.values():
+                if metadata_list[idx].status == Status.IN_PROGRESS:
+                    metadata_list[idx].update_status(status=Status.ERROR)
+                    _save_result(idx, metadata_list[idx])
+            # The remaining credit is not requested here, so the error above is the one raised.
+            self.token_handler.consume_credit(ServiceCredit.MODEL_BENCHMARK * len(finished_indices), defer_log=True)
+            raise e
+        finally:
+            results.close()
+
+        if finished_indices:
+            self.token_handler.consume_credit(ServiceCredit.MODEL_BENCHMARK * len(finished_indices))
+
+        return [metadata.asdict() for metadata in metadata_list]
+
+    def get_benchmark_results(
+        self,
+        input_model_path: str,
+        target_device_name: Optional[Union[str, DeviceName]] = None,
+        target_data_type: Optional[Union[str, DataType]] = None,
+        status: Optional[Union[str, Status]] = None,
+    ) -> List[Dict]:
+        """Get the saved benchmark results of a model, filtered by device, data type and status.
+
+        Args:
+            input_model_path (str): The file path where the benchmarked model is located.
+            target_device_name (Union[str, DeviceName], optional): Target device name.
+            target_data_type (Union[str, DataType], optional): Data type of the model.
+            status (Union[str, Status], optional): The status of the benchmarks.
+
+        Returns:
+            List[Dict]: The matching benchmark results, in the order they were requested.
+        """
+
+        store = MetadataHandler.get_benchmark_store(Path(input_model_path).parent)
+        return list(store.query(target_device=target_device_name, data_type=target_data_type, status=status))
 
     def get_benchmark_task(self, benchmark_task: Union[str, BenchmarkTask]) -> BenchmarkTask:
         """Get information about the specified benchmark task using either the benchmark task object or its UUID.
@@ -220,3 +453,4 @@ class Benchmarker:
 
         except Exception as e:
             logger.error(f"Get benchmark failed. Error: {e}")
+            raise e
@@ -1,26 +1,33 @@
 import json
-from datetime import datetime
+import threading
+import time
+from typing import Optional
 
 import jwt
-import pytz
-import requests
 from loguru import logger
 
 from netspresso.clients.auth.schemas import LoginRequest, LoginResponse, Tokens, UserInfo
 from netspresso.clients.config import Config, Module
 from netspresso.clients.utils import get_headers
+from netspresso.clients.utils.transport import HTTPTransport, transport
+
+USER_INFO_TTL = 30.0
+TOKEN_REFRESH_MARGIN = 60.0
+MIN_TOKEN_REFRESH_DELAY = 30.0
+MAX_TOKEN_REFRESH_BACKOFF = 600.0
 
 
 class AuthClient:
-    def __init__(self, config: Config = Module.GENERAL):
+    def __init__(self, config: Config = Module.GENERAL, transport: HTTPTransport = transport):
         """Initialize the UserSession.
 
         Args:
-            email (str): The email address for a user account.
-            password (str): The password for a user account.
+            config (Config): The module whose endpoint configuration is used.
+            transport (HTTPTransport): The pooled HTTP transport used to send the requests.
         """
 
         self.config = Config(config)
+        self.transport = transport
         self.host = self.config.HOST
         self.port = self.config.PORT
         self.uri_prefix = self.config.URI_PREFIX
@@ -30,7 +37,7 @@ class AuthClient:
         try:
             url = f"{self.base_url}/auth/local/login"
             data = LoginRequest(username=email, password=password)
-            response = requests.post(url, json=data.dict(), headers=get_headers(), verify=verify_ssl)
+            response = self.transport.post(url, json=data.dict(), headers=get_headers(), verify=verify_ssl)
             response_body = json.loads(response.text)
 
             if response.status_code == 200 or response.status_code == 201:
@@ -47,7 +54,7 @@ class AuthClient:
     def get_user_info(self, access_token, verify_ssl: bool = True) -> UserInfo:
         try:
             url = f"{self.base_url}/user"
-            response = requests.get(url, headers=get_headers(access_token=access_token), verify=verify_ssl)
+            response = self.transport.get(url, headers=get_headers(access_token=access_token), verify=verify_ssl)
             response_body = json.loads(response.text)
 
             if response.status_code == 200 or response.status_code == 201:
@@ -70,7 +77,9 @@ class AuthClient:
         try:
             url = f"{self.base_url}/auth/token"
             data = Tokens(access_token=access_token, refresh_token=refresh_token)
-            response = requests.post(url, data=data.json(), headers=get_headers(json_type=True), verify=verify_ssl)
+            response = self.transport.post(
+                url, data=data.json(), headers=get_headers(json_type=True), verify=verify_ssl
+            )
             response_body = json.loads(response.text)
 
             if response.status_code == 200 or response.status_code == 201:
@@ -85,18 +94,167 @@ class AuthClient:
 
 
 class TokenHandler:
-    def __init__(self, email, password, verify_ssl: bool = True) -> None:
-        self.tokens = auth_client.login(email=email, password=password, verify_ssl=verify_ssl)
+    def __init__(
+        self,
+        email,
+        password,
+        verify_ssl: bool = True,
+        user_info_ttl: float = USER_INFO_TTL,
+        defer_credit_log: bool = False,
+        refresh_margin: float = TOKEN_REFRESH_MARGIN,
+        auto_refresh: bool = True,
+    ) -> None:
+        """Log in and keep the tokens of the user valid.
+
+        The handler is safe to share between threads. Concurrent refreshes are merged into a single request.
+
+        Args:
+            email (str): User's email for authentication.
+            password (str): User's password for authentication.
+            verify_ssl (bool): Flag to indicate whether SSL certificates should be verified.
+            user_info_ttl (float): Seconds for which the user information and credit are reused without a request.
+            defer_credit_log (bool): If True, consumed credits are accumulated and the remaining credit is only
+                looked up and logged when `log_remaining_credit` is called.
+            refresh_margin (float): Seconds before the expiry of the access token at which it is refreshed.
+            auto_refresh (bool): If True, refresh the access token ahead of its expiry on a background timer.
+        """
         self.email = email
         self.password = password
         self.verify_ssl = verify_ssl
+        self.refresh_margin = refresh_margin
+        self.auto_refresh = auto_refresh
+        self._token_lock = threading.Lock()
+        self._refresh_timer: Optional[threading.Timer] = None
+        self._refresh_failures = 0
+        self._closed = False
+        self.tokens = auth_client.login(email=email, password=password, verify_ssl=verify_ssl)
+        self.user_info_ttl = user_info_ttl
+        self.defer_credit_log = defer_credit_log
+        self._user_info: Optional[UserInfo] = None
+        self._user_info_expires_at = 0.0
+        self._consumed_credit = 0
+        self._user_info_lock = threading.Lock()
+
+    def get_user_info(self, force: bool = False) -> UserInfo:
+        """Get the user information, reusing the last response while it is younger than `user_info_ttl`.
+
+        Args:
+            force (bool): If True, always request the user information.
+
+        Returns:
+            UserInfo: User information.
+        """
+        with self._user_info_lock:
+            if not force and self._user_info is not None and time.monotonic() < self._user_info_expires_at:
+                return self._user_info
+
+        self.validate_token()
+        user_info = auth_client.get_user_info(self.tokens.access_token, self.verify_ssl)
+
+        with self._user_info_lock:
+            self._user_info = user_info
+            self._user_info_expires_at = time.monotonic() + self.user_info_ttl
+
+        return user_info
+
+    def get_credit(self, force: bool = False) -> int:
+        return self.get_user_info(force=force).total
+
+    def invalidate_user_info(self) -> None:
+        with self._user_info_lock:
+            self._user_info = None
+            self._user_info_expires_at = 0.0
+
+    def consume_credit(self, credit: int, defer_log: Optional[bool] = None) -> None:
+        """Record credits consumed by a finished task. The cached credit is invalidated.
+
+        Args:
+            credit (int): The consumed credits.
+            defer_log (bool, optional): Whether to defer the remaining credit log. Defaults to `defer_credit_log`.
+        """
+        with self._user_info_lock:
+            self._user_info = None
+            self._consumed_credit += int(credit)
+
+        if defer_log is None:
+            defer_log = self.defer_credit_log
+        if not defer_log:
+            self.log_remaining_credit()
+
+    def log_remaining_credit(self) -> Optional[int]:
+        """Log the credits consumed since the last call together with the remaining credit.
+
+        Returns:
+            Optional[int]: The remaining credit, or None if no credit was consumed.
+        """
+        with self._user_info_lock:
+            consumed_credit = self._consumed_credit
+            self._consumed_credit = 0
+
+        if not consumed_credit:
+            return None
+
+        remaining_credit = self.get_credit()
+        logger.info(f"{consumed_credit} credits have been consumed. Remaining Credit: {remaining_credit}")
+
+        return remaining_credit
+
+    @property
+    def tokens(self) -> Tokens:
+        return self._tokens
+
+    @tokens.setter
+    def tokens(self, tokens: Tokens) -> None:
+        # Decode the expiry once per token instead of on every request.
+        payload = jwt.decode(tokens.access_token, options={"verify_signature": False})
+        reissued_same_token = getattr(self, "_tokens", None) is not None and self._tokens == tokens
+        self._tokens = tokens
+        self._expires_at = float(payload["exp"])
+        # Short-lived tokens are refreshed halfway through their lifetime instead of in a loop.
+        now = time.time()
+        self._refresh_at = self._expires_at - min(self.refresh_margin, max(self._expires_at - now, 0.0) / 2)
+        if reissued_same_token:
+            # The server returned the token that is already held, refreshing again right away would loop.
+            self._refresh_at = max(self._refresh_at, now + MIN_TOKEN_REFRESH_DELAY)
+        self._refresh_failures = 0
+        # The background refresh never runs in a loop. A token expiring sooner is refreshed on the next request.
+        self._schedule_refresh(max(self._refresh_at - now, MIN_TOKEN_REFRESH_DELAY))
+
+    def _schedule_refresh(self, delay: float) -> None:
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+        if not self.auto_refresh or self._closed:
+            return
+
+        self._refresh_timer = threading.Timer(delay, self._refresh_in_background)
+        self._refresh_timer.daemon = True
+        self._refresh_timer.start()
+
+    def _refresh_in_background(self) -> None:
+        try:
+            self.validate_token()
+        except Exception as e:
+            # Retry with an exponential backoff. The token is also refreshed on the next request.
+            self._refresh_failures += 1
+            delay = min(MIN_TOKEN_REFRESH_DELAY * 2**self._refresh_failures, MAX_TOKEN_REFRESH_BACKOFF)
+            logger.warning(f"Background token refresh failed. Retry in {delay:.0f} seconds. Error: {e}")
+            self._schedule_refresh(delay)
+
+    def _needs_refresh(self) -> bool:
+        return time.time() >= self._refresh_at
 
     def check_jwt_exp(self):
-        payload = jwt.decode(self.tokens.access_token, options={"verify_signature": False})
-        return datetime.now(pytz.utc).timestamp() <= payload["exp"]
+        return time.time() <= self._expires_at
 
     def validate_token(self):
-        if not self.check_jwt_exp():
+        if not self._needs_refresh():
+            return
+
+        with self._token_lock:
+            # Another thread may have refreshed the token while this one waited for the lock.
+            if not self._needs_refresh():
+                return
             try:
                 self.tokens = auth_client.reissue_token(
                     self.tokens.access_token, self.tokens.refresh_token, self.verify_ssl
@@ -105,5 +263,12 @@ class TokenHandler:
                 self.tokens = auth_client.login(email=self.email, password=self.password, verify_ssl=self.verify_ssl)
                 logger.info("The refresh token has expired. the token has been reissued.")
 
+    def close(self) -> None:
+        """Stop the background token refresh."""
+        self._closed = True
+        if self._refresh_timer is not None:
+            self._refresh_timer.cancel()
+            self._refresh_timer = None
+
 
 auth_client = AuthClient()
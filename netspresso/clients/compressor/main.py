@@ -1,6 +1,7 @@
 import json
+from typing import Optional
 
-import requests
+from loguru import logger
 
 from netspresso.clients.compressor.schemas.compression import (
     CompressionResponse,
@@ -9,33 +10,63 @@ from netspresso.clients.compressor.schemas.compression import (
 )
 from netspresso.clients.compressor.schemas.model import GetDownloadLinkResponse, ModelResponse, UploadModelRequest
 from netspresso.clients.config import Config, Module
-from netspresso.clients.utils.common import get_files, get_headers
+from netspresso.clients.utils.cache import UploadCache, upload_cache
+from netspresso.clients.utils.common import get_headers, get_multipart
+from netspresso.clients.utils.multipart import ProgressCallback
+from netspresso.clients.utils.transport import HTTPTransport, transport
 
 
 class CompressorAPIClient:
-    def __init__(self):
+    def __init__(self, transport: HTTPTransport = transport, upload_cache: UploadCache = upload_cache):
         self.config = Config(Module.COMPRESSOR)
+        self.transport = transport
+        self.upload_cache = upload_cache
         self.host = self.config.HOST
         self.port = self.config.PORT
         self.prefix = self.config.URI_PREFIX
         self.url = f"{self.host}:{self.port}{self.prefix}"
 
-    def upload_model(self, data: UploadModelRequest, access_token, verify_ssl: bool = True) -> ModelResponse:
+    def upload_model(
+        self,
+        data: UploadModelRequest,
+        access_token,
+        verify_ssl: bool = True,
+        use_cache: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> ModelResponse:
+        # Hashing the model file costs a full read, so the key is only computed when the cache is used.
+        cache_key = None
+        if use_cache and self.upload_cache.enabled:
+            cache_key = self.upload_cache.make_key(
+                file_path=data.file_path,
+                namespace="compressor",
+                url=self.url,
+                access_token=access_token,
+                # The name and description are part of the uploaded model, so a renamed upload is not reused.
+                extra=data.dict(exclude={"file_path"}),
+            )
+            cached_body = self.upload_cache.get(cache_key)
+            if cached_body is not None:
+                logger.info(f"Reuse the uploaded model. Model ID: {cached_body.get('model_id')}")
+                return ModelResponse(**cached_body)
+
         url = f"{self.url}/models"
-        files = get_files(data.file_path)
-        response = requests.post(
-            url, data=data.dict(), files=files, headers=get_headers(access_token), verify=verify_ssl
-        )
+        with get_multipart(data.file_path, fields=data.dict(), callback=progress_callback) as body:
+            response = self.transport.post(
+                url, data=body, headers=get_headers(access_token, content_type=body.content_type), verify=verify_ssl
+            )
         response_body = json.loads(response.text)
 
         if response.status_code == 200:
+            if cache_key is not None:
+                self.upload_cache.set(cache_key, response_body)
             return ModelResponse(**response_body)
         else:
             raise Exception(response_body["detail"])
 
     def get_parent_models(self, is_simple, access_token, verify_ssl: bool = True):
         url = f"{self.url}/models/parents?is_simple={is_simple}"
-        response = requests.get(url, headers=get_headers(access_token), verify=verify_ssl)
+        response = self.transport.get(url, headers=get_headers(access_token), verify=verify_ssl)
         response_body = json.loads(response.text)
 
         if response.status_code == 200:
@@ -45,7 +76,7 @@ class CompressorAPIClient:
 
     def get_children_models(self, model_id, access_token, verify_ssl: bool = True):
         url = f"{self.url}/models/{model_id}/children"
-        response = requests.get(url, headers=get_headers(access_token), verify=verify_ssl)
+        response = self.transport.get(url, headers=get_headers(access_token), verify=verify_ssl)
         response_body = json.loads(response.text)
 
         if response.status_code == 200:
@@ -55,7 +86,7 @@ class CompressorAPIClient:
 
     def get_model_info(self, model_id, access_token, verify_ssl: bool = True) -> ModelResponse:
         url = f"{self.url}/models/{model_id}"
-        response = requests.get(url, headers=get_headers(access_token), verify=verify_ssl)
+        response = self.transport.get(url, headers=get_headers(access_token), verify=verify_ssl)
         response_body = json.loads(response.text)
 
         if response.status_code == 200:
@@ -65,7 +96,7 @@ class CompressorAPIClient:
 
     def get_download_model_link(self, model_id, access_token, verify_ssl: bool = True) -> GetDownloadLinkResponse:
         url = f"{self.url}/models/{model_id}/download"
-        response = requests.post(url, headers=get_headers(access_token), verify=verify_ssl)
+        response = self.transport.post(url, headers=get_headers(access_token), verify=verify_ssl)
         response_body = json.loads(response.text)
 
         if response.status_code == 200:
@@ -75,17 +106,20 @@ class CompressorAPIClient:
 
     def delete_model(self, model_id, access_token, verify_ssl: bool = True):
         url = f"{self.url}/models/{model_id}"
-        response = requests.delete(url, headers=get_headers(access_token), verify=verify_ssl)
+        response = self.transport.delete(url, headers=get_headers(access_token), verify=verify_ssl)
         response_body = json.loads(response.text)
 
         if response.status_code == 200:
+            self.upload_cache.invalidate(
+                lambda body: model_id in (body.get("model_id"), body.get("original_model_id"))
+            )
             return response_body
         else:
             raise Exception(response_body["detail"])
 
     def get_available_layers(self, data, access_token, verify_ssl: bool = True) -> GetAvailableLayersReponse:
         url = f"{self.url}/models/{data.model_id}/get_available_layers"
-        response = requests.post(
+        response = self.transport.post(
             url, data=data.json(), headers=get_headers(access_token, json_type=True), verify=verify_ssl
         )
         response_body = json.loads(response.text)
@@ -97,7 +131,7 @@ class CompressorAPIClient:
 
     def create_compression(self, data, access_token, verify_ssl: bool = True) -> CompressionResponse:
         url = f"{self.url}/compressions"
-        response = requests.post(
+        response = self.transport.post(
             url, data=data.json(), headers=get_headers(access_token, json_type=True), verify=verify_ssl
         )
         response_body = json.loads(response.text)
@@ -109,7 +143,7 @@ class CompressorAPIClient:
 
     def get_recommendation(self, data, access_token, verify_ssl: bool = True) -> RecommendationResponse:
         url = f"{self.url}/models/{data.model_id}/recommendation"
-        response = requests.post(
+        response = self.transport.post(
             url, data=data.json(), headers=get_headers(access_token, json_type=True), verify=verify_ssl
         )
         response_body = json.loads(response.text)
@@ -122,8 +156,14 @@ class CompressorAPIClient:
 
     def compress_model(self, data, access_token, verify_ssl: bool = True):
         url = f"{self.url}/compressions/{data.compression_id}"
-        response = requests.put(
-            url, data=data.json(), headers=get_headers(access_token, json_type=True), verify=verify_ssl
+        # The compression runs within the request and consumes credit, so it is neither timed out nor sent again.
+        response = self.transport.put(
+            url,
+            data=data.json(),
+            headers=get_headers(access_token, json_type=True),
+            verify=verify_ssl,
+            idempotent=False,
+            timeout=(self.transport.policy.connect_timeout, None),
         )
         response_body = json.loads(response.text)
 
@@ -134,8 +174,14 @@ class CompressorAPIClient:
 
     def auto_compression(self, data, access_token, verify_ssl: bool = True):
         url = f"{self.url}/models/{data.model_id}/auto_compress"
-        response = requests.post(
-            url, data=data.json(), headers=get_headers(access_token, json_type=True), verify=verify_ssl
+        # The compression runs within the request and consumes credit, so it is neither timed out nor sent again.
+        response = self.transport.post(
+            url,
+            data=data.json(),
+            headers=get_headers(access_token, json_type=True),
+            verify=verify_ssl,
+            idempotent=False,
+            timeout=(self.transport.policy.connect_timeout, None),
         )
         response_body = json.loads(response.text)
 
@@ -148,7 +194,7 @@ class CompressorAPIClient:
     def get_compression_info(self, compression_id, access_token, verify_ssl: bool = True):
         url = f"{self.url}/compressions/{compression_id}"
 
-        response = requests.get(url, headers=get_headers(access_token), verify=verify_ssl)
+        response = self.transport.get(url, headers=get_headers(access_token), verify=verify_ssl)
         response_body = json.loads(response.text)
 
         if response.status_code == 200:
@@ -156,10 +202,14 @@ class CompressorAPIClient:
         else:
             raise Exception(response_body["detail"])
 
-    def upload_dataset(self, data, access_token, verify_ssl: bool = True):
+    def upload_dataset(
+        self, data, access_token, verify_ssl: bool = True, progress_callback: Optional[ProgressCallback] = None
+    ):
         url = f"{self.url}/models/{data.model_id}/datasets"
-        files = get_files(data.file_path)
-        response = requests.post(url, files=files, headers=get_headers(access_token), verify=verify_ssl)
+        with get_multipart(data.file_path, callback=progress_callback) as body:
+            response = self.transport.post(
+                url, data=body, headers=get_headers(access_token, content_type=body.content_type), verify=verify_ssl
+            )
         response_body = json.loads(response.text)
 
         if response.status_code == 200:
@@ -1,6 +1,7 @@
 import json
+from typing import Optional
 
-import requests
+from loguru import logger
 
 from netspresso.clients.config import Config, Module
 from netspresso.clients.launcher.schemas.model import (
@@ -11,25 +12,56 @@ from netspresso.clients.launcher.schemas.model import (
     ModelBenchmarkRequest,
     ModelConversionRequest,
 )
-from netspresso.clients.utils.common import get_files, get_headers
+from netspresso.clients.utils.cache import UploadCache, upload_cache
+from netspresso.clients.utils.common import get_headers, get_multipart
+from netspresso.clients.utils.multipart import ProgressCallback
+from netspresso.clients.utils.transport import HTTPTransport, transport
 from netspresso.enums.device import DeviceName
 from netspresso.enums.model import DataType, Framework
 
 
 class LauncherAPIClient:
-    def __init__(self):
+    def __init__(self, transport: HTTPTransport = transport, upload_cache: UploadCache = upload_cache):
         self.config = Config(Module.LAUNCHER)
+        self.transport = transport
+        self.upload_cache = upload_cache
         self.host = self.config.HOST
         self.port = self.config.PORT
         self.prefix = self.config.URI_PREFIX
         self.url = f"{self.host}:{self.port}{self.prefix}"
 
-    def upload_model(self, model_file_path: str, target_function: str, access_token, verify_ssl: bool = True) -> Model:
+    def upload_model(
+        self,
+        model_file_path: str,
+        target_function: str,
+        access_token,
+        verify_ssl: bool = True,
+        use_cache: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Model:
+        # Hashing the model file costs a full read, so the key is only computed when the cache is used.
+        cache_key = None
+        if use_cache and self.upload_cache.enabled:
+            cache_key = self.upload_cache.make_key(
+                file_path=model_file_path,
+                namespace=f"launcher/{target_function.value}",
+                url=self.url,
+                access_token=access_token,
+            )
+            cached_body = self.upload_cache.get(cache_key)
+            if cached_body is not None:
+                logger.info(f"Reuse the uploaded model. Model UUID: {cached_body.get('model_uuid')}")
+                return Model(**cached_body)
+
         url = f"{self.url}/{target_function.value.lower()}/upload_model"
-        files = get_files(model_file_path)
-        response = requests.post(url, files=files, headers=get_headers(access_token), verify=verify_ssl)
+        with get_multipart(model_file_path, callback=progress_callback) as body:
+            response = self.transport.post(
+                url, data=body, headers=get_headers(access_token, content_type=body.content_type), verify=verify_ssl
+            )
         response_body = json.loads(response.text)
         if response.status_code < 300:
+            if cache_key is not None:
+                self.upload_cache.set(cache_key, response_body)
             return Model(**response_body)
         else:
             raise Exception(response_body["detail"])
@@ -77,17 +109,21 @@ class LauncherAPIClient:
         if software_version is not None:
             request_data.software_version = software_version
 
-        files = None
         if dataset_path:
-            files = get_files(dataset_path)
-
-        response = requests.post(
-            url,
-            data=request_data.dict(),
-            files=files,
-            headers=get_headers(access_token),
-            verify=verify_ssl,
-        )
+            with get_multipart(dataset_path, fields=request_data.dict()) as body:
+                response = self.transport.post(
+                    url,
+                    data=body,
+                    headers=get_headers(access_token, content_type=body.content_type),
+                    verify=verify_ssl,
+                )
+        else:
+            response = self.transport.post(
+                url,
+                data=request_data.dict(),
+                headers=get_headers(access_token),
+                verify=verify_ssl,
+            )
         response_body = json.loads(response.text)
         if response.status_code < 300:
             return ConversionTask(**response_body)
@@ -108,7 +144,7 @@ class LauncherAPIClient:
         """
 
         url = f"{self.url}/convert/{conversion_task_uuid}"
-        response = requests.get(url, headers=get_headers(access_token), verify=verify_ssl)
+        response = self.transport.get(url, headers=get_headers(access_token), verify=verify_ssl)
         response_body = json.loads(response.text)
         if response.status_code < 300:
             return ConversionTask(**response_body)
@@ -128,7 +164,7 @@ class LauncherAPIClient:
             ConversionTask: model conversion task object.
         """
         url = f"{self.url}/convert/{conversion_task_uuid}/download"
-        response = requests.get(url, headers=get_headers(access_token), verify=verify_ssl)
+        response = self.transport.get(url, headers=get_headers(access_token), verify=verify_ssl)
         response_body = json.loads(response.text)
         if response.status_code < 300:
             return response_body
@@ -169,7 +205,7 @@ class LauncherAPIClient:
             software_version=software_version,
             hardware_type=hardware_type,
         )
-        response = requests.post(
+        response = self.transport.post(
             url,
             json=request_data.dict(),
             headers=get_headers(access_token),
@@ -194,7 +230,7 @@ class LauncherAPIClient:
             BenchmarkTask: model benchmark task object.
         """
         url = f"{self.url}/benchmark/{benchmark_task_uuid}"
-        response = requests.get(url, headers=get_headers(access_token), verify=verify_ssl)
+        response = self.transport.get(url, headers=get_headers(access_token), verify=verify_ssl)
         response_body = json.loads(response.text)
         if response.status_code < 300:
             return BenchmarkTask(**response_body)
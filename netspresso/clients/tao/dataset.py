@@ -1,6 +1,4 @@
-from pathlib import Path
-
-from netspresso.clients.utils.common import read_file_bytes
+from netspresso.clients.utils.common import get_multipart
 from netspresso.clients.utils.requester import Requester
 
 
@@ -120,11 +118,12 @@ class DatasetAPI:
 
         return response.json()
 
-    def upload_dataset(self, user_id, dataset_id, dataset_path, headers):
+    def upload_dataset(self, user_id, dataset_id, dataset_path, headers, progress_callback=None):
         endpoint = f"{self.url}/users/{user_id}/datasets/{dataset_id}:upload"
-        file_content = read_file_bytes(file_path=dataset_path)
-        file_obj = [("file", (Path(dataset_path).name, file_content))]
 
-        response = Requester.post_as_form(url=endpoint, binary=file_obj, headers=headers)
+        with get_multipart(dataset_path, callback=progress_callback) as body:
+            response = Requester.post_as_form(
+                url=endpoint, request_body=body, headers={**headers, "Content-Type": body.content_type}
+            )
 
         return response.json()
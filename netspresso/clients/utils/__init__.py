@@ -1,8 +1,22 @@
-from .common import get_files, get_headers
-from .system import ENV_STR
+from .cache import UploadCache, upload_cache
+from .common import get_file_sha256, get_headers, get_multipart
+from .multipart import MultipartEncoder
+from .policy import CircuitBreaker, CircuitOpenError, RequestPolicy
+from .system import get_env_string
+from .transport import HTTPTransport, TransportStats, transport
 
 __all__ = [
-    "get_files",
+    "get_multipart",
     "get_headers",
-    "ENV_STR",
+    "get_file_sha256",
+    "get_env_string",
+    "MultipartEncoder",
+    "HTTPTransport",
+    "TransportStats",
+    "RequestPolicy",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "transport",
+    "UploadCache",
+    "upload_cache",
 ]
@@ -0,0 +1,156 @@
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import jwt
+from loguru import logger
+
+from netspresso.clients.utils.common import get_file_sha256
+
+DEFAULT_CACHE_DIR = Path.home() / ".netspresso" / "cache" / "uploads"
+DEFAULT_TTL = 24 * 60 * 60
+DEFAULT_MAX_ENTRIES = 1000
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def get_user_identity(access_token: str) -> str:
+    """Return a stable identity of the token owner, so that cached uploads are never shared between accounts."""
+    try:
+        payload = jwt.decode(access_token, options={"verify_signature": False})
+        identity = payload.get("sub") or payload.get("user_id") or payload.get("email")
+        if identity:
+            return str(identity)
+    except Exception:
+        pass
+    return hashlib.sha256(str(access_token).encode()).hexdigest()
+
+
+class UploadCache:
+    """On-disk cache of upload responses keyed by the SHA-256 of the uploaded file.
+
+    Args:
+        cache_dir (str, optional): The folder where the cache entries are stored.
+        ttl (float): Seconds after which an entry is considered stale.
+        max_entries (int): The maximum number of entries kept. The least recently used entries are evicted first.
+        max_bytes (int): The maximum total size of the entries kept.
+        enabled (bool): If False, every lookup misses and nothing is stored.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = None,
+        ttl: float = DEFAULT_TTL,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        enabled: bool = True,
+    ) -> None:
+        self.cache_dir = Path(cache_dir or os.getenv("NETSPRESSO_CACHE_DIR", DEFAULT_CACHE_DIR))
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.enabled = enabled and os.getenv("NETSPRESSO_UPLOAD_CACHE", "1") != "0"
+        self._lock = threading.Lock()
+
+    def make_key(
+        self, file_path: str, namespace: str, url: str, access_token: str, extra: Optional[Dict[str, Any]] = None
+    ) -> str:
+        """Build the cache key of an upload.
+
+        Args:
+            file_path (str): The path of the uploaded file.
+            namespace (str): The target of the upload. ex) launcher/CONVERT
+            url (str): The base url of the API server.
+            access_token (str): The access token of the user.
+            extra (Dict[str, Any], optional): Other request fields that change the upload result.
+
+        Returns:
+            str: The cache key.
+        """
+        key_source = {
+            "sha256": get_file_sha256(file_path),
+            "namespace": namespace,
+            "url": url,
+            "user": get_user_identity(access_token),
+            "extra": extra or {},
+        }
+        return hashlib.sha256(json.dumps(key_source, sort_keys=True, default=str).encode()).hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        if not self.enabled:
+            return None
+
+        entry_path = self._entry_path(key)
+        try:
+            with open(entry_path, "r") as entry_file:
+                entry = json.load(entry_file)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get("created_at", 0) > self.ttl:
+            entry_path.unlink(missing_ok=True)
+            return None
+
+        os.utime(entry_path)  # mark as recently used for the eviction
+        return entry["value"]
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        if not self.enabled:
+            return
+
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("w", dir=self.cache_dir, suffix=".tmp", delete=False) as tmp_file:
+                json.dump({"created_at": time.time(), "value": value}, tmp_file)
+            os.replace(tmp_file.name, self._entry_path(key))
+            self.evict()
+        except OSError as e:
+            logger.warning(f"Failed to write the upload cache. Error: {e}")
+
+    def invalidate(self, predicate: Optional[Callable[[Dict[str, Any]], bool]] = None) -> None:
+        """Remove the entries whose value matches the predicate, or every entry if the predicate is None.
+
+        Args:
+            predicate (Callable[[Dict[str, Any]], bool], optional): Returns True for the values to remove.
+        """
+        for entry_path in self.cache_dir.glob("*.json"):
+            try:
+                if predicate is not None:
+                    with open(entry_path, "r") as entry_file:
+                        if not predicate(json.load(entry_file)["value"]):
+                            continue
+                entry_path.unlink(missing_ok=True)
+            except (OSError, ValueError, KeyError):
+                continue
+
+    def evict(self) -> None:
+        """Remove stale entries and then the least recently used ones until the size bounds are met."""
+        with self._lock:
+            now = time.time()
+            entries = []
+            for entry_path in self.cache_dir.glob("*.json"):
+                try:
+                    stat = entry_path.stat()
+                except OSError:
+                    continue
+                if now - stat.st_mtime > self.ttl:
+                    entry_path.unlink(missing_ok=True)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry_path))
+
+            entries.sort()
+            total_bytes = sum(size for _, size, _ in entries)
+            while entries and (len(entries) > self.max_entries or total_bytes > self.max_bytes):
+                _, size, entry_path = entries.pop(0)
+                entry_path.unlink(missing_ok=True)
+                total_bytes -= size
+
+
+upload_cache = UploadCache()
@@ -1,16 +1,23 @@
+import hashlib
+import os
+from functools import lru_cache
 from pathlib import Path
+from typing import Any, Dict, Optional
 
-from netspresso.clients.utils.system import ENV_STR
+from netspresso.clients.utils.multipart import FileSource, MultipartEncoder, ProgressCallback
+from netspresso.clients.utils.system import get_env_string
 
 version = (Path(__file__).parent.parent.parent / "VERSION").read_text().strip()
 
 
-def get_headers(access_token=None, json_type=False):
-    headers = {"User-Agent": f"NetsPresso Python Package v{version} ({ENV_STR})"}
+def get_headers(access_token=None, json_type=False, content_type=None):
+    headers = {"User-Agent": f"NetsPresso Python Package v{version} ({get_env_string()})"}
     if access_token:
         headers["Authorization"] = f"Bearer {access_token}"
     if json_type:
         headers["Content-Type"] = "application/json"
+    elif content_type:
+        headers["Content-Type"] = content_type
     return headers
 
 
@@ -18,16 +25,29 @@ def create_tao_headers(token):
     return {"Authorization": f"Bearer {token}"}
 
 
-def read_file_bytes(file_path: str) -> bytes:
+def get_multipart(
+    file_path: FileSource,
+    fields: Optional[Dict[str, Any]] = None,
+    field_name: str = "file",
+    callback: Optional[ProgressCallback] = None,
+) -> MultipartEncoder:
+    """Return a streaming multipart body for the file. Use it as a context manager to close the file.
+
+    The file can be a path, or a (file name, binary file object) pair.
+    """
+    return MultipartEncoder(fields=fields, files=[(field_name, file_path)], callback=callback)
+
+
+@lru_cache(maxsize=128)
+def _get_file_sha256(file_path: str, size: int, mtime_ns: int, chunk_size: int) -> str:
+    sha256 = hashlib.sha256()
     with open(file_path, "rb") as f:
-        file_byte = f.read()
-    return file_byte
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
 
 
-def get_files(file_path):
-    return [
-        (
-            "file",
-            (Path(file_path).name, open(file_path, "rb"), "application/octet-stream"),
-        )
-    ]
+def get_file_sha256(file_path: str, chunk_size: int = 1024 * 1024) -> str:
+    """Return the SHA-256 hex digest of the file. The digest is memoized until the file is modified."""
+    stat = os.stat(file_path)
+    return _get_file_sha256(str(Path(file_path).resolve()), stat.st_size, stat.st_mtime_ns, chunk_size)
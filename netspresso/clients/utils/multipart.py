@@ -0,0 +1,169 @@
+import os
+import uuid
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Dict, Iterator, List, Optional, Tuple, Union
+
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+ProgressCallback = Callable[[int, int], None]
+FileSource = Union[str, Path, Tuple[str, BinaryIO]]
+
+
+def _encode_fields(fields: Optional[Dict[str, Any]]) -> List[Tuple[str, bytes]]:
+    # Same rules as requests' multipart encoding: None is skipped and iterables become repeated fields.
+    encoded = []
+    for name, value in (fields or {}).items():
+        values = [value] if isinstance(value, (str, bytes)) or not hasattr(value, "__iter__") else value
+        for v in values:
+            if v is None:
+                continue
+            encoded.append((name, v if isinstance(v, bytes) else str(v).encode("utf-8")))
+    return encoded
+
+
+class MultipartEncoder:
+    """Stream a multipart/form-data body in fixed-size chunks.
+
+    Files are opened one at a time while the body is read and closed as soon as they are sent,
+    so the memory usage does not depend on the file sizes. The Content-Length is computed from
+    the file sizes upfront. A file can also be given as a (file name, binary file object) pair,
+    like an in-memory archive. File objects are read from the start and are not closed.
+
+    Args:
+        fields (Dict[str, Any], optional): The form fields.
+        files (List[Tuple[str, FileSource]], optional): The (field name, file path) pairs to upload.
+            A (file name, file object) pair can be given instead of the file path.
+        chunk_size (int): The maximum number of bytes read from a file at a time.
+        callback (Callable[[int, int], None], optional): Called with (bytes sent, total bytes) after every chunk.
+        boundary (str, optional): The multipart boundary. A random one is used if not given.
+    """
+
+    def __init__(
+        self,
+        fields: Optional[Dict[str, Any]] = None,
+        files: Optional[List[Tuple[str, FileSource]]] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        callback: Optional[ProgressCallback] = None,
+        boundary: Optional[str] = None,
+    ) -> None:
+        self.boundary = boundary or uuid.uuid4().hex
+        self.chunk_size = chunk_size
+        self.callback = callback
+        self.bytes_read = 0
+
+        self._parts = []
+        for name, value in _encode_fields(fields):
+            header = f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"\r\n\r\n'
+            self._parts.append(header.encode("utf-8") + value + b"\r\n")
+        for name, file in files or []:
+            if isinstance(file, tuple):
+                file_name, file = file
+            else:
+                file_name, file = Path(file).name, Path(file)
+            header = (
+                f'--{self.boundary}\r\nContent-Disposition: form-data; name="{name}"; '
+                f'filename="{file_name}"\r\nContent-Type: application/octet-stream\r\n\r\n'
+            )
+            self._parts.extend([header.encode("utf-8"), file, b"\r\n"])
+        self._parts.append(f"--{self.boundary}--\r\n".encode("utf-8"))
+
+        self.len = sum(self._get_part_size(part) for part in self._parts)
+        self._part_index = 0
+        self._offset = 0
+        self._file: Optional[BinaryIO] = None
+        self._owns_file = False
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self.len
+
+    def __iter__(self) -> Iterator[bytes]:
+        while True:
+            chunk = self.read(self.chunk_size)
+            if not chunk:
+                break
+            yield chunk
+
+    def __enter__(self) -> "MultipartEncoder":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    @staticmethod
+    def _get_part_size(part: Union[bytes, Path, BinaryIO]) -> int:
+        if isinstance(part, bytes):
+            return len(part)
+        if isinstance(part, Path):
+            return os.path.getsize(part)
+        size = part.seek(0, os.SEEK_END)
+        part.seek(0)
+        return size
+
+    def _close_file(self) -> None:
+        # Only the files opened from a path are closed, file objects belong to the caller.
+        if self._file is not None and self._owns_file:
+            self._file.close()
+        self._file = None
+
+    def _read_part(self, size: int) -> bytes:
+        part = self._parts[self._part_index]
+        if isinstance(part, bytes):
+            chunk = part[self._offset : self._offset + size]
+            self._offset += len(chunk)
+            finished = self._offset >= len(part)
+        else:
+            if self._file is None:
+                self._owns_file = isinstance(part, Path)
+                self._file = open(part, "rb") if self._owns_file else part
+                if not self._owns_file:
+                    self._file.seek(0)
+            chunk = self._file.read(min(size, self.chunk_size))
+            finished = not chunk or len(chunk) < min(size, self.chunk_size)
+            if finished:
+                self._close_file()
+
+        if finished:
+            self._part_index += 1
+            self._offset = 0
+        return chunk
+
+    def read(self, size: int = -1) -> bytes:
+        """Read the next bytes of the body.
+
+        Args:
+            size (int): The maximum number of bytes to read. Reads up to `chunk_size` bytes if negative.
+
+        Returns:
+            bytes: The next bytes of the body. Empty once the whole body is read.
+        """
+        if size is None or size < 0:
+            size = self.chunk_size
+
+        chunks = []
+        remaining = size
+        while remaining > 0 and self._part_index < len(self._parts):
+            chunk = self._read_part(remaining)
+            chunks.append(chunk)
+            remaining -= len(chunk)
+
+        data = b"".join(chunks)
+        if data:
+            self.bytes_read += len(data)
+            if self.callback is not None:
+                self.callback(self.bytes_read, self.len)
+        return data
+
+    def reset(self) -> None:
+        """Rewind the body, so the request can be sent again."""
+        self._close_file()
+        self._part_index = 0
+        self._offset = 0
+        self.bytes_read = 0
+
+    def close(self) -> None:
+        self._close_file()
+        self._part_index = len(self._parts)
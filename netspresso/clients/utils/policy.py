@@ -0,0 +1,150 @@
+import random
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT", "DELETE")
+
+# Path segments that identify a resource are collapsed, so every model or task shares the breaker of its endpoint.
+_ID_SEGMENT = re.compile(r"^(\d+|[0-9a-fA-F-]{16,}|[0-9a-zA-Z_-]{32,})$")
+
+
+class CircuitOpenError(requests.exceptions.ConnectionError):
+    """Raised without sending the request while the circuit breaker of the endpoint is open."""
+
+
+@dataclass
+class RequestPolicy:
+    """Timeouts, retries and circuit breaking applied to every request of the HTTP transport.
+
+    Idempotent methods are retried after connection errors, timeouts and `retry_statuses`.
+    Other methods, like the POST that starts a compression, are only retried when the request
+    surely did not reach the server: when the connection could not be opened, or when the server
+    rejected it with one of `non_idempotent_retry_statuses`. Pass `idempotent=True` to the
+    transport to retry a non-idempotent request that is safe to repeat.
+
+    Attributes:
+        connect_timeout (float): Seconds to wait for the connection to open.
+        read_timeout (float, optional): Seconds to wait for the server between two bytes of the response. Wait forever if None.
+        max_retries (int): The maximum number of retries of a request.
+        backoff_factor (float): Seconds to wait before the first retry. Doubles with every retry.
+        max_backoff (float): Upper bound of the wait before a retry, also applied to Retry-After.
+        jitter (float): Random spread applied to every wait, as a fraction of the wait.
+        retry_statuses (Tuple[int, ...]): Status codes retried for idempotent requests.
+        non_idempotent_retry_statuses (Tuple[int, ...]): Status codes retried for every request.
+        failure_threshold (int): Consecutive failures of an endpoint that open its circuit breaker. Disabled if 0.
+        recovery_time (float): Seconds an open circuit breaker waits before letting a trial request through.
+    """
+
+    connect_timeout: float = 10.0
+    read_timeout: Optional[float] = 300.0
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30.0
+    jitter: float = 0.1
+    retry_statuses: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    non_idempotent_retry_statuses: Tuple[int, ...] = (429, 503)
+    failure_threshold: int = 5
+    recovery_time: float = 30.0
+
+    @property
+    def timeout(self) -> Tuple[float, Optional[float]]:
+        return (self.connect_timeout, self.read_timeout)
+
+    def get_backoff(self, retry: int, retry_after: Optional[str] = None) -> float:
+        """Get the seconds to wait before the retry.
+
+        Args:
+            retry (int): The number of the retry, starting at 0.
+            retry_after (str, optional): The Retry-After header of the response, in seconds.
+
+        Returns:
+            float: The seconds to wait.
+        """
+        if retry_after is not None:
+            try:
+                return min(max(float(retry_after), 0.0), self.max_backoff)
+            except ValueError:
+                pass  # HTTP dates are not used by the NetsPresso servers.
+        backoff = min(self.backoff_factor * 2**retry, self.max_backoff)
+        return max(backoff * (1 + random.uniform(-self.jitter, self.jitter)), 0.0)
+
+
+def get_endpoint(method: str, url: str) -> str:
+    """Get the endpoint of the request, with the resource ids of the path replaced by `{id}`."""
+    parts = urlsplit(url)
+    path = "/".join("{id}" if _ID_SEGMENT.match(segment) else segment for segment in parts.path.split("/"))
+    return f"{method.upper()} {parts.netloc}{path}"
+
+
+class CircuitBreaker:
+    """Fail fast while an endpoint keeps failing.
+
+    After `failure_threshold` consecutive failures the breaker opens and requests fail with
+    `CircuitOpenError` without being sent. Once `recovery_time` has passed, a single trial request
+    is let through. The breaker closes if it succeeds and opens again if it fails.
+
+    Args:
+        failure_threshold (int): Consecutive failures that open the breaker. Disabled if 0.
+        recovery_time (float): Seconds the open breaker waits before a trial request.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int, recovery_time: float) -> None:
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.state = self.CLOSED
+        self.failures = 0
+        self._opened_at = 0.0
+        self._lock = threading.Lock()
+
+    def before_request(self, endpoint: str) -> None:
+        """Check that the request may be sent.
+
+        Args:
+            endpoint (str): The endpoint of the request, used in the error message.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or a trial request is already running.
+        """
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            if self.state == self.CLOSED:
+                return
+            remaining = self._opened_at + self.recovery_time - time.monotonic()
+            if self.state == self.OPEN and remaining <= 0:
+                self.state = self.HALF_OPEN
+                return
+            raise CircuitOpenError(
+                f"The circuit breaker of {endpoint} is open after {self.failures} consecutive failures. "
+                f"Retry in {max(remaining, 0):.1f}s."
+            )
+
+    def record_success(self) -> None:
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+
+    def release_trial(self) -> None:
+        """Let another trial request through, when the trial ended without a response or a request error."""
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.OPEN
+
+    def record_failure(self) -> None:
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self._opened_at = time.monotonic()
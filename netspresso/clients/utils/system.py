@@ -1,13 +1,12 @@
 import platform
-
-from pkg_resources import DistributionNotFound, get_distribution
+from functools import lru_cache
+from importlib.metadata import PackageNotFoundError, version
 
 
 def get_package_version(package_name):
     try:
-        version = get_distribution(package_name).version
-        return version
-    except DistributionNotFound:
+        return version(package_name)
+    except PackageNotFoundError:
         return None
 
 
@@ -30,4 +29,15 @@ def generate_env_string(package_keys):
 
 
 PACKAGE_KEYS = ["torch", "tensorflow", "tensorflow-gpu", "numpy"]
-ENV_STR = generate_env_string(PACKAGE_KEYS)
+
+
+@lru_cache(maxsize=None)
+def get_env_string() -> str:
+    """Return the environment string of the User-Agent. It is computed on the first request, not at import."""
+    return generate_env_string(PACKAGE_KEYS)
+
+
+def __getattr__(name):
+    if name == "ENV_STR":
+        return get_env_string()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,327 @@
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional
+
+import requests
+from loguru import logger
+from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3 import PoolManager
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, NewConnectionError
+
+from .policy import IDEMPOTENT_METHODS, CircuitBreaker, CircuitOpenError, RequestPolicy, get_endpoint
+
+DEFAULT_POOL_CONNECTIONS = 10
+DEFAULT_POOL_MAXSIZE = 10
+
+
+@dataclass
+class TransportStats:
+    """Connection usage counters of the HTTP transport.
+
+    Attributes:
+        requests (int): The number of requests sent through the transport.
+        new_connections (int): The number of TCP(+TLS) connections that had to be opened.
+        retries (int): The number of requests sent again by the request policy.
+    """
+
+    requests: int = 0
+    new_connections: int = 0
+    retries: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def reused_connections(self) -> int:
+        return max(self.requests - self.new_connections, 0)
+
+    def add_request(self) -> None:
+        with self._lock:
+            self.requests += 1
+
+    def add_new_connection(self) -> None:
+        with self._lock:
+            self.new_connections += 1
+
+    def add_retry(self) -> None:
+        with self._lock:
+            self.retries += 1
+
+    def reset(self) -> None:
+        with self._lock:
+            self.requests = 0
+            self.new_connections = 0
+            self.retries = 0
+
+    def asdict(self) -> Dict[str, int]:
+        return {
+            "requests": self.requests,
+            "new_connections": self.new_connections,
+            "reused_connections": self.reused_connections,
+            "retries": self.retries,
+        }
+
+
+class _CountingPoolManager(PoolManager):
+    def __init__(self, stats: TransportStats, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.stats = stats
+
+    def _new_pool(self, scheme, host, port, request_context=None):
+        pool = super()._new_pool(scheme, host, port, request_context=request_context)
+        new_conn = pool._new_conn
+
+        def _counting_new_conn():
+            conn = new_conn()
+            connect = conn.connect
+
+            # Dropped keep-alive connections are reconnected in place, so count the socket connects.
+            def _counting_connect():
+                self.stats.add_new_connection()
+                return connect()
+
+            conn.connect = _counting_connect
+            return conn
+
+        pool._new_conn = _counting_new_conn
+        return pool
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    def __init__(self, stats: TransportStats, **kwargs: Any) -> None:
+        self.stats = stats
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, connections, maxsize, block=False, **pool_kwargs):
+        self._pool_connections = connections
+        self._pool_maxsize = maxsize
+        self._pool_block = block
+
+        self.poolmanager = _CountingPoolManager(
+            stats=self.stats,
+            num_pools=connections,
+            maxsize=maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+
+    def send(self, request, **kwargs):
+        self.stats.add_request()
+        return super().send(request, **kwargs)
+
+
+def _is_connect_error(error: requests.exceptions.RequestException) -> bool:
+    # The connection could not be opened, so the request did not reach the server.
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = error.args[0] if error.args else None
+    if isinstance(reason, MaxRetryError):
+        reason = reason.reason
+    return isinstance(reason, (NewConnectionError, ConnectTimeoutError))
+
+
+def _rewind_body(kwargs: Dict[str, Any]) -> bool:
+    # Returns False if the body was consumed by the last attempt and cannot be sent again.
+    data = kwargs.get("data")
+    if hasattr(data, "reset"):
+        data.reset()
+    elif data is not None and not isinstance(data, (bytes, str, dict, list, tuple)):
+        return False
+
+    for value in (kwargs.get("files") or {}).values():
+        file = value[1] if isinstance(value, tuple) else value
+        if hasattr(file, "read"):
+            if not (hasattr(file, "seekable") and file.seekable()):
+                return False
+            file.seek(0)
+
+    return True
+
+
+class HTTPTransport:
+    """Pooled, keep-alive HTTP transport shared by the API clients.
+
+    Every request follows the request policy: it gets the connect and read timeouts of the policy
+    unless a timeout is given, it is retried with backoff when that is safe for its method, and it
+    fails fast with `CircuitOpenError` while its endpoint keeps failing.
+
+    Args:
+        pool_connections (int): The number of per-host connection pools to keep.
+        pool_maxsize (int): The maximum number of connections kept alive per host.
+        pool_block (bool): If True, limit the connections per host to `pool_maxsize` and wait for a free one.
+        keep_alive (bool): If False, close the connection after every request.
+        policy (RequestPolicy, optional): The timeouts, retries and circuit breaking of the requests.
+    """
+
+    def __init__(
+        self,
+        pool_connections: int = DEFAULT_POOL_CONNECTIONS,
+        pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        policy: Optional[RequestPolicy] = None,
+    ) -> None:
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.policy = policy if policy is not None else RequestPolicy()
+        self.stats = TransportStats()
+        self.session = self._create_session()
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._breakers_lock = threading.Lock()
+
+    def _create_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = _CountingHTTPAdapter(
+            stats=self.stats,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not self.keep_alive:
+            session.headers["Connection"] = "close"
+
+        return session
+
+    def configure(
+        self,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+        keep_alive: Optional[bool] = None,
+        policy: Optional[RequestPolicy] = None,
+    ) -> None:
+        """Change the pool settings. Open connections are closed and the pools are recreated.
+
+        Args:
+            pool_connections (int, optional): The number of per-host connection pools to keep.
+            pool_maxsize (int, optional): The maximum number of connections kept alive per host.
+            pool_block (bool, optional): If True, limit the connections per host to `pool_maxsize`.
+            keep_alive (bool, optional): If False, close the connection after every request.
+            policy (RequestPolicy, optional): The timeouts, retries and circuit breaking. The circuit breakers are reset.
+        """
+        if policy is not None:
+            self.policy = policy
+            with self._breakers_lock:
+                self._breakers = {}
+        if pool_connections is not None:
+            self.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            self.pool_maxsize = pool_maxsize
+        if pool_block is not None:
+            self.pool_block = pool_block
+        if keep_alive is not None:
+            self.keep_alive = keep_alive
+
+        old_session = self.session
+        self.session = self._create_session()
+        old_session.close()
+
+    def get_breaker(self, endpoint: str) -> CircuitBreaker:
+        with self._breakers_lock:
+            breaker = self._breakers.get(endpoint)
+            if breaker is None:
+                breaker = CircuitBreaker(self.policy.failure_threshold, self.policy.recovery_time)
+                self._breakers[endpoint] = breaker
+            return breaker
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        idempotent: Optional[bool] = None,
+        max_retries: Optional[int] = None,
+        **kwargs,
+    ) -> Response:
+        """Send the request following the request policy.
+
+        Args:
+            method (str): The HTTP method.
+            url (str): The URL of the request.
+            idempotent (bool, optional): Whether the request is safe to repeat. Defaults to the idempotency of the method.
+            max_retries (int, optional): The maximum number of retries. Defaults to the policy.
+            **kwargs: The arguments of `requests.Session.request`.
+
+        Raises:
+            CircuitOpenError: If the circuit breaker of the endpoint is open.
+
+        Returns:
+            Response: The response of the last attempt.
+        """
+        policy = self.policy
+        method = method.upper()
+        if idempotent is None:
+            idempotent = method in IDEMPOTENT_METHODS
+        if max_retries is None:
+            max_retries = policy.max_retries
+        kwargs.setdefault("timeout", policy.timeout)
+        retry_statuses = policy.retry_statuses if idempotent else policy.non_idempotent_retry_statuses
+        endpoint = get_endpoint(method, url)
+        breaker = self.get_breaker(endpoint)
+
+        last_error = None
+        for retry in range(max_retries + 1):
+            if retry > 0:
+                self.stats.add_retry()
+            try:
+                breaker.before_request(endpoint)
+            except CircuitOpenError as e:
+                # The failures of this request opened the breaker, so report them as the cause.
+                raise e from last_error
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                last_error = e
+                breaker.record_failure()
+                retryable = idempotent or _is_connect_error(e)
+                if retry == max_retries or not retryable or not _rewind_body(kwargs):
+                    raise e
+                backoff = policy.get_backoff(retry)
+                logger.warning(f"{endpoint} failed. Retrying in {backoff:.1f}s. Error: {e}")
+                time.sleep(backoff)
+                continue
+            except requests.exceptions.RequestException:
+                breaker.record_failure()
+                raise
+            except BaseException:
+                # The request was interrupted, the breaker must not wait forever for its result.
+                breaker.release_trial()
+                raise
+
+            if response.status_code >= 500:
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+            if response.status_code in retry_statuses and retry < max_retries and _rewind_body(kwargs):
+                backoff = policy.get_backoff(retry, response.headers.get("Retry-After"))
+                logger.warning(f"{endpoint} returned {response.status_code}. Retrying in {backoff:.1f}s.")
+                response.close()
+                time.sleep(backoff)
+                continue
+
+            return response
+
+    def get(self, url: str, **kwargs) -> Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs) -> Response:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: str, **kwargs) -> Response:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: str, **kwargs) -> Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        self.session.close()
+
+
+transport = HTTPTransport()
@@ -1,3 +1,4 @@
+from .async_compressor import AsyncCompressor
 from .compressor import Compressor
 
-__all__ = ["Compressor"]
+__all__ = ["Compressor", "AsyncCompressor"]
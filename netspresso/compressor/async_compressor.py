@@ -0,0 +1,233 @@
+from typing import Dict, List, Optional, Union
+
+from netspresso.clients.auth import TokenHandler
+from netspresso.clients.compressor.schemas.compression import Options
+from netspresso.compressor.core.compression import CompressionInfo
+from netspresso.compressor.core.model import CompressedModel, Model
+from netspresso.enums import CompressionMethod, Framework, RecommendationMethod
+
+from ..utils.executor import AsyncExecutor
+from .compressor import Compressor
+
+
+class AsyncCompressor:
+    def __init__(self, token_handler: TokenHandler, executor: Optional[AsyncExecutor] = None) -> None:
+        """Initialize the AsyncCompressor.
+
+        Args:
+            token_handler (TokenHandler): The token handler of the logged in user.
+            executor (AsyncExecutor, optional): The executor shared by the async modules. A new one is created if None.
+        """
+
+        self.compressor = Compressor(token_handler=token_handler)
+        self.executor = executor if executor is not None else AsyncExecutor()
+
+    async def upload_model(
+        self,
+        input_model_path: str,
+        input_shapes: List[Dict[str, int]] = None,
+        framework: Framework = Framework.PYTORCH,
+    ) -> Model:
+        """Upload a model for compression.
+
+        Args:
+            input_model_path (str): The file path where the model is located.
+            input_shapes (List[Dict[str, int]], optional): Input shapes of the model. Defaults to [].
+            framework (Framework): The framework of the model.
+
+        Returns:
+            Model: Uploaded model object.
+        """
+
+        return await self.executor.run(
+            self.compressor.upload_model,
+            input_model_path=input_model_path,
+            input_shapes=input_shapes,
+            framework=framework,
+        )
+
+    async def get_model(self, model_id: str) -> Union[Model, CompressedModel]:
+        """Get the model for a given model ID.
+
+        Args:
+            model_id (str): The ID of the model.
+
+        Returns:
+            Union[Model, CompressedModel]: The retrieved model.
+        """
+
+        return await self.executor.run(self.compressor.get_model, model_id)
+
+    async def select_compression_method(
+        self,
+        model_id: str,
+        compression_method: CompressionMethod,
+        options: Options = Options(),
+    ) -> CompressionInfo:
+        """Select a compression method for a model.
+
+        Args:
+            model_id (str): The ID of the model.
+            compression_method (CompressionMethod): The selected compression method.
+            options(Options, optional): The options for pruning method.
+
+        Returns:
+            CompressionInfo: The compression information for the selected compression method.
+        """
+
+        return await self.executor.run(
+            self.compressor.select_compression_method,
+            model_id=model_id,
+            compression_method=compression_method,
+            options=options,
+        )
+
+    async def compress_model(
+        self,
+        compression: CompressionInfo,
+        output_dir: str,
+        dataset_path: Optional[str] = None,
+    ) -> Dict:
+        """Compress a model using the provided compression information without blocking the event loop.
+
+        Args:
+            compression (CompressionInfo): The information about the compression.
+            output_dir (str): The local path to save the compressed model.
+            dataset_path (str, optional): The path of the dataset used for nuclear norm compression method. Default is None.
+
+        Returns:
+            Dict: Source model and compressed model information.
+        """
+
+        return await self.executor.run(
+            self.compressor.compress_model,
+            compression=compression,
+            output_dir=output_dir,
+            dataset_path=dataset_path,
+        )
+
+    async def recommendation_compression(
+        self,
+        compression_method: CompressionMethod,
+        recommendation_method: RecommendationMethod,
+        recommendation_ratio: float,
+        input_model_path: str,
+        output_dir: str,
+        input_shapes: List[Dict[str, int]],
+        framework: Framework = Framework.PYTORCH,
+        options: Options = Options(),
+        dataset_path: Optional[str] = None,
+    ) -> Dict:
+        """Compress a recommendation-based model without blocking the event loop.
+
+        Args:
+            compression_method (CompressionMethod): The selected compression method.
+            recommendation_method (RecommendationMethod): The selected recommendation method.
+            recommendation_ratio (float): The compression ratio recommended by the recommendation method.
+            input_model_path (str): The file path where the model is located.
+            output_dir (str): The local path to save the compressed model.
+            input_shapes (List[Dict[str, int]]): Input shapes of the model.
+            framework (Framework, optional): The framework of the model.
+            options(Options, optional): The options for pruning method.
+            dataset_path (str, optional): The path of the dataset used for nuclear norm compression method. Default is None.
+
+        Returns:
+            Dict: Source model and compressed model information.
+        """
+
+        return await self.executor.run(
+            self.compressor.recommendation_compression,
+            compression_method=compression_method,
+            recommendation_method=recommendation_method,
+            recommendation_ratio=recommendation_ratio,
+            input_model_path=input_model_path,
+            output_dir=output_dir,
+            input_shapes=input_shapes,
+            framework=framework,
+            options=options,
+            dataset_path=dataset_path,
+        )
+
+    async def sweep(
+        self,
+        input_model_path: str,
+        output_dir: str,
+        input_shapes: List[Dict[str, int]],
+        recommendation_ratios: List[float],
+        compression_methods: Optional[List[CompressionMethod]] = None,
+        framework: Framework = Framework.PYTORCH,
+        options: Options = Options(),
+        dataset_path: Optional[str] = None,
+        max_workers: int = 4,
+    ) -> List[Dict]:
+        """Run a compression sweep over methods and ratios without blocking the event loop.
+
+        Args:
+            input_model_path (str): The file path where the model is located.
+            output_dir (str): The local path to save the compressed models.
+            input_shapes (List[Dict[str, int]]): Input shapes of the model.
+            recommendation_ratios (List[float]): The compression ratios to try.
+            compression_methods (List[CompressionMethod], optional): The compression methods to try. Defaults to [PR_L2].
+            framework (Framework, optional): The framework of the model.
+            options(Options, optional): The options for pruning method.
+            dataset_path (str, optional): The path of the dataset used for nuclear norm compression method. Default is None.
+            max_workers (int): The maximum number of compressions running at the same time.
+
+        Returns:
+            List[Dict]: One row per compression, with the Pareto frontier flagged.
+        """
+
+        return await self.executor.run(
+            self.compressor.sweep,
+            input_model_path=input_model_path,
+            output_dir=output_dir,
+            input_shapes=input_shapes,
+            recommendation_ratios=recommendation_ratios,
+            compression_methods=compression_methods,
+            framework=framework,
+            options=options,
+            dataset_path=dataset_path,
+            max_workers=max_workers,
+        )
+
+    async def automatic_compression(
+        self,
+        input_model_path: str,
+        output_dir: str,
+        input_shapes: List[Dict[str, int]],
+        framework: Framework = Framework.PYTORCH,
+        compression_ratio: float = 0.5,
+    ) -> Dict:
+        """Compress a model automatically based on the given compression ratio without blocking the event loop.
+
+        Args:
+            input_model_path (str): The file path where the model is located.
+            output_dir (str): The local path to save the compressed model.
+            input_shapes (List[Dict[str, int]]): Input shapes of the model.
+            framework (Framework, optional): The framework of the model.
+            compression_ratio (float, optional): The compression ratio for automatic compression. Defaults to 0.5.
+
+        Returns:
+            Dict: Source model and compressed model information.
+        """
+
+        return await self.executor.run(
+            self.compressor.automatic_compression,
+            input_model_path=input_model_path,
+            output_dir=output_dir,
+            input_shapes=input_shapes,
+            framework=framework,
+            compression_ratio=compression_ratio,
+        )
+
+    async def resume(self, output_dir: str) -> Dict:
+        """Continue an interrupted compression from its last completed step without blocking the event loop.
+
+        Args:
+            output_dir (str): The output folder of the interrupted compression.
+
+        Returns:
+            Dict: Source model and compressed model information.
+        """
+
+        return await self.executor.run(self.compressor.resume, output_dir=output_dir)
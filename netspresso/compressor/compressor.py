@@ -1,10 +1,11 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import asdict, is_dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Union
-from urllib import request
+from typing import Any, Dict, List, Optional, Union
 
 from loguru import logger
 
-from netspresso.clients.auth import TokenHandler, auth_client
+from netspresso.clients.auth import TokenHandler
 from netspresso.clients.compressor import compressor_client
 from netspresso.clients.compressor.schemas.compression import (
     AutoCompressionRequest,
@@ -19,12 +20,41 @@ from netspresso.clients.compressor.schemas.compression import (
 from netspresso.clients.compressor.schemas.model import UploadModelRequest
 from netspresso.clients.launcher import launcher_client
 from netspresso.compressor.core.compression import CompressionInfo
-from netspresso.compressor.core.model import CompressedModel, Model, ModelCollection, ModelFactory
-from netspresso.enums import CompressionMethod, Framework, Module, RecommendationMethod, ServiceCredit, Status, TaskType
+from netspresso.compressor.core.model import CompressedModel, InputShape, Model, ModelCollection, ModelFactory
+from netspresso.enums import (
+    CompressionMethod,
+    CompressionStep,
+    Framework,
+    Module,
+    RecommendationMethod,
+    ServiceCredit,
+    Status,
+    TaskType,
+)
 
 from ..utils import FileHandler, check_credit_balance
 from ..utils.metadata import MetadataHandler
-from .utils.onnx import export_onnx
+from ..utils.metadata.default import CompressorMetadata
+from ..utils.metadata.default.common import TargetDevice
+from .utils.pareto import format_table, get_pareto_frontier
+
+RECOMMENDATION_METHODS = {
+    CompressionMethod.PR_L2: RecommendationMethod.SLAMP,
+    CompressionMethod.PR_GM: RecommendationMethod.SLAMP,
+    CompressionMethod.PR_NN: RecommendationMethod.SLAMP,
+    CompressionMethod.FD_TK: RecommendationMethod.VBMF,
+    CompressionMethod.FD_SVD: RecommendationMethod.VBMF,
+}
+SWEEP_PARETO_KEYS = ["flops", "size", "number_of_parameters"]
+
+ADVANCED = "advanced"
+RECOMMENDATION = "recommendation"
+AUTOMATIC = "automatic"
+COMPRESSION_LABELS = {
+    ADVANCED: "Compress model",
+    RECOMMENDATION: "Recommendation compression",
+    AUTOMATIC: "Automatic compression",
+}
 
 
 class Compressor:
@@ -84,6 +114,45 @@ class Compressor:
             logger.error(f"Upload model failed. Error: {e}")
             raise e
 
+    def profile_model(
+        self,
+        input_model_path: str,
+        input_shapes: Optional[List[Dict[str, int]]] = None,
+        framework: Framework = Framework.PYTORCH,
+    ) -> Model:
+        """Profile a model locally, without uploading it or consuming credits.
+
+        The FLOPs, parameters and size are computed on this machine with onnx, torch or tensorflow,
+        depending on the framework. Results are cached by the hash of the model file.
+
+        Args:
+            input_model_path (str): The file path where the model is located.
+            input_shapes (List[Dict[str, int]], optional): Input shapes of the model. Required for PyTorch models.
+            framework (Framework): The framework of the model.
+
+        Raises:
+            e: If an error occurs while profiling the model.
+
+        Returns:
+            Model: The profiled model. The model_id is empty, since the model is not uploaded.
+        """
+
+        from .utils.profiler import profiler
+
+        FileHandler.check_input_model_path(input_model_path)
+
+        try:
+            result = profiler.profile(model_path=input_model_path, framework=framework, input_shapes=input_shapes)
+            input_shapes = [InputShape(**shape) if isinstance(shape, dict) else shape for shape in input_shapes or []]
+
+            return result.to_model(
+                model_name=Path(input_model_path).stem, framework=framework, input_shapes=input_shapes
+            )
+
+        except Exception as e:
+            logger.error(f"Profile model failed. Error: {e}")
+            raise e
+
     def get_model(self, model_id: str) -> Union[Model, CompressedModel]:
         """Get the model for a given model ID.
 
@@ -139,7 +208,7 @@ class Compressor:
                 access_token=self.token_handler.tokens.access_token,
                 verify_ssl=self.token_handler.verify_ssl,
             )
-            request.urlretrieve(download_link.url, local_path)
+            FileHandler.download_file(download_link.url, local_path, verify=self.token_handler.verify_ssl)
             logger.info(f"Model downloaded at {Path(local_path)}")
 
         except Exception as e:
@@ -316,6 +385,8 @@ class Compressor:
         """
 
         if compressed_model.framework in [Framework.PYTORCH, Framework.ONNX]:
+            from .utils.onnx import export_onnx
+
             export_onnx(default_model_path, compressed_model.input_shapes)
             converter_uploaded_model = launcher_client.upload_model(
                 model_file_path=default_model_path.with_suffix(".onnx"),
@@ -333,6 +404,244 @@ class Compressor:
 
         return converter_uploaded_model
 
+    @staticmethod
+    def _options_to_dict(options: Any) -> Dict:
+        if hasattr(options, "dict"):
+            return options.dict()
+        if is_dataclass(options):
+            return asdict(options)
+        return options
+
+    @staticmethod
+    def _is_done(metadata: CompressorMetadata, step: CompressionStep) -> bool:
+        current_step = metadata.checkpoint.step
+        return bool(current_step) and CompressionStep(current_step).order >= step.order
+
+    @staticmethod
+    def _save_checkpoint(metadata: CompressorMetadata, output_dir: str, step: CompressionStep, **kwargs) -> None:
+        metadata.update_checkpoint(step=step, **kwargs)
+        # The compressed step records a consumed credit, resuming without it would compress and charge again.
+        MetadataHandler.save_metadata(
+            data=metadata.asdict(), folder_path=output_dir, flush=step == CompressionStep.COMPRESSED
+        )
+
+    def _run_advanced_compression(self, metadata: CompressorMetadata, output_dir: str) -> None:
+        checkpoint = metadata.checkpoint
+        request = checkpoint.request
+
+        if not self._is_done(metadata, CompressionStep.CREATED):
+            data = CreateCompressionRequest(
+                model_id=checkpoint.original_model_id,
+                model_name=Path(output_dir).name,
+                compression_method=request["compression_method"],
+                options=request["options"],
+            )
+            compression_info = compressor_client.create_compression(
+                data=data, access_token=self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
+            )
+            self._save_checkpoint(
+                metadata,
+                output_dir,
+                CompressionStep.CREATED,
+                compression_id=compression_info.compression_id,
+                new_model_id=compression_info.new_model_id,
+            )
+
+        if not self._is_done(metadata, CompressionStep.COMPRESSED):
+            if request["dataset_path"] and request["compression_method"] == CompressionMethod.PR_NN:
+                self.__upload_dataset(model_id=checkpoint.original_model_id, dataset_path=request["dataset_path"])
+
+            data = CompressionRequest(
+                compression_id=checkpoint.compression_id,
+                compression_method=request["compression_method"],
+                layers=[AvailableLayer(**layer) for layer in request["layers"]],
+                compressed_model_id=checkpoint.new_model_id,
+                options=request["options"],
+            )
+            compressor_client.compress_model(
+                data=data, access_token=self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
+            )
+            self._save_checkpoint(metadata, output_dir, CompressionStep.COMPRESSED)
+
+    def _run_recommendation_compression(self, metadata: CompressorMetadata, output_dir: str) -> Optional[Model]:
+        checkpoint = metadata.checkpoint
+        request = checkpoint.request
+        model = None
+
+        if not self._is_done(metadata, CompressionStep.UPLOADED):
+            model = self.upload_model(
+                framework=request["framework"],
+                input_model_path=request["input_model_path"],
+                input_shapes=request["input_shapes"],
+            )
+            self._save_checkpoint(metadata, output_dir, CompressionStep.UPLOADED, original_model_id=model.model_id)
+
+        available_layers = None
+        if not self._is_done(metadata, CompressionStep.CREATED):
+            data = CreateCompressionRequest(
+                model_id=checkpoint.original_model_id,
+                model_name=Path(output_dir).name,
+                compression_method=request["compression_method"],
+                options=request["options"],
+            )
+            compression_info = compressor_client.create_compression(
+                data=data, access_token=self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
+            )
+            available_layers = compression_info.available_layers
+            self._save_checkpoint(
+                metadata,
+                output_dir,
+                CompressionStep.CREATED,
+                compression_id=compression_info.compression_id,
+                new_model_id=compression_info.new_model_id,
+            )
+
+        if not self._is_done(metadata, CompressionStep.COMPRESSED):
+            if available_layers is None:
+                available_layers = compressor_client.get_compression_info(
+                    compression_id=checkpoint.compression_id,
+                    access_token=self.token_handler.tokens.access_token,
+                    verify_ssl=self.token_handler.verify_ssl,
+                ).available_layers
+
+            if request["dataset_path"] and request["compression_method"] == CompressionMethod.PR_NN:
+                self.__upload_dataset(model_id=checkpoint.original_model_id, dataset_path=request["dataset_path"])
+
+            data = RecommendationRequest(
+                model_id=checkpoint.original_model_id,
+                compression_id=checkpoint.compression_id,
+                recommendation_method=request["recommendation_method"],
+                recommendation_ratio=request["ratio"],
+                options=request["options"],
+            )
+            logger.info("Compressing model...")
+            recommendation_result = compressor_client.get_recommendation(
+                data=data, access_token=self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
+            )
+
+            for recommended_layer in recommendation_result.recommended_layers:
+                for available_layer in available_layers:
+                    # Find the matching available_layer by name
+                    if available_layer.name == recommended_layer.name:
+                        available_layer.use = True
+                        available_layer.values = recommended_layer.values
+
+            data = CompressionRequest(
+                compression_id=checkpoint.compression_id,
+                compression_method=request["compression_method"],
+                layers=available_layers,
+                compressed_model_id=checkpoint.new_model_id,
+                options=request["options"],
+            )
+            compressor_client.compress_model(
+                data=data, access_token=self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
+            )
+            self._save_checkpoint(metadata, output_dir, CompressionStep.COMPRESSED)
+
+        return model
+
+    def _run_automatic_compression(self, metadata: CompressorMetadata, output_dir: str) -> Optional[Model]:
+        checkpoint = metadata.checkpoint
+        request = checkpoint.request
+        model = None
+
+        if not self._is_done(metadata, CompressionStep.UPLOADED):
+            model = self.upload_model(
+                framework=request["framework"],
+                input_model_path=request["input_model_path"],
+                input_shapes=request["input_shapes"],
+            )
+            self._save_checkpoint(metadata, output_dir, CompressionStep.UPLOADED, original_model_id=model.model_id)
+
+        if not self._is_done(metadata, CompressionStep.COMPRESSED):
+            data = AutoCompressionRequest(
+                model_id=checkpoint.original_model_id,
+                model_name=f"{Path(output_dir).name}_automatic_{request['ratio']}",
+                recommendation_ratio=request["ratio"],
+                save_path=output_dir,
+            )
+            logger.info("Compressing model...")
+            model_info = compressor_client.auto_compression(
+                data=data, access_token=self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
+            )
+            self._save_checkpoint(
+                metadata,
+                output_dir,
+                CompressionStep.COMPRESSED,
+                compression_id=model_info.original_compression_id,
+                new_model_id=model_info.model_id,
+            )
+
+        return model
+
+    def _complete_compression(
+        self,
+        metadata: CompressorMetadata,
+        output_dir: str,
+        original_model: Optional[Model] = None,
+        batch: bool = False,
+    ) -> Dict:
+        # Downloads the compressed model, registers it for conversion and fills the metadata,
+        # skipping the steps already recorded in the checkpoint.
+        checkpoint = metadata.checkpoint
+        request = checkpoint.request
+        default_model_path, extension = FileHandler.get_path_and_extension(
+            folder_path=output_dir, framework=request["framework"]
+        )
+        compressed_model_path = default_model_path.with_suffix(extension)
+
+        if not self._is_done(metadata, CompressionStep.DOWNLOADED) or not compressed_model_path.exists():
+            self.download_model(model_id=checkpoint.new_model_id, local_path=compressed_model_path)
+            self._save_checkpoint(metadata, output_dir, CompressionStep.DOWNLOADED)
+
+        compressed_model = self.get_model(model_id=checkpoint.new_model_id)
+        if original_model is None:
+            original_model = self.get_model(model_id=checkpoint.original_model_id)
+
+        if not self._is_done(metadata, CompressionStep.CONVERTED):
+            converter_uploaded_model = self._get_available_devices(compressed_model, default_model_path)
+            metadata.update_available_devices(converter_uploaded_model.available_devices)
+            metadata.update_launcher_model(converter_uploaded_model)
+            self._save_checkpoint(metadata, output_dir, CompressionStep.CONVERTED)
+
+        label = COMPRESSION_LABELS[checkpoint.compression_type]
+        logger.info(f"{label} successfully. Compressed Model ID: {compressed_model.model_id}")
+        if not checkpoint.credit_consumed:
+            if checkpoint.compression_type == AUTOMATIC:
+                service_credit = ServiceCredit.AUTOMATIC_COMPRESSION
+            else:
+                service_credit = ServiceCredit.ADVANCED_COMPRESSION
+            self.token_handler.consume_credit(service_credit, defer_log=batch)
+            metadata.update_checkpoint(credit_consumed=True)
+
+        metadata.update_compressed_model_path(compressed_model_path=compressed_model_path.as_posix())
+        if compressed_model.framework in [Framework.PYTORCH, Framework.ONNX]:
+            metadata.update_compressed_onnx_model_path(
+                compressed_onnx_model_path=default_model_path.with_suffix(".onnx").as_posix()
+            )
+        metadata.update_model_info(
+            task=original_model.task, framework=request["framework"], input_shapes=request["input_shapes"]
+        )
+        if checkpoint.compression_type == ADVANCED:
+            metadata.update_compression_info(
+                method=request["compression_method"],
+                options=request["options"],
+                layers=request["layers"],
+            )
+        else:
+            compression_info = self.get_compression(checkpoint.compression_id)
+            metadata.update_compression_info(
+                method=compression_info.compression_method,
+                ratio=request["ratio"],
+                options=compression_info.options,
+                layers=compression_info.available_layers,
+            )
+        metadata.update_results(model=original_model, compressed_model=compressed_model)
+        metadata.update_status(status=Status.COMPLETED)
+        MetadataHandler.save_metadata(data=metadata.asdict(), folder_path=output_dir, flush=True)
+
+        return metadata.asdict()
+
     def compress_model(
         self,
         compression: CompressionInfo,
@@ -361,34 +670,14 @@ class Compressor:
             model_info = self.get_model(compression.original_model_id)
 
             output_dir = FileHandler.create_unique_folder(folder_path=output_dir)
-            default_model_path, extension = FileHandler.get_path_and_extension(
-                folder_path=output_dir, framework=model_info.framework
-            )
             metadata = MetadataHandler.init_metadata(folder_path=output_dir, task_type=TaskType.COMPRESS)
 
-            current_credit = auth_client.get_credit(
-                self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
-            )
+            current_credit = self.token_handler.get_credit()
             check_credit_balance(
                 user_credit=current_credit,
                 service_credit=ServiceCredit.ADVANCED_COMPRESSION,
             )
 
-            model_name = Path(output_dir).name
-
-            data = CreateCompressionRequest(
-                model_id=compression.original_model_id,
-                model_name=model_name,
-                compression_method=compression.compression_method,
-                options=compression.options,
-            )
-            compression_info = compressor_client.create_compression(
-                data=data, access_token=self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
-            )
-
-            if dataset_path and compression.compression_method == CompressionMethod.PR_NN:
-                self.__upload_dataset(model_id=compression.original_model_id, dataset_path=dataset_path)
-
             for available_layers in compression.available_layers:
                 if available_layers.values != [""]:
                     available_layers.use = True
@@ -399,76 +688,31 @@ class Compressor:
                     "The available_layer.values all empty. please put in the available_layer.values to compress."
                 )
 
-            available_layers = [
-                AvailableLayer(
-                    name=layer.name,
-                    values=layer.values,
-                    channels=layer.channels,
-                    use=layer.use,
-                )
-                for layer in compression.available_layers
-            ]
-
-            data = CompressionRequest(
-                compression_id=compression_info.compression_id,
-                compression_method=compression.compression_method,
-                layers=available_layers,
-                compressed_model_id=compression_info.new_model_id,
-                options=compression.options,
-            )
-            compressor_client.compress_model(
-                data=data, access_token=self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
-            )
-
-            self.download_model(
-                model_id=compression_info.new_model_id,
-                local_path=default_model_path.with_suffix(extension),
-            )
-            compressed_model = self.get_model(model_id=compression_info.new_model_id)
-
-            converter_uploaded_model = self._get_available_devices(compressed_model, default_model_path)
-
-            logger.info(f"Compress model successfully. Compressed Model ID: {compressed_model.model_id}")
-            remaining_credit = auth_client.get_credit(
-                self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
-            )
-            logger.info(
-                f"{ServiceCredit.ADVANCED_COMPRESSION} credits have been consumed. Remaining Credit: {remaining_credit}"
+            metadata.update_checkpoint(
+                compression_type=ADVANCED,
+                original_model_id=compression.original_model_id,
+                request={
+                    "framework": model_info.framework,
+                    "input_shapes": [asdict(input_shape) for input_shape in model_info.input_shapes],
+                    "compression_method": compression.compression_method,
+                    "options": self._options_to_dict(compression.options),
+                    "layers": [asdict(layer) for layer in compression.available_layers],
+                    "dataset_path": dataset_path,
+                },
             )
+            self._run_advanced_compression(metadata, output_dir)
 
-            metadata.update_compressed_model_path(
-                compressed_model_path=default_model_path.with_suffix(extension).as_posix()
-            )
-            if compressed_model.framework in [Framework.PYTORCH, Framework.ONNX]:
-                metadata.update_compressed_onnx_model_path(
-                    compressed_onnx_model_path=default_model_path.with_suffix(".onnx").as_posix()
-                )
-            metadata.update_model_info(
-                task=model_info.task,
-                framework=model_info.framework,
-                input_shapes=model_info.input_shapes,
-            )
-            metadata.update_compression_info(
-                method=compression.compression_method,
-                options=compression.options,
-                layers=compression.available_layers,
-            )
-            metadata.update_results(model=model_info, compressed_model=compressed_model)
-            metadata.update_status(status=Status.COMPLETED)
-            metadata.update_available_devices(converter_uploaded_model.available_devices)
-            MetadataHandler.save_json(data=metadata.asdict(), folder_path=output_dir)
-
-            return metadata.asdict()
+            return self._complete_compression(metadata, output_dir, original_model=model_info)
 
         except Exception as e:
             logger.error(f"Compress model failed. Error: {e}")
             metadata.update_status(status=Status.ERROR)
-            MetadataHandler.save_json(data=metadata.asdict(), folder_path=output_dir)
+            MetadataHandler.save_metadata(data=metadata.asdict(), folder_path=output_dir, flush=True)
             raise e
 
         except KeyboardInterrupt:
             metadata.update_status(status=Status.STOPPED)
-            MetadataHandler.save_json(data=metadata.asdict(), folder_path=output_dir)
+            MetadataHandler.save_metadata(data=metadata.asdict(), folder_path=output_dir, flush=True)
 
     def recommendation_compression(
         self,
@@ -506,150 +750,235 @@ class Compressor:
 
         self.token_handler.validate_token()
 
+        return self._recommendation_compression(
+            compression_method=compression_method,
+            recommendation_method=recommendation_method,
+            recommendation_ratio=recommendation_ratio,
+            input_model_path=input_model_path,
+            output_dir=output_dir,
+            input_shapes=input_shapes,
+            framework=framework,
+            options=options,
+            dataset_path=dataset_path,
+        )
+
+    @staticmethod
+    def _validate_recommendation(
+        compression_method: CompressionMethod, recommendation_method: RecommendationMethod, framework: Framework
+    ) -> None:
+        if framework == Framework.PYTORCH and compression_method == CompressionMethod.PR_NN:
+            raise Exception("The Nuclear Norm is only supported in the TensorFlow-Keras framework.")
+
+        if compression_method in [CompressionMethod.PR_ID, CompressionMethod.FD_CP]:
+            raise Exception(f"The {compression_method} compression method you choose doesn't provide a recommendation.")
+
+        if (
+            compression_method
+            in [
+                CompressionMethod.PR_L2,
+                CompressionMethod.PR_GM,
+                CompressionMethod.PR_NN,
+            ]
+            and recommendation_method != RecommendationMethod.SLAMP
+        ):
+            raise Exception(
+                f"The {compression_method} compression method is only available the SLAMP recommendation method."
+            )
+
+        if (
+            compression_method in [CompressionMethod.FD_TK, CompressionMethod.FD_SVD]
+            and recommendation_method != RecommendationMethod.VBMF
+        ):
+            raise Exception(
+                f"The {compression_method} compression method is only available the VBMF recommendation method."
+            )
+
+    def _recommendation_compression(
+        self,
+        compression_method: CompressionMethod,
+        recommendation_method: RecommendationMethod,
+        recommendation_ratio: float,
+        input_model_path: str,
+        output_dir: str,
+        input_shapes: List[Dict[str, int]],
+        framework: Framework = Framework.PYTORCH,
+        options: Options = Options(),
+        dataset_path: Optional[str] = None,
+        model: Optional[Model] = None,
+        batch: bool = False,
+    ) -> Dict:
+        # With `model`, the already uploaded model is compressed. With `batch`, the caller checks and logs the credit.
         try:
             logger.info("Compressing recommendation-based model...")
 
             output_dir = FileHandler.create_unique_folder(folder_path=output_dir)
-            default_model_path, extension = FileHandler.get_path_and_extension(
-                folder_path=output_dir, framework=framework
-            )
             metadata = MetadataHandler.init_metadata(folder_path=output_dir, task_type=TaskType.COMPRESS)
 
-            current_credit = auth_client.get_credit(
-                self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
-            )
-            check_credit_balance(
-                user_credit=current_credit,
-                service_credit=ServiceCredit.ADVANCED_COMPRESSION,
+            if not batch:
+                current_credit = self.token_handler.get_credit()
+                check_credit_balance(
+                    user_credit=current_credit,
+                    service_credit=ServiceCredit.ADVANCED_COMPRESSION,
+                )
+
+            self._validate_recommendation(compression_method, recommendation_method, framework)
+
+            metadata.update_checkpoint(
+                compression_type=RECOMMENDATION,
+                request={
+                    "framework": framework,
+                    "input_shapes": input_shapes,
+                    "input_model_path": input_model_path,
+                    "compression_method": compression_method,
+                    "recommendation_method": recommendation_method,
+                    "ratio": recommendation_ratio,
+                    "options": options.dict(),
+                    "dataset_path": dataset_path,
+                },
             )
+            if model is not None:
+                self._save_checkpoint(metadata, output_dir, CompressionStep.UPLOADED, original_model_id=model.model_id)
 
-            if framework == Framework.PYTORCH and compression_method == CompressionMethod.PR_NN:
-                raise Exception("The Nuclear Norm is only supported in the TensorFlow-Keras framework.")
+            model = self._run_recommendation_compression(metadata, output_dir) or model
 
-            if compression_method in [CompressionMethod.PR_ID, CompressionMethod.FD_CP]:
-                raise Exception(
-                    f"The {compression_method} compression method you choose doesn't provide a recommendation."
-                )
+            return self._complete_compression(metadata, output_dir, original_model=model, batch=batch)
 
-            if (
-                compression_method
-                in [
-                    CompressionMethod.PR_L2,
-                    CompressionMethod.PR_GM,
-                    CompressionMethod.PR_NN,
-                ]
-                and recommendation_method != RecommendationMethod.SLAMP
-            ):
-                raise Exception(
-                    f"The {compression_method} compression method is only available the SLAMP recommendation method."
-                )
+        except Exception as e:
+            logger.error(f"Recommendation compression failed. Error: {e}")
+            metadata.update_status(status=Status.ERROR)
+            MetadataHandler.save_metadata(data=metadata.asdict(), folder_path=output_dir, flush=True)
+            raise e
 
-            if (
-                compression_method in [CompressionMethod.FD_TK, CompressionMethod.FD_SVD]
-                and recommendation_method != RecommendationMethod.VBMF
-            ):
-                raise Exception(
-                    f"The {compression_method} compression method is only available the VBMF recommendation method."
-                )
+        except KeyboardInterrupt:
+            metadata.update_status(status=Status.STOPPED)
+            MetadataHandler.save_metadata(data=metadata.asdict(), folder_path=output_dir, flush=True)
 
-            model_name = Path(output_dir).name
+    def sweep(
+        self,
+        input_model_path: str,
+        output_dir: str,
+        input_shapes: List[Dict[str, int]],
+        recommendation_ratios: List[float],
+        compression_methods: Optional[List[CompressionMethod]] = None,
+        framework: Framework = Framework.PYTORCH,
+        options: Options = Options(),
+        dataset_path: Optional[str] = None,
+        max_workers: int = 4,
+    ) -> List[Dict]:
+        """Run recommendation compressions for every combination of compression method and ratio.
 
-            model = self.upload_model(
-                framework=framework,
-                input_model_path=input_model_path,
-                input_shapes=input_shapes,
-            )
+        The model is uploaded once and the compressions run concurrently. Each compressed model is saved in
+        its own folder under `output_dir`, and a summary with the Pareto frontier over FLOPs, size and
+        parameters is saved as `sweep.json`.
 
-            data = CreateCompressionRequest(
-                model_id=model.model_id,
-                model_name=model_name,
-                compression_method=compression_method,
-                options=options.dict(),
-            )
-            compression_info = compressor_client.create_compression(
-                data=data, access_token=self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
-            )
+        Args:
+            input_model_path (str): The file path where the model is located.
+            output_dir (str): The local path to save the compressed models.
+            input_shapes (List[Dict[str, int]]): Input shapes of the model.
+            recommendation_ratios (List[float]): The compression ratios to try.
+            compression_methods (List[CompressionMethod], optional): The compression methods to try. Defaults to [PR_L2].
+                The recommendation method is chosen per compression method (SLAMP for pruning, VBMF for decomposition).
+            framework (Framework, optional): The framework of the model.
+            options(Options, optional): The options for pruning method.
+            dataset_path (str, optional): The path of the dataset used for nuclear norm compression method. Default is None.
+            max_workers (int): The maximum number of compressions running at the same time.
 
-            if dataset_path and compression_method == CompressionMethod.PR_NN:
-                self.__upload_dataset(model_id=model.model_id, dataset_path=dataset_path)
+        Raises:
+            e: If an error occurs before the compressions start.
 
-            data = RecommendationRequest(
-                model_id=model.model_id,
-                compression_id=compression_info.compression_id,
-                recommendation_method=recommendation_method,
-                recommendation_ratio=recommendation_ratio,
-                options=options.dict(),
-            )
-            logger.info("Compressing model...")
-            recommendation_result = compressor_client.get_recommendation(
-                data=data, access_token=self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
-            )
+        Returns:
+            List[Dict]: One row per compression with its method, ratio, FLOPs, size, parameters, status,
+                output folder and whether it is on the Pareto frontier. Sorted by FLOPs.
+        """
 
-            for recommended_layer in recommendation_result.recommended_layers:
-                for available_layer in compression_info.available_layers:
-                    # Find the matching available_layer by name
-                    if available_layer.name == recommended_layer.name:
-                        available_layer.use = True
-                        available_layer.values = recommended_layer.values
+        if compression_methods is None:
+            compression_methods = [CompressionMethod.PR_L2]
 
-            data = CompressionRequest(
-                compression_id=compression_info.compression_id,
-                compression_method=compression_method,
-                layers=compression_info.available_layers,
-                compressed_model_id=compression_info.new_model_id,
-                options=options.dict(),
-            )
-            compressor_client.compress_model(
-                data=data, access_token=self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
-            )
+        FileHandler.check_input_model_path(input_model_path)
 
-            self.download_model(
-                model_id=compression_info.new_model_id,
-                local_path=default_model_path.with_suffix(extension),
-            )
-            compressed_model = self.get_model(model_id=compression_info.new_model_id)
+        self.token_handler.validate_token()
 
-            converter_uploaded_model = self._get_available_devices(compressed_model, default_model_path)
+        try:
+            combinations = []
+            for compression_method in compression_methods:
+                recommendation_method = RECOMMENDATION_METHODS.get(compression_method)
+                if recommendation_method is None:
+                    raise Exception(
+                        f"The {compression_method} compression method you choose doesn't provide a recommendation."
+                    )
+                self._validate_recommendation(compression_method, recommendation_method, framework)
+                for ratio in recommendation_ratios:
+                    combinations.append((compression_method, recommendation_method, ratio))
 
-            logger.info(f"Recommendation compression successfully. Compressed Model ID: {compressed_model.model_id}")
-            remaining_credit = auth_client.get_credit(
-                self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
-            )
-            logger.info(
-                f"{ServiceCredit.ADVANCED_COMPRESSION} credits have been consumed. Remaining Credit: {remaining_credit}"
+            current_credit = self.token_handler.get_credit()
+            check_credit_balance(
+                user_credit=current_credit,
+                service_credit=ServiceCredit.ADVANCED_COMPRESSION,
+                task_count=len(combinations),
             )
 
-            _compression_info = self.get_compression(compression_info.compression_id)
-            metadata.update_compressed_model_path(
-                compressed_model_path=default_model_path.with_suffix(extension).as_posix()
-            )
-            if compressed_model.framework in [Framework.PYTORCH, Framework.ONNX]:
-                metadata.update_compressed_onnx_model_path(
-                    compressed_onnx_model_path=default_model_path.with_suffix(".onnx").as_posix()
-                )
-            metadata.update_model_info(task=model.task, framework=framework, input_shapes=input_shapes)
-            metadata.update_compression_info(
-                method=_compression_info.compression_method,
-                ratio=recommendation_ratio,
-                options=_compression_info.options,
-                layers=_compression_info.available_layers,
+            output_dir = FileHandler.create_unique_folder(folder_path=output_dir)
+            model = self.upload_model(
+                framework=framework,
+                input_model_path=input_model_path,
+                input_shapes=input_shapes,
             )
-            metadata.update_results(model=model, compressed_model=compressed_model)
-            metadata.update_status(status=Status.COMPLETED)
-            metadata.update_available_devices(converter_uploaded_model.available_devices)
-            MetadataHandler.save_json(data=metadata.asdict(), folder_path=output_dir)
-
-            return metadata.asdict()
+            if dataset_path and CompressionMethod.PR_NN in compression_methods:
+                self.__upload_dataset(model_id=model.model_id, dataset_path=dataset_path)
 
         except Exception as e:
-            logger.error(f"Recommendation compression failed. Error: {e}")
-            metadata.update_status(status=Status.ERROR)
-            MetadataHandler.save_json(data=metadata.asdict(), folder_path=output_dir)
+            logger.error(f"Compression sweep failed. Error: {e}")
             raise e
 
-        except KeyboardInterrupt:
-            metadata.update_status(status=Status.STOPPED)
-            MetadataHandler.save_json(data=metadata.asdict(), folder_path=output_dir)
+        logger.info(f"Running {len(combinations)} compressions...")
+        rows = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._recommendation_compression,
+                    compression_method=compression_method,
+                    recommendation_method=recommendation_method,
+                    recommendation_ratio=ratio,
+                    input_model_path=input_model_path,
+                    output_dir=Path(output_dir) / f"{compression_method.value}_{ratio}",
+                    input_shapes=input_shapes,
+                    framework=framework,
+                    options=options,
+                    model=model,
+                    batch=True,
+                ): (compression_method, recommendation_method, ratio)
+                for compression_method, recommendation_method, ratio in combinations
+            }
+            for future in as_completed(futures):
+                compression_method, recommendation_method, ratio = futures[future]
+                row = {
+                    "compression_method": compression_method.value,
+                    "recommendation_method": recommendation_method.value,
+                    "ratio": ratio,
+                    "pareto": False,
+                }
+                try:
+                    metadata = future.result()
+                    compressed_model = metadata["results"]["compressed_model"]
+                    row.update({key: compressed_model[key] for key in SWEEP_PARETO_KEYS})
+                    row["status"] = metadata["status"]
+                    row["compressed_model_path"] = metadata["compressed_model_path"]
+                except Exception as e:
+                    logger.error(f"Compression {compression_method.value} with ratio {ratio} failed. Error: {e}")
+                    row["status"] = Status.ERROR.value
+                rows.append(row)
+
+        completed_rows = [row for row in rows if row["status"] == Status.COMPLETED]
+        for row, is_pareto in zip(completed_rows, get_pareto_frontier(completed_rows, SWEEP_PARETO_KEYS)):
+            row["pareto"] = is_pareto
+        rows.sort(key=lambda row: (row["status"] != Status.COMPLETED, row.get("flops", 0), row["ratio"]))
+
+        MetadataHandler.save_json(data=rows, folder_path=output_dir, file_name="sweep")
+        columns = ["compression_method", "ratio", *SWEEP_PARETO_KEYS, "pareto", "status"]
+        logger.info(f"Compression sweep results:\n{format_table(rows, columns)}")
+        self.token_handler.log_remaining_credit()
+
+        return rows
 
     def automatic_compression(
         self,
@@ -683,83 +1012,92 @@ class Compressor:
             logger.info("Compressing automatic-based model...")
 
             output_dir = FileHandler.create_unique_folder(folder_path=output_dir)
-            default_model_path, extension = FileHandler.get_path_and_extension(
-                folder_path=output_dir, framework=framework
-            )
             metadata = MetadataHandler.init_metadata(folder_path=output_dir, task_type=TaskType.COMPRESS)
 
-            current_credit = auth_client.get_credit(
-                self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
-            )
+            current_credit = self.token_handler.get_credit()
             check_credit_balance(
                 user_credit=current_credit,
                 service_credit=ServiceCredit.AUTOMATIC_COMPRESSION,
             )
 
-            model_name = Path(output_dir).name
-
-            model = self.upload_model(
-                framework=framework,
-                input_model_path=input_model_path,
-                input_shapes=input_shapes,
+            metadata.update_checkpoint(
+                compression_type=AUTOMATIC,
+                request={
+                    "framework": framework,
+                    "input_shapes": input_shapes,
+                    "input_model_path": input_model_path,
+                    "ratio": compression_ratio,
+                },
             )
+            model = self._run_automatic_compression(metadata, output_dir)
 
-            compressed_model_name = f"{model_name}_automatic_{compression_ratio}"
-            data = AutoCompressionRequest(
-                model_id=model.model_id,
-                model_name=compressed_model_name,
-                recommendation_ratio=compression_ratio,
-                save_path=output_dir,
-            )
-            logger.info("Compressing model...")
-            model_info = compressor_client.auto_compression(
-                data=data, access_token=self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
-            )
-            compression_info = self.get_compression(model_info.original_compression_id)
+            return self._complete_compression(metadata, output_dir, original_model=model)
 
-            self.download_model(
-                model_id=model_info.model_id,
-                local_path=default_model_path.with_suffix(extension),
-            )
-            compressed_model = self.model_factory.create_compressed_model(model_info=model_info)  # TODO: delete
+        except Exception as e:
+            logger.error(f"Automatic compression failed. Error: {e}")
+            metadata.update_status(status=Status.ERROR)
+            MetadataHandler.save_metadata(data=metadata.asdict(), folder_path=output_dir, flush=True)
+            raise e
 
-            converter_uploaded_model = self._get_available_devices(compressed_model, default_model_path)
+        except KeyboardInterrupt:
+            metadata.update_status(status=Status.STOPPED)
+            MetadataHandler.save_metadata(data=metadata.asdict(), folder_path=output_dir, flush=True)
 
-            logger.info(f"Automatic compression successfully. Compressed Model ID: {compressed_model.model_id}")
-            remaining_credit = auth_client.get_credit(
-                self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
-            )
-            logger.info(
-                f"{ServiceCredit.AUTOMATIC_COMPRESSION} credits have been consumed. Remaining Credit: {remaining_credit}"
-            )
+    def resume(self, output_dir: str) -> Dict:
+        """Continue an interrupted compression from its last completed step.
 
-            metadata.update_compressed_model_path(
-                compressed_model_path=default_model_path.with_suffix(extension).as_posix()
-            )
-            if compressed_model.framework in [Framework.PYTORCH, Framework.ONNX]:
-                metadata.update_compressed_onnx_model_path(
-                    compressed_onnx_model_path=default_model_path.with_suffix(".onnx").as_posix()
-                )
-            metadata.update_model_info(task=model.task, framework=framework, input_shapes=input_shapes)
-            metadata.update_compression_info(
-                method=compression_info.compression_method,
-                ratio=compression_ratio,
-                options=compression_info.options,
-                layers=compression_info.available_layers,
-            )
-            metadata.update_results(model=model, compressed_model=compressed_model)
-            metadata.update_status(status=Status.COMPLETED)
-            metadata.update_available_devices(converter_uploaded_model.available_devices)
-            MetadataHandler.save_json(data=metadata.asdict(), folder_path=output_dir)
+        Every compression saves its remote IDs (original model, compression, compressed model and
+        launcher model) in the metadata.json of its output folder after each step. Resuming reuses them,
+        so steps that already ran on the server are not repeated and no credit is spent again.
 
-            return metadata.asdict()
+        Args:
+            output_dir (str): The output folder of the interrupted compression.
+
+        Raises:
+            e: If an error occurs while resuming the compression.
+
+        Returns:
+            Dict: Source model and compressed model information.
+        """
+
+        self.token_handler.validate_token()
+
+        metadata_path = Path(output_dir) / "metadata.json"
+        data = MetadataHandler.load_json(metadata_path)
+        if data.get("task_type") != TaskType.COMPRESS:
+            raise ValueError(f"{metadata_path} is not the metadata of a compression.")
+        if data["status"] == Status.COMPLETED:
+            logger.info("The compression is already completed.")
+            return data
+        checkpoint = data.get("checkpoint") or {}
+        if not checkpoint.get("step"):
+            raise ValueError("The compression stopped before reaching the server. Please run the compression again.")
+
+        metadata = MetadataHandler.get_default_metadata(TaskType.COMPRESS)
+        metadata.update_checkpoint(**checkpoint)
+        metadata.available_devices = [TargetDevice(**device) for device in data.get("available_devices", [])]
+        metadata.update_launcher_model_uuid(data.get("launcher_model_uuid", ""))
+        metadata.launcher_model_input_shape = data.get("launcher_model_input_shape")
+        metadata.launcher_model_data_type = data.get("launcher_model_data_type", "")
+        compression_type = metadata.checkpoint.compression_type
+        runners = {
+            ADVANCED: self._run_advanced_compression,
+            RECOMMENDATION: self._run_recommendation_compression,
+            AUTOMATIC: self._run_automatic_compression,
+        }
+
+        try:
+            logger.info(f"Resuming the compression after the {metadata.checkpoint.step} step...")
+            model = runners[compression_type](metadata, output_dir)
+
+            return self._complete_compression(metadata, output_dir, original_model=model)
 
         except Exception as e:
-            logger.error(f"Automatic compression failed. Error: {e}")
+            logger.error(f"{COMPRESSION_LABELS[compression_type]} failed. Error: {e}")
             metadata.update_status(status=Status.ERROR)
-            MetadataHandler.save_json(data=metadata.asdict(), folder_path=output_dir)
+            MetadataHandler.save_metadata(data=metadata.asdict(), folder_path=output_dir, flush=True)
             raise e
 
         except KeyboardInterrupt:
             metadata.update_status(status=Status.STOPPED)
-            MetadataHandler.save_json(data=metadata.asdict(), folder_path=output_dir)
+            MetadataHandler.save_metadata(data=metadata.asdict(), folder_path=output_dir, flush=True)
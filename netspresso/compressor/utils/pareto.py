@@ -0,0 +1,30 @@
+from typing import Dict, List, Sequence
+
+
+def is_dominated(row: Dict, other: Dict, keys: Sequence[str]) -> bool:
+    """Return True if `other` is no worse than `row` on every key and better on at least one. Lower is better."""
+    return all(other[key] <= row[key] for key in keys) and any(other[key] < row[key] for key in keys)
+
+
+def get_pareto_frontier(rows: List[Dict], keys: Sequence[str]) -> List[bool]:
+    """Flag the rows that are not dominated by any other row on the given keys.
+
+    Args:
+        rows (List[Dict]): The rows to compare.
+        keys (Sequence[str]): The keys to minimize.
+
+    Returns:
+        List[bool]: True for every row on the Pareto frontier, in the order of `rows`.
+    """
+    return [not any(is_dominated(row, other, keys) for other in rows if other is not row) for row in rows]
+
+
+def format_table(rows: List[Dict], columns: Sequence[str]) -> str:
+    """Format the rows as a plain text table with the given columns."""
+    cells = [[str(column) for column in columns]]
+    cells.extend([str(row.get(column, "")) for column in columns] for row in rows)
+    widths = [max(len(line[idx]) for line in cells) for idx in range(len(columns))]
+    lines = ["  ".join(cell.ljust(width) for cell, width in zip(line, widths)) for line in cells]
+    lines.insert(1, "  ".join("-" * width for width in widths))
+
+    return "\n".join(lines)
@@ -0,0 +1,414 @@
+import json
+import os
+import tempfile
+from collections import defaultdict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+from loguru import logger
+
+from netspresso.clients.utils.common import get_file_sha256
+from netspresso.enums import Framework
+from netspresso.utils.lock import atomic_write_text
+
+from ..core.model import InputShape, Model
+
+DEFAULT_CACHE_DIR = Path.home() / ".netspresso" / "cache" / "profiles"
+PROFILE_VERSION = 1
+MEGA = 1e6
+MEGABYTE = 1024 * 1024
+
+# FLOPs per output element of the element-wise operators.
+ELEMENTWISE_FLOPS = {
+    "Add": 1,
+    "Sub": 1,
+    "Mul": 1,
+    "Div": 1,
+    "Relu": 1,
+    "LeakyRelu": 1,
+    "PRelu": 1,
+    "Clip": 1,
+    "Sigmoid": 4,
+    "HardSigmoid": 3,
+    "HardSwish": 4,
+    "Tanh": 5,
+    "Softmax": 3,
+    "BatchNormalization": 2,
+    "InstanceNormalization": 4,
+    "LayerNormalization": 4,
+}
+# BatchNormalization inputs that are statistics, not trained weights.
+NON_TRAINABLE_INPUTS = {"BatchNormalization": [3, 4]}
+
+
+@dataclass
+class LayerProfile:
+    name: str
+    op_type: str
+    flops: float = 0.0
+    parameters: int = 0
+    output_shapes: List[List[int]] = field(default_factory=list)
+    output_memory: int = 0
+
+
+@dataclass
+class ProfileResult:
+    """The local profile of a model.
+
+    Attributes:
+        model_size (float): The size of the model file in MB.
+        flops (float): The FLOPs of the model in millions. A multiply-accumulate counts as two FLOPs.
+        trainable_parameters (float): The number of trainable parameters in millions.
+        non_trainable_parameters (float): The number of non-trainable parameters in millions.
+        number_of_layers (int): The number of layers with parameters.
+        parameter_memory (float): The memory of the parameters in MB.
+        activation_memory (float): The memory of all intermediate outputs in MB.
+        layers (List[LayerProfile]): The per-layer breakdown.
+    """
+
+    model_size: float = 0.0
+    flops: float = 0.0
+    trainable_parameters: float = 0.0
+    non_trainable_parameters: float = 0.0
+    number_of_layers: int = 0
+    parameter_memory: float = 0.0
+    activation_memory: float = 0.0
+    layers: List[LayerProfile] = field(default_factory=list)
+
+    def asdict(self) -> Dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> "ProfileResult":
+        layers = [LayerProfile(**layer) for layer in data.pop("layers", [])]
+        return cls(**data, layers=layers)
+
+    def to_model(self, model_name: str, framework: str, input_shapes: List[InputShape], task: str = "") -> Model:
+        return Model(
+            model_id="",
+            model_name=model_name,
+            task=task,
+            framework=framework,
+            model_size=self.model_size,
+            flops=self.flops,
+            trainable_parameters=self.trainable_parameters,
+            non_trainable_parameters=self.non_trainable_parameters,
+            number_of_layers=self.number_of_layers,
+            input_shapes=input_shapes,
+        )
+
+
+def _import_onnx():
+    try:
+        import onnx
+        from onnx import shape_inference
+    except ImportError as e:
+        raise ImportError("Profiling ONNX and PyTorch models requires onnx. Please run `pip install onnx`.") from e
+    return onnx, shape_inference
+
+
+def _get_dims(value_info) -> Optional[List[int]]:
+    tensor_type = value_info.type.tensor_type
+    if not tensor_type.HasField("shape"):
+        return None
+    dims = [dim.dim_value if dim.HasField("dim_value") else -1 for dim in tensor_type.shape.dim]
+    return None if any(dim < 0 for dim in dims) else dims
+
+
+def _set_input_shapes(graph, initializer_names: set, input_shapes: List[InputShape]) -> None:
+    graph_inputs = [graph_input for graph_input in graph.input if graph_input.name not in initializer_names]
+    for graph_input, input_shape in zip(graph_inputs, input_shapes):
+        shape = [input_shape.batch, input_shape.channel, *input_shape.dimension]
+        dims = graph_input.type.tensor_type.shape.dim
+        if len(dims) != len(shape):
+            continue
+        for dim, value in zip(dims, shape):
+            dim.Clear()
+            dim.dim_value = int(value)
+    # Symbolic dimensions left, ex) a dynamic batch, are profiled with 1.
+    for graph_input in graph_inputs:
+        for dim in graph_input.type.tensor_type.shape.dim:
+            if not dim.HasField("dim_value"):
+                dim.Clear()
+                dim.dim_value = 1
+
+
+def profile_onnx(model_path: Union[str, Path], input_shapes: Optional[List[InputShape]] = None) -> ProfileResult:
+    """Profile an ONNX model from its graph and inferred shapes.
+
+    Args:
+        model_path (Union[str, Path]): The path of the ONNX model.
+        input_shapes (List[InputShape], optional): The input shapes overriding the shapes of the graph inputs.
+
+    Returns:
+        ProfileResult: The profile of the model.
+    """
+    onnx, shape_inference = _import_onnx()
+
+    model = onnx.load(str(model_path))
+    graph = model.graph
+    initializers = {initializer.name: initializer for initializer in graph.initializer}
+    _set_input_shapes(graph, set(initializers), input_shapes or [])
+    graph = shape_inference.infer_shapes(model).graph
+
+    shapes = {}
+    itemsizes = {}
+    for value_info in [*graph.input, *graph.value_info, *graph.output]:
+        dims = _get_dims(value_info)
+        if dims is not None:
+            shapes[value_info.name] = dims
+            elem_type = value_info.type.tensor_type.elem_type
+            itemsizes[value_info.name] = np.dtype(onnx.helper.tensor_dtype_to_np_dtype(elem_type)).itemsize
+    initializer_shapes = {name: list(initializer.dims) for name, initializer in initializers.items()}
+    shapes.update(initializer_shapes)
+
+    # Gather the shape arithmetic of every node into arrays, then compute the FLOPs per operator type at once.
+    layers = []
+    op_rows = defaultdict(list)
+    trainable, non_trainable, parameter_memory = 0, 0, 0
+    counted = set()
+    for node in graph.node:
+        output_shapes = [shapes.get(output) for output in node.output]
+        output_elems = int(np.prod(output_shapes[0])) if output_shapes and output_shapes[0] is not None else 0
+        node_input_shapes = [shapes.get(name) for name in node.input]
+
+        parameters = 0
+        for idx, name in enumerate(node.input):
+            if name not in initializers:
+                continue
+            count = int(np.prod(initializer_shapes[name]))
+            parameters += count
+            # Weights shared by many nodes count once in the totals.
+            if name in counted:
+                continue
+            counted.add(name)
+            parameter_memory += (
+                count * np.dtype(onnx.helper.tensor_dtype_to_np_dtype(initializers[name].data_type)).itemsize
+            )
+            if idx in NON_TRAINABLE_INPUTS.get(node.op_type, []):
+                non_trainable += count
+            else:
+                trainable += count
+
+        output_memory = sum(
+            int(np.prod(shape)) * itemsizes.get(output, 4)
+            for output, shape in zip(node.output, output_shapes)
+            if shape is not None
+        )
+        layer = LayerProfile(
+            name=node.name or node.output[0],
+            op_type=node.op_type,
+            parameters=parameters,
+            output_shapes=[shape for shape in output_shapes if shape is not None],
+            output_memory=output_memory,
+        )
+        layers.append(layer)
+
+        if (
+            node.op_type in ["Conv", "ConvTranspose"]
+            and len(node_input_shapes) > 1
+            and node_input_shapes[1] is not None
+        ):
+            weight = node_input_shapes[1]
+            elems = output_elems if node.op_type == "Conv" else int(np.prod(node_input_shapes[0] or [0]))
+            op_rows["mac"].append((len(layers) - 1, elems, int(np.prod(weight[1:]))))
+        elif node.op_type in ["MatMul", "Gemm"] and node_input_shapes and node_input_shapes[0] is not None:
+            trans_a = any(attr.name == "transA" and attr.i for attr in node.attribute)
+            reduce_dim = (
+                node_input_shapes[0][-2] if trans_a and len(node_input_shapes[0]) > 1 else node_input_shapes[0][-1]
+            )
+            op_rows["mac"].append((len(layers) - 1, output_elems, reduce_dim))
+        elif node.op_type in ["MaxPool", "AveragePool"]:
+            kernel = next((list(attr.ints) for attr in node.attribute if attr.name == "kernel_shape"), [1])
+            op_rows["elementwise"].append((len(layers) - 1, output_elems, int(np.prod(kernel))))
+        elif node.op_type in ["GlobalAveragePool", "GlobalMaxPool", "ReduceMean"] and node_input_shapes[0] is not None:
+            op_rows["elementwise"].append((len(layers) - 1, int(np.prod(node_input_shapes[0])), 1))
+        elif node.op_type in ELEMENTWISE_FLOPS:
+            op_rows["elementwise"].append((len(layers) - 1, output_elems, ELEMENTWISE_FLOPS[node.op_type]))
+
+    for kind, rows in op_rows.items():
+        rows = np.asarray(rows, dtype=np.float64)
+        flops = rows[:, 1] * rows[:, 2] * (2 if kind == "mac" else 1)
+        for layer_idx, layer_flops in zip(rows[:, 0].astype(int), flops):
+            layers[layer_idx].flops = float(layer_flops)
+
+    return ProfileResult(
+        model_size=os.path.getsize(model_path) / MEGABYTE,
+        flops=sum(layer.flops for layer in layers) / MEGA,
+        trainable_parameters=trainable / MEGA,
+        non_trainable_parameters=non_trainable / MEGA,
+        number_of_layers=sum(1 for layer in layers if layer.parameters > 0),
+        parameter_memory=parameter_memory / MEGABYTE,
+        activation_memory=sum(layer.output_memory for layer in layers) / MEGABYTE,
+        layers=layers,
+    )
+
+
+def profile_pytorch(model_path: Union[str, Path], input_shapes: List[InputShape]) -> ProfileResult:
+    """Profile a PyTorch model by exporting it to ONNX in a temporary folder."""
+    try:
+        import torch
+    except ImportError as e:
+        raise ImportError("Profiling PyTorch models requires torch. Please run `pip install torch`.") from e
+    if not input_shapes:
+        raise ValueError("Input shapes are required to profile PyTorch models.")
+
+    from .onnx import _export_onnx
+
+    model = torch.load(model_path)
+    input_shape = input_shapes[0]
+    sample_input = torch.randn((input_shape.batch, input_shape.channel, *input_shape.dimension))
+    sample_input = sample_input.type(next(model.parameters()).dtype)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        onnx_path = Path(tmp_dir) / "model.onnx"
+        _export_onnx(model, onnx_path, sample_input=sample_input)
+        result = profile_onnx(onnx_path, input_shapes)
+
+    result.model_size = os.path.getsize(model_path) / MEGABYTE
+    return result
+
+
+def profile_keras(model_path: Union[str, Path], input_shapes: Optional[List[InputShape]] = None) -> ProfileResult:
+    """Profile a Keras model from its layers."""
+    try:
+        from tensorflow import keras
+    except ImportError as e:
+        raise ImportError("Profiling Keras models requires tensorflow. Please run `pip install tensorflow`.") from e
+
+    model = keras.models.load_model(str(model_path), compile=False)
+    layers = []
+    for layer in model.layers:
+        output_shape = getattr(layer, "output_shape", None)
+        output_shapes = output_shape if isinstance(output_shape, list) else [output_shape]
+        # Keras reports the batch as None, profile it with the given batch or 1.
+        batch = input_shapes[0].batch if input_shapes else 1
+        output_shapes = [[batch if dim is None else dim for dim in shape] for shape in output_shapes if shape]
+        output_elems = int(np.prod(output_shapes[0])) if output_shapes else 0
+
+        macs = 0
+        class_name = type(layer).__name__
+        if class_name in ["Conv1D", "Conv2D", "Conv3D", "DepthwiseConv2D"]:
+            # The kernel is (*kernel_size, in_channels // groups, filters), so it already accounts for the groups.
+            # A depthwise kernel is (*kernel_size, in_channels, depth_multiplier) and sees a single input channel.
+            kernel = layer.get_weights()[0].shape
+            kernel_macs = kernel[:-2] if class_name == "DepthwiseConv2D" else kernel[:-1]
+            macs = output_elems * int(np.prod(kernel_macs))
+        elif class_name == "Dense":
+            macs = output_elems * layer.get_weights()[0].shape[0]
+
+        layers.append(
+            LayerProfile(
+                name=layer.name,
+                op_type=class_name,
+                flops=float(2 * macs),
+                parameters=int(layer.count_params()),
+                output_shapes=output_shapes,
+                output_memory=output_elems * 4,
+            )
+        )
+
+    trainable = sum(int(np.prod(weight.shape)) for weight in model.trainable_weights)
+    non_trainable = sum(int(np.prod(weight.shape)) for weight in model.non_trainable_weights)
+    return ProfileResult(
+        model_size=os.path.getsize(model_path) / MEGABYTE,
+        flops=sum(layer.flops for layer in layers) / MEGA,
+        trainable_parameters=trainable / MEGA,
+        non_trainable_parameters=non_trainable / MEGA,
+        number_of_layers=sum(1 for layer in layers if layer.parameters > 0),
+        parameter_memory=(trainable + non_trainable) * 4 / MEGABYTE,
+        activation_memory=sum(layer.output_memory for layer in layers) / MEGABYTE,
+        layers=layers,
+    )
+
+
+def to_metadata_model(result: ProfileResult) -> Dict[str, Any]:
+    """Convert the profile to the model results of a compression metadata."""
+    return {
+        "size": result.model_size,
+        "flops": result.flops,
+        "number_of_parameters": result.trainable_parameters + result.non_trainable_parameters,
+        "trainable_parameters": result.trainable_parameters,
+        "non_trainable_parameters": result.non_trainable_parameters,
+        "number_of_layers": result.number_of_layers,
+    }
+
+
+def compare_profiles(original: ProfileResult, compressed: ProfileResult) -> Dict[str, Any]:
+    """Build the results of two local profiles in the layout used by `Plotter.compare_profile_result`."""
+    return {
+        "results": {
+            "original_model": to_metadata_model(original),
+            "compressed_model": to_metadata_model(compressed),
+        }
+    }
+
+
+class ModelProfiler:
+    """Profile models locally, without uploading them, caching the results by the SHA-256 of the model file.
+
+    Args:
+        cache_dir (str, optional): The folder where the profiles are cached.
+        use_cache (bool): If False, the cache is neither read nor written.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, use_cache: bool = True) -> None:
+        self.cache_dir = Path(cache_dir or os.getenv("NETSPRESSO_PROFILE_CACHE_DIR", DEFAULT_CACHE_DIR))
+        self.use_cache = use_cache
+
+    def _get_cache_path(self, model_path: str, framework: str, input_shapes: List[InputShape]) -> Path:
+        shapes = "_".join(
+            f"{shape.batch}x{shape.channel}x{'x'.join(map(str, shape.dimension))}" for shape in input_shapes
+        )
+        return self.cache_dir / f"{get_file_sha256(model_path)}_{framework}_{shapes}_v{PROFILE_VERSION}.json"
+
+    def profile(
+        self,
+        model_path: str,
+        framework: Union[str, Framework],
+        input_shapes: Optional[List[Union[Dict[str, Any], InputShape]]] = None,
+    ) -> ProfileResult:
+        """Profile the FLOPs, parameters, memory and layers of the model.
+
+        Args:
+            model_path (str): The file path where the model is located.
+            framework (Union[str, Framework]): The framework of the model. ONNX, PyTorch and Keras are supported.
+            input_shapes (List[Union[Dict[str, Any], InputShape]], optional): Input shapes of the model.
+                Required for PyTorch models.
+
+        Raises:
+            NotImplementedError: If the framework is not supported.
+
+        Returns:
+            ProfileResult: The profile of the model.
+        """
+        input_shapes = [InputShape(**shape) if isinstance(shape, dict) else shape for shape in input_shapes or []]
+        framework = Framework(framework)
+
+        cache_path = self._get_cache_path(model_path, framework.value, input_shapes)
+        if self.use_cache and cache_path.exists():
+            try:
+                with open(cache_path, "r") as f:
+                    return ProfileResult.from_dict(json.load(f))
+            except (OSError, ValueError, TypeError) as e:
+                logger.debug(f"Ignore the broken profile cache {cache_path}. Error: {e}")
+
+        if framework == Framework.ONNX:
+            result = profile_onnx(model_path, input_shapes)
+        elif framework == Framework.PYTORCH:
+            result = profile_pytorch(model_path, input_shapes)
+        elif framework == Framework.TENSORFLOW_KERAS:
+            result = profile_keras(model_path, input_shapes)
+        else:
+            raise NotImplementedError(f"Profiling {framework} models is not supported.")
+
+        if self.use_cache:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_text(cache_path, json.dumps(result.asdict()))
+
+        return result
+
+
+profiler = ModelProfiler()
@@ -1,3 +1,5 @@
+from .async_converter import AsyncConverter
+from .conversion_queue import ConversionJob, ConversionQueue
 from .converter import Converter
 
-__all__ = ["Converter"]
+__all__ = ["Converter", "AsyncConverter", "ConversionQueue", "ConversionJob"]
@@ -0,0 +1,79 @@
+from typing import Dict, Optional, Union
+
+from netspresso.clients.auth import TokenHandler
+from netspresso.clients.auth.schemas.auth import UserInfo
+from netspresso.clients.launcher.schemas.model import ConversionTask, InputShape
+from netspresso.enums import DataType, DeviceName, Framework, SoftwareVersion
+
+from ..utils.executor import AsyncExecutor
+from .converter import Converter
+
+
+class AsyncConverter:
+    def __init__(self, token_handler: TokenHandler, user_info: UserInfo, executor: Optional[AsyncExecutor] = None):
+        """Initialize the AsyncConverter.
+
+        Args:
+            token_handler (TokenHandler): The token handler of the logged in user.
+            user_info (UserInfo): The information of the logged in user.
+            executor (AsyncExecutor, optional): The executor shared by the async modules. A new one is created if None.
+        """
+
+        self.converter = Converter(token_handler=token_handler, user_info=user_info)
+        self.executor = executor if executor is not None else AsyncExecutor()
+
+    async def convert_model(
+        self,
+        input_model_path: str,
+        output_dir: str,
+        target_framework: Union[str, Framework],
+        target_device_name: Union[str, DeviceName],
+        target_data_type: Union[str, DataType] = DataType.FP16,
+        target_software_version: Optional[Union[str, SoftwareVersion]] = None,
+        input_shape: Optional[InputShape] = None,
+        dataset_path: Optional[str] = None,
+        wait_until_done: bool = True,
+    ) -> Dict:
+        """Convert a model to the specified framework without blocking the event loop.
+
+        Args:
+            input_model_path (str): The file path where the model is located. The metadata.json of a compression
+                or a launcher model uuid can be given instead, to convert the model uploaded by the compression.
+            output_dir (str): The local folder path to save the converted model.
+            target_framework (Union[str, Framework]): The target framework name.
+            target_device_name (Union[str, DeviceName]): Target device name.
+            target_data_type (Union[str, DataType]): Data type of the model. Default is DataType.FP16.
+            target_software_version (Union[str, SoftwareVersion], optional): Target software version.
+                Required if target_device_name is one of the Jetson devices.
+            input_shape (InputShape, optional): Target input shape for conversion (e.g., dynamic batch to static batch).
+            dataset_path (str, optional): Path to the dataset. Useful for certain conversions.
+            wait_until_done (bool): If True, wait for the conversion result before returning the function.
+
+        Returns:
+            Dict: Model conversion task dictionary.
+        """
+
+        return await self.executor.run(
+            self.converter.convert_model,
+            input_model_path=input_model_path,
+            output_dir=output_dir,
+            target_framework=target_framework,
+            target_device_name=target_device_name,
+            target_data_type=target_data_type,
+            target_software_version=target_software_version,
+            input_shape=input_shape,
+            dataset_path=dataset_path,
+            wait_until_done=wait_until_done,
+        )
+
+    async def get_conversion_task(self, conversion_task: Union[str, ConversionTask]) -> ConversionTask:
+        """Get the conversion task information with given conversion task or conversion task uuid.
+
+        Args:
+            conversion_task (Union[str, ConversionTask]): Launcher Model Object or the uuid of the conversion task.
+
+        Returns:
+            ConversionTask: Model conversion task dictionary.
+        """
+
+        return await self.executor.run(self.converter.get_conversion_task, conversion_task)
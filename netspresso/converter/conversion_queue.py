@@ -0,0 +1,344 @@
+import json
+import threading
+import time
+import uuid
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass, fields
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from loguru import logger
+
+from netspresso.clients.launcher.schemas.model import InputShape
+from netspresso.enums import DataType, DeviceName, Framework, SoftwareVersion, Status
+
+from ..compressor.utils.pareto import format_table
+from ..utils.lock import FileLock, atomic_write_text
+from .converter import Converter
+
+PENDING = "pending"
+SUMMARY_COLUMNS = [
+    "job_id",
+    "model",
+    "target_device_name",
+    "target_framework",
+    "target_data_type",
+    "status",
+    "attempts",
+    "elapsed",
+    "error",
+]
+
+
+def _value(value):
+    return getattr(value, "value", value)
+
+
+@dataclass
+class ConversionJob:
+    """A conversion of the queue and its progress.
+
+    Attributes:
+        job_id (str): The id of the job in the queue.
+        input_model_path (str): The file path of the model, or the metadata.json of a compression.
+        target_framework (str): The target framework name.
+        target_device_name (str): The target device name.
+        target_data_type (str): The data type of the converted model.
+        target_software_version (str, optional): The software version of the device.
+        input_shape (Dict, optional): The target input shape of the conversion.
+        dataset_path (str, optional): The path of the dataset used by the conversion.
+        output_dir (str): The folder the converted model is saved in.
+        status (str): One of "pending", "in_progress", "completed", "error".
+        attempts (int): The number of times the conversion was started.
+        elapsed (float): Seconds taken by the last attempt.
+        converted_model_path (str, optional): The path of the converted model once completed.
+        error (str, optional): The error of the last failed attempt.
+    """
+
+    job_id: str
+    input_model_path: str
+    target_framework: str
+    target_device_name: str
+    target_data_type: str = DataType.FP16.value
+    target_software_version: Optional[str] = None
+    input_shape: Optional[Dict] = None
+    dataset_path: Optional[str] = None
+    output_dir: str = ""
+    status: str = PENDING
+    attempts: int = 0
+    elapsed: float = 0.0
+    converted_model_path: Optional[str] = None
+    error: Optional[str] = None
+
+    @property
+    def spec(self) -> tuple:
+        return (
+            self.input_model_path,
+            self.target_framework,
+            self.target_device_name,
+            self.target_data_type,
+            self.target_software_version,
+            json.dumps(self.input_shape, sort_keys=True),
+            self.dataset_path,
+        )
+
+    @property
+    def name(self) -> str:
+        parts = [
+            Path(self.input_model_path).stem,
+            self.target_device_name,
+            self.target_framework,
+            self.target_data_type,
+        ]
+        return "_".join(str(part) for part in parts)
+
+
+class ConversionQueue:
+    STATE_FILE_NAME = "queue.json"
+
+    def __init__(
+        self,
+        converter: Converter,
+        output_dir: str = "./outputs/conversion_queue",
+        max_workers: int = 4,
+        device_limits: Optional[Dict[Union[str, DeviceName], int]] = None,
+        default_device_limit: Optional[int] = None,
+    ) -> None:
+        """Initialize the ConversionQueue.
+
+        Up to `max_workers` conversions run at the same time, so the uploads, the waits in the launcher
+        queue and the downloads of different conversions overlap. `device_limits` caps the conversions
+        in flight for a device, so a busy device does not take every worker from the other devices.
+
+        The queue is saved to `queue.json` in `output_dir` every time a job changes. Creating a queue
+        on the same folder loads it, and `run` continues with the jobs that were not completed,
+        including the jobs that were in progress when the process stopped.
+
+        Args:
+            converter (Converter): The converter running the conversions.
+            output_dir (str): The folder of the queue state and the converted models.
+            max_workers (int): The maximum number of conversions running at the same time.
+            device_limits (Dict[Union[str, DeviceName], int], optional): The maximum number of conversions
+                in flight per device name.
+            default_device_limit (int, optional): The limit of the devices missing from device_limits. No limit if None.
+        """
+
+        self.converter = converter
+        self.output_dir = Path(output_dir)
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.state_path = self.output_dir / self.STATE_FILE_NAME
+        self.max_workers = max_workers
+        self.device_limits = {_value(device): limit for device, limit in (device_limits or {}).items()}
+        self.default_device_limit = default_device_limit
+        self.jobs: List[ConversionJob] = []
+        self._started_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self) -> None:
+        """Load the jobs saved in the queue folder. Jobs left in progress are pending again."""
+        if not self.state_path.exists():
+            return
+
+        with FileLock(self.state_path, shared=True):
+            state = json.loads(self.state_path.read_text(encoding="utf-8"))
+
+        names = {job_field.name for job_field in fields(ConversionJob)}
+        self.jobs = [ConversionJob(**{k: v for k, v in job.items() if k in names}) for job in state["jobs"]]
+        for job in self.jobs:
+            if job.status == Status.IN_PROGRESS:
+                job.status = PENDING
+        logger.info(f"Loaded {len(self.jobs)} conversion jobs from {self.state_path}")
+
+    def save(self) -> None:
+        """Save the jobs to the queue folder."""
+        with self._lock:
+            text = json.dumps({"jobs": [asdict(job) for job in self.jobs]}, indent=4)
+        with FileLock(self.state_path):
+            atomic_write_text(self.state_path, text)
+
+    def add(
+        self,
+        input_model_path: str,
+        target_framework: Union[str, Framework],
+        target_device_name: Union[str, DeviceName],
+        target_data_type: Union[str, DataType] = DataType.FP16,
+        target_software_version: Optional[Union[str, SoftwareVersion]] = None,
+        input_shape: Optional[InputShape] = None,
+        dataset_path: Optional[str] = None,
+    ) -> ConversionJob:
+        """Add a conversion to the queue.
+
+        Adding a conversion already in the queue returns the existing job, so a script adding its
+        conversions can be run again after a restart without converting the models twice.
+
+        Args:
+            input_model_path (str): The file path where the model is located, or the metadata.json of a compression.
+            target_framework (Union[str, Framework]): The target framework name.
+            target_device_name (Union[str, DeviceName]): Target device name.
+            target_data_type (Union[str, DataType]): Data type of the model. Default is DataType.FP16.
+            target_software_version (Union[str, SoftwareVersion], optional): Target software version.
+                Required if target_device_name is one of the Jetson devices.
+            input_shape (InputShape, optional): Target input shape for conversion.
+            dataset_path (str, optional): Path to the dataset. Useful for certain conversions.
+
+        Returns:
+            ConversionJob: The job of the conversion.
+        """
+        job = ConversionJob(
+            job_id=uuid.uuid4().hex[:8],
+            input_model_path=Path(input_model_path).as_posix(),
+            target_framework=_value(target_framework),
+            target_device_name=_value(target_device_name),
+            target_data_type=_value(target_data_type),
+            target_software_version=_value(target_software_version),
+            input_shape=input_shape.dict() if input_shape is not None else None,
+            dataset_path=dataset_path,
+        )
+        for existing_job in self.jobs:
+            if existing_job.spec == job.spec:
+                return existing_job
+
+        job.output_dir = (self.output_dir / f"{job.job_id}_{job.name}").as_posix()
+        with self._lock:
+            self.jobs.append(job)
+        self.save()
+
+        return job
+
+    def add_many(self, specs: List[Dict]) -> List[ConversionJob]:
+        """Add many conversions to the queue.
+
+        Args:
+            specs (List[Dict]): The keyword arguments of `add` for every conversion.
+
+        Returns:
+            List[ConversionJob]: The jobs of the conversions.
+        """
+        return [self.add(**spec) for spec in specs]
+
+    def _get_device_limit(self, device_name: str) -> Optional[int]:
+        return self.device_limits.get(device_name, self.default_device_limit)
+
+    def _next_jobs(self, in_flight: Counter, running: int) -> List[ConversionJob]:
+        next_jobs = []
+        for job in self.jobs:
+            if running + len(next_jobs) >= self.max_workers:
+                break
+            if job.status != PENDING:
+                continue
+            limit = self._get_device_limit(job.target_device_name)
+            if limit is not None and in_flight[job.target_device_name] >= limit:
+                continue
+            in_flight[job.target_device_name] += 1
+            next_jobs.append(job)
+        return next_jobs
+
+    def _run_job(self, job: ConversionJob) -> Dict:
+        return self.converter.convert_model(
+            input_model_path=job.input_model_path,
+            output_dir=job.output_dir,
+            target_framework=job.target_framework,
+            target_device_name=job.target_device_name,
+            target_data_type=job.target_data_type,
+            target_software_version=job.target_software_version,
+            input_shape=InputShape(**job.input_shape) if job.input_shape is not None else None,
+            dataset_path=job.dataset_path,
+        )
+
+    def _start(self, executor: ThreadPoolExecutor, job: ConversionJob) -> Future:
+        logger.info(f"Start conversion job {job.job_id} ({job.name})")
+        with self._lock:
+            job.status = Status.IN_PROGRESS.value
+            job.attempts += 1
+            job.error = None
+            self._started_at[job.job_id] = time.monotonic()
+        return executor.submit(self._run_job, job)
+
+    def _finish(self, job: ConversionJob, future: Future) -> None:
+        with self._lock:
+            job.elapsed = round(time.monotonic() - self._started_at.pop(job.job_id), 1)
+            try:
+                conversion = future.result()
+                job.converted_model_path = conversion["converted_model_path"]
+                job.status = Status.COMPLETED.value
+            except Exception as e:
+                logger.error(f"Conversion job {job.job_id} ({job.name}) failed. Error: {e}")
+                job.status = Status.ERROR.value
+                job.error = str(e)
+
+    def run(self, retry_failed: bool = False) -> List[ConversionJob]:
+        """Run the pending conversions of the queue.
+
+        Failed conversions are recorded in their job and do not stop the other conversions.
+
+        Args:
+            retry_failed (bool): If True, the conversions that failed in a previous run are started again.
+
+        Returns:
+            List[ConversionJob]: Every job of the queue.
+        """
+        if retry_failed:
+            for job in self.jobs:
+                if job.status == Status.ERROR:
+                    job.status = PENDING
+
+        pending = sum(job.status == PENDING for job in self.jobs)
+        logger.info(f"Running {pending} of {len(self.jobs)} conversion jobs with {self.max_workers} workers...")
+
+        futures: Dict[Future, ConversionJob] = {}
+        in_flight = Counter()
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        interrupted = False
+        try:
+            while True:
+                for job in self._next_jobs(in_flight, len(futures)):
+                    futures[self._start(executor, job)] = job
+                if not futures:
+                    break
+                self.save()
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    job = futures.pop(future)
+                    in_flight[job.target_device_name] -= 1
+                    self._finish(job, future)
+                self.save()
+
+        except KeyboardInterrupt:
+            # Return to the caller without waiting for the running conversions. Their jobs stay
+            # in progress in queue.json and are pending again when the queue is loaded.
+            interrupted = True
+            with self._lock:
+                for future, job in futures.items():
+                    if future.cancel():
+                        job.status = PENDING
+                        self._started_at.pop(job.job_id, None)
+            self.save()
+            raise
+        finally:
+            executor.shutdown(wait=not interrupted)
+
+        logger.info(f"Conversion queue results:\n{self.summary()}")
+
+        return self.jobs
+
+    def summary(self) -> str:
+        """Get a table of the jobs of the queue and their status.
+
+        Returns:
+            str: The table, followed by the number of jobs per status.
+        """
+        with self._lock:
+            rows = [
+                {**asdict(job), "model": Path(job.input_model_path).name, "error": job.error or ""} for job in self.jobs
+            ]
+            counts = Counter(job.status for job in self.jobs)
+
+        for row in rows:
+            if len(row["error"]) > 60:
+                row["error"] = row["error"][:57] + "..."
+        totals = ", ".join(f"{status}: {count}" for status, count in sorted(counts.items()))
+
+        return f"{format_table(rows, SUMMARY_COLUMNS)}\n{totals}"
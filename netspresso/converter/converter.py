@@ -1,15 +1,14 @@
-import time
+import uuid
 from pathlib import Path
 from typing import Dict, Optional, Union
-from urllib import request
 
 from loguru import logger
 
-from netspresso.clients.auth import TokenHandler, auth_client
+from netspresso.clients.auth import TokenHandler
 from netspresso.clients.auth.schemas.auth import UserInfo
 from netspresso.clients.launcher import launcher_client
 from netspresso.clients.launcher.schemas import TargetDeviceFilter
-from netspresso.clients.launcher.schemas.model import ConversionTask, InputShape, Model
+from netspresso.clients.launcher.schemas.model import ConversionTask, InputShape, Model, TargetDevice
 from netspresso.enums import (
     DataType,
     DeviceName,
@@ -24,14 +23,35 @@ from netspresso.enums import (
 
 from ..utils import FileHandler, check_credit_balance
 from ..utils.metadata import MetadataHandler
+from ..utils.poller import BackoffPolicy, JobPoller
 
 
 class Converter:
-    def __init__(self, token_handler: TokenHandler, user_info: UserInfo):
-        """Initialize the Converter."""
+    def __init__(
+        self, token_handler: TokenHandler, user_info: UserInfo, polling_policy: Optional[BackoffPolicy] = None
+    ):
+        """Initialize the Converter.
+
+        Args:
+            token_handler (TokenHandler): The token handler of the logged in user.
+            user_info (UserInfo): The information of the logged in user.
+            polling_policy (BackoffPolicy, optional): The intervals and timeout used while waiting for conversions.
+        """
 
         self.token_handler = token_handler
         self.user_info = user_info
+        self.polling_policy = polling_policy if polling_policy is not None else BackoffPolicy()
+
+    def _create_poller(self) -> JobPoller:
+        return JobPoller(
+            fetch=self.get_conversion_task,
+            is_done=lambda task: task.status not in [TaskStatus.IN_QUEUE, TaskStatus.IN_PROGRESS],
+            get_status=lambda task: task.status,
+            policy=self.polling_policy,
+            on_status_change=lambda task_uuid, _, status, __: logger.info(
+                f"Conversion task {task_uuid} status: {status}"
+            ),
+        )
 
     def _download_converted_model(self, conversion_task: ConversionTask, local_path: str) -> None:
         """Download the converted model with given conversion task or conversion task uuid.
@@ -56,13 +76,80 @@ class Converter:
                 access_token=self.token_handler.tokens.access_token,
                 verify_ssl=self.token_handler.verify_ssl,
             )
-            request.urlretrieve(download_url, local_path)
+            FileHandler.download_file(download_url, local_path, verify=self.token_handler.verify_ssl)
             logger.info(f"Model downloaded at {Path(local_path)}")
 
         except Exception as e:
             logger.error(f"Download converted model failed. Error: {e}")
             raise e
 
+    @staticmethod
+    def _is_model_uuid(input_model: str) -> bool:
+        if Path(input_model).exists():
+            return False
+        try:
+            uuid.UUID(input_model)
+        except ValueError:
+            return False
+        return True
+
+    @staticmethod
+    def _get_compression_input_shape(metadata: Dict) -> Optional[InputShape]:
+        if metadata.get("launcher_model_input_shape"):
+            return InputShape(**metadata["launcher_model_input_shape"])
+
+        # Compressions saved without the launcher model info only record the input shapes of the compression.
+        input_shapes = metadata.get("model_info", {}).get("input_shapes") or []
+        if not input_shapes or not input_shapes[0].get("dimension"):
+            return None
+        input_shape = input_shapes[0]
+        return InputShape(
+            batch=input_shape["batch"],
+            channel=input_shape["channel"],
+            input_size=", ".join(str(size) for size in input_shape["dimension"]),
+        )
+
+    def _get_launcher_model(self, input_model: str) -> Model:
+        """Get the launcher model to convert, uploading the model file only if it is not on the launcher yet.
+
+        Args:
+            input_model (str): The model file path, the path of a compression metadata.json or a launcher model uuid.
+
+        Returns:
+            Model: The launcher model. Only the uuid is known for a model given by uuid, the launcher has no
+                endpoint to look it up, so its input shape has to be given to the conversion.
+        """
+
+        if self._is_model_uuid(input_model):
+            logger.info(f"Convert the launcher model. Model UUID: {input_model}")
+            return Model(model_uuid=input_model)
+
+        FileHandler.check_input_model_path(input_model)
+
+        if Path(input_model).suffix == ".json":
+            metadata = MetadataHandler.load_json(input_model)
+            if metadata.get("task_type") != TaskType.COMPRESS:
+                raise ValueError(f"The metadata is not the result of a compression. Metadata path: {input_model}")
+            if metadata.get("launcher_model_uuid"):
+                logger.info(
+                    f"Reuse the launcher model of the compression. Model UUID: {metadata['launcher_model_uuid']}"
+                )
+                return Model(
+                    framework=Framework.ONNX if metadata["compressed_onnx_model_path"] else None,
+                    input_shape=self._get_compression_input_shape(metadata),
+                    data_type=metadata.get("launcher_model_data_type") or None,
+                    model_uuid=metadata["launcher_model_uuid"],
+                    available_devices=[TargetDevice(**device) for device in metadata["available_devices"]],
+                )
+            input_model = metadata["compressed_onnx_model_path"] or metadata["compressed_model_path"]
+
+        return launcher_client.upload_model(
+            model_file_path=input_model,
+            target_function=Module.CONVERT,
+            access_token=self.token_handler.tokens.access_token,
+            verify_ssl=self.token_handler.verify_ssl,
+        )
+
     def convert_model(
         self,
         input_model_path: str,
@@ -78,7 +165,8 @@ class Converter:
         """Convert a model to the specified framework.
 
         Args:
-            input_model_path (str): The file path where the model is located.
+            input_model_path (str): The file path where the model is located. The metadata.json of a compression
+                or a launcher model uuid can be given instead, to convert the model uploaded by the compression.
             output_dir (str): The local folder path to save the converted model.
             target_framework (Union[str, Framework]): The target framework name.
             target_device_name (Union[str, DeviceName]): Target device name. Required if target_device is not specified.
@@ -97,7 +185,8 @@ class Converter:
             Dict: Model conversion task dictionary.
         """
 
-        FileHandler.check_input_model_path(input_model_path)
+        if not self._is_model_uuid(input_model_path):
+            FileHandler.check_input_model_path(input_model_path)
 
         self.token_handler.validate_token()
 
@@ -108,35 +197,20 @@ class Converter:
             )
             metadata = MetadataHandler.init_metadata(folder_path=output_dir, task_type=TaskType.CONVERT)
 
-            current_credit = auth_client.get_credit(
-                self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
-            )
+            current_credit = self.token_handler.get_credit()
             check_credit_balance(user_credit=current_credit, service_credit=ServiceCredit.MODEL_CONVERT)
-            model = launcher_client.upload_model(
-                model_file_path=input_model_path,
-                target_function=Module.CONVERT,
-                access_token=self.token_handler.tokens.access_token,
-                verify_ssl=self.token_handler.verify_ssl,
-            )
+            model = self._get_launcher_model(input_model_path)
 
-            model_uuid = model
-            if type(model) is Model:
-                model_uuid = model.model_uuid
-                if input_shape is None and model.input_shape is not None:
-                    input_shape = model.input_shape
-                if target_framework is None and model.framework is not None:
-                    target_framework = model.framework
+            if input_shape is None and model.input_shape is not None:
+                input_shape = model.input_shape
+            if target_framework is None and model.framework is not None:
+                target_framework = model.framework
 
-            elif target_device_name in DeviceName.JETSON_DEVICES and target_software_version is None:
+            if target_device_name in DeviceName.JETSON_DEVICES and target_software_version is None:
                 raise NotImplementedError(
                     "The conversion is unavailable. Please set JetPack version with target_software_version for Jetson Devices."
                 )
 
-            if type(model) is not Model:
-                raise NotImplementedError(
-                    "The conversion is unavailable. Please set target_device while using model's uuid string for the conversion."
-                )
-
             # Check available int8 converting devices
             if target_data_type == DataType.INT8:
                 if target_device_name not in DeviceName.AVAILABLE_INT8_DEVICES:
@@ -145,14 +219,17 @@ class Converter:
                 if target_device_name in DeviceName.ONLY_INT8_DEVICES:
                     raise Exception(f"{DeviceName.ONLY_INT8_DEVICES} only support int8 data types.")
 
-            devices = TargetDeviceFilter.filter_devices_with_device_name(
-                name=target_device_name, devices=model.available_devices
-            )
-
-            if target_device_name in DeviceName.JETSON_DEVICES:
-                devices = TargetDeviceFilter.filter_devices_with_device_software_version(
-                    software_version=target_software_version, devices=devices
+            if model.available_devices:
+                devices = TargetDeviceFilter.filter_devices_with_device_name(
+                    name=target_device_name, devices=model.available_devices
                 )
+                if target_device_name in DeviceName.JETSON_DEVICES:
+                    devices = TargetDeviceFilter.filter_devices_with_device_software_version(
+                        software_version=target_software_version, devices=devices
+                    )
+            else:
+                # The available devices of a model given by uuid are unknown, the launcher validates the device.
+                devices = [TargetDevice(device_name=target_device_name, software_version=target_software_version)]
 
             if len(devices) < 1:
                 raise NotImplementedError(
@@ -165,7 +242,7 @@ class Converter:
 
             conversion_task = launcher_client.convert_model(
                 user_uuid=self.user_info.user_id,
-                model_uuid=model_uuid,
+                model_uuid=model.model_uuid,
                 input_shape=input_shape,
                 target_framework=target_framework,
                 target_device=target_device.device_name,
@@ -179,12 +256,7 @@ class Converter:
             conversion_task = self.get_conversion_task(conversion_task)
 
             if wait_until_done:
-                while conversion_task.status in [
-                    TaskStatus.IN_QUEUE,
-                    TaskStatus.IN_PROGRESS,
-                ]:
-                    conversion_task = self.get_conversion_task(conversion_task)
-                    time.sleep(1)
+                conversion_task = self._create_poller().wait(conversion_task.convert_task_uuid)
 
             self._download_converted_model(conversion_task, default_model_path.with_suffix(extension))
 
@@ -215,26 +287,21 @@ class Converter:
             )
             metadata.update_status(status=Status.COMPLETED)
             metadata.update_available_devices(converter_uploaded_model.available_devices)
-            MetadataHandler.save_json(data=metadata.asdict(), folder_path=output_dir)
+            MetadataHandler.save_metadata(data=metadata.asdict(), folder_path=output_dir, flush=True)
 
-            remaining_credit = auth_client.get_credit(
-                self.token_handler.tokens.access_token, verify_ssl=self.token_handler.verify_ssl
-            )
-            logger.info(
-                f"{ServiceCredit.MODEL_CONVERT} credits have been consumed. Remaining Credit: {remaining_credit}"
-            )
+            self.token_handler.consume_credit(ServiceCredit.MODEL_CONVERT)
 
             return metadata.asdict()
 
         except Exception as e:
             logger.error(f"Convert failed. Error: {e}")
             metadata.update_status(status=Status.ERROR)
-            MetadataHandler.save_json(data=metadata.asdict(), folder_path=output_dir)
+            MetadataHandler.save_metadata(data=metadata.asdict(), folder_path=output_dir, flush=True)
             raise e
 
         except KeyboardInterrupt:
             metadata.update_status(status=Status.STOPPED)
-            MetadataHandler.save_json(data=metadata.asdict(), folder_path=output_dir)
+            MetadataHandler.save_metadata(data=metadata.asdict(), folder_path=output_dir, flush=True)
 
     def get_conversion_task(self, conversion_task: Union[str, ConversionTask]) -> ConversionTask:
         """Get the conversion task information with given conversion task or conversion task uuid.
@@ -3,7 +3,7 @@ from netspresso.clients.compressor.schemas.compression import Options
 from .compression import CompressionMethod, GroupPolicy, LayerNorm, Policy, RecommendationMethod, StepOp
 from .credit import ServiceCredit
 from .device import DeviceName, HardwareType, SoftwareVersion, TaskStatus
-from .metadata import Status, TaskType
+from .metadata import CompressionStep, Status, TaskType
 from .model import DataType, Extension, Framework, OriginFrom
 from .module import Module
 from .tao.action import ConvertAction, ExperimentAction
@@ -13,6 +13,7 @@ __all__ = [
     "ServiceCredit",
     "TaskType",
     "Status",
+    "CompressionStep",
     "CompressionMethod",
     "RecommendationMethod",
     "Policy",
@@ -13,3 +13,15 @@ class Status(str, Enum):
     COMPLETED = "completed"
     STOPPED = "stopped"
     ERROR = "error"
+
+
+class CompressionStep(str, Enum):
+    UPLOADED = "uploaded"
+    CREATED = "created"
+    COMPRESSED = "compressed"
+    DOWNLOADED = "downloaded"
+    CONVERTED = "converted"
+
+    @property
+    def order(self) -> int:
+        return list(CompressionStep).index(self)
@@ -1,27 +1,37 @@
-from typing import Optional, Union
+from typing import TYPE_CHECKING, Dict, Optional, Union
 
-from netspresso.benchmarker import Benchmarker
-from netspresso.clients.auth import TokenHandler, auth_client
+from netspresso.benchmarker import AsyncBenchmarker, BenchmarkBackend, Benchmarker
+from netspresso.clients.auth import TokenHandler
 from netspresso.clients.auth.schemas import UserInfo
 from netspresso.clients.tao import TAOTokenHandler
-from netspresso.compressor import Compressor
-from netspresso.converter import Converter
+from netspresso.compressor import AsyncCompressor, Compressor
+from netspresso.converter import AsyncConverter, ConversionQueue, Converter
 from netspresso.enums import Task
-from netspresso.tao import TAOTrainer
-from netspresso.trainer import Trainer
+from netspresso.pipeline import Pipeline
+from netspresso.utils.executor import AsyncExecutor
+
+if TYPE_CHECKING:
+    # Imported on first use, the trainers pull in torch and netspresso_trainer.
+    from netspresso.tao import TAOTrainer
+    from netspresso.trainer import Trainer
 
 
 class NetsPresso:
-    def __init__(self, email: str, password: str, verify_ssl: bool = True) -> None:
+    def __init__(self, email: str, password: str, verify_ssl: bool = True, defer_credit_log: bool = False) -> None:
         """Initialize NetsPresso instance and perform user authentication.
 
         Args:
             email (str): User's email for authentication.
             password (str): User's password for authentication.
             verify_ssl (bool): Flag to indicate whether SSL certificates should be verified. Defaults to True.
+            defer_credit_log (bool): If True, the remaining credit is not looked up after every task.
+                Call `log_remaining_credit` to log the credits consumed so far. Defaults to False.
         """
-        self.token_handler = TokenHandler(email=email, password=password, verify_ssl=verify_ssl)
+        self.token_handler = TokenHandler(
+            email=email, password=password, verify_ssl=verify_ssl, defer_credit_log=defer_credit_log
+        )
         self.user_info = self.get_user()
+        self.async_executor = None
 
     def get_user(self) -> UserInfo:
         """Get user information using the access token.
@@ -29,10 +39,18 @@ class NetsPresso:
         Returns:
             UserInfo: User information.
         """
-        user_info = auth_client.get_user_info(self.token_handler.tokens.access_token, self.token_handler.verify_ssl)
+        user_info = self.token_handler.get_user_info()
         return user_info
 
-    def trainer(self, task: Optional[Union[str, Task]] = None, yaml_path: Optional[str] = None) -> Trainer:
+    def log_remaining_credit(self) -> Optional[int]:
+        """Log the credits consumed since the last call together with the remaining credit.
+
+        Returns:
+            Optional[int]: The remaining credit, or None if no credit was consumed.
+        """
+        return self.token_handler.log_remaining_credit()
+
+    def trainer(self, task: Optional[Union[str, Task]] = None, yaml_path: Optional[str] = None) -> "Trainer":
         """Initialize and return a Trainer instance.
 
         Args:
@@ -42,6 +60,8 @@ class NetsPresso:
         Returns:
             Trainer: Initialized Trainer instance.
         """
+        from netspresso.trainer import Trainer
+
         return Trainer(task=task, yaml_path=yaml_path)
 
     def compressor(self) -> Compressor:
@@ -60,13 +80,97 @@ class NetsPresso:
         """
         return Converter(token_handler=self.token_handler, user_info=self.user_info)
 
-    def benchmarker(self) -> Benchmarker:
+    def benchmarker(self, backend: Optional[BenchmarkBackend] = None) -> Benchmarker:
         """Initialize and return a Benchmarker instance.
 
+        Args:
+            backend (BenchmarkBackend, optional): The backend running the benchmarks. Defaults to the device farm.
+
         Returns:
             Benchmarker: Initialized Benchmarker instance.
         """
-        return Benchmarker(token_handler=self.token_handler, user_info=self.user_info)
+        return Benchmarker(token_handler=self.token_handler, user_info=self.user_info, backend=backend)
+
+    def pipeline(self, max_workers: int = 4) -> Pipeline:
+        """Initialize and return a Pipeline instance.
+
+        Args:
+            max_workers (int): The maximum number of targets processed at the same time.
+
+        Returns:
+            Pipeline: Initialized Pipeline instance.
+        """
+        return Pipeline(token_handler=self.token_handler, user_info=self.user_info, max_workers=max_workers)
+
+    def conversion_queue(
+        self,
+        output_dir: str = "./outputs/conversion_queue",
+        max_workers: int = 4,
+        device_limits: Optional[Dict[str, int]] = None,
+        default_device_limit: Optional[int] = None,
+    ) -> ConversionQueue:
+        """Initialize and return a ConversionQueue instance, loading the queue saved in output_dir.
+
+        Args:
+            output_dir (str): The folder of the queue state and the converted models.
+            max_workers (int): The maximum number of conversions running at the same time.
+            device_limits (Dict[str, int], optional): The maximum number of conversions in flight per device name.
+            default_device_limit (int, optional): The limit of the devices missing from device_limits.
+
+        Returns:
+            ConversionQueue: Initialized ConversionQueue instance.
+        """
+        return ConversionQueue(
+            converter=self.converter(),
+            output_dir=output_dir,
+            max_workers=max_workers,
+            device_limits=device_limits,
+            default_device_limit=default_device_limit,
+        )
+
+    def get_async_executor(self) -> AsyncExecutor:
+        """Return the executor shared by the async modules, creating it on first use.
+
+        Returns:
+            AsyncExecutor: Shared AsyncExecutor instance.
+        """
+        if self.async_executor is None:
+            self.async_executor = AsyncExecutor()
+        return self.async_executor
+
+    def async_compressor(self) -> AsyncCompressor:
+        """Initialize and return an AsyncCompressor instance.
+
+        Returns:
+            AsyncCompressor: Initialized AsyncCompressor instance.
+        """
+        return AsyncCompressor(token_handler=self.token_handler, executor=self.get_async_executor())
+
+    def async_converter(self) -> AsyncConverter:
+        """Initialize and return an AsyncConverter instance.
+
+        Returns:
+            AsyncConverter: Initialized AsyncConverter instance.
+        """
+        return AsyncConverter(
+            token_handler=self.token_handler, user_info=self.user_info, executor=self.get_async_executor()
+        )
+
+    def async_benchmarker(self, backend: Optional[BenchmarkBackend] = None) -> AsyncBenchmarker:
+        """Initialize and return an AsyncBenchmarker instance.
+
+        Args:
+            backend (BenchmarkBackend, optional): The backend running the benchmarks. Defaults to the device farm.
+
+        Returns:
+            AsyncBenchmarker: Initialized AsyncBenchmarker instance.
+        """
+        return AsyncBenchmarker(
+            token_handler=self.token_handler,
+            user_info=self.user_info,
+            executor=self.get_async_executor(),
+            backend=backend,
+        )
 
 
 class TAO:
@@ -79,10 +183,12 @@ class TAO:
         self.ngc_api_key = ngc_api_key
         self.token_handler = TAOTokenHandler(ngc_api_key=ngc_api_key)
 
-    def trainer(self) -> TAOTrainer:
+    def trainer(self) -> "TAOTrainer":
         """Initialize and return a Trainer instance.
 
         Returns:
             TAO: Initialized Trainer instance.
         """
+        from netspresso.tao import TAOTrainer
+
         return TAOTrainer(token_handler=self.token_handler)
@@ -0,0 +1,3 @@
+from .pipeline import Pipeline, PipelineTarget
+
+__all__ = ["Pipeline", "PipelineTarget"]
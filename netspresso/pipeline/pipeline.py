@@ -0,0 +1,259 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+from loguru import logger
+
+from netspresso.benchmarker import Benchmarker
+from netspresso.clients.auth import TokenHandler
+from netspresso.clients.auth.schemas import UserInfo
+from netspresso.clients.compressor.schemas.compression import Options
+from netspresso.compressor import Compressor
+from netspresso.converter import Converter
+from netspresso.enums import CompressionMethod, DataType, DeviceName, Framework, RecommendationMethod, Status
+from netspresso.enums.device import HardwareType, SoftwareVersion
+
+from ..utils import FileHandler
+from ..utils.metadata import MetadataWriter
+
+
+@dataclass
+class PipelineTarget:
+    """A conversion target of the pipeline, optionally benchmarked after the conversion.
+
+    Attributes:
+        target_framework (Framework): The target framework of the conversion.
+        target_device_name (DeviceName): The target device of the conversion and the benchmark.
+        target_data_type (DataType): The data type of the converted model.
+        target_software_version (SoftwareVersion, optional): The software version of the device.
+        target_hardware_type (HardwareType, optional): The hardware type used for the benchmark.
+        benchmark (bool): If True, benchmark the converted model on the target device.
+    """
+
+    target_framework: Union[str, Framework]
+    target_device_name: Union[str, DeviceName]
+    target_data_type: Union[str, DataType] = DataType.FP16
+    target_software_version: Optional[Union[str, SoftwareVersion]] = None
+    target_hardware_type: Optional[Union[str, HardwareType]] = None
+    benchmark: bool = True
+
+    @property
+    def name(self) -> str:
+        parts = [self.target_device_name, self.target_framework, self.target_data_type, self.target_software_version]
+        return "_".join(str(getattr(part, "value", part)) for part in parts if part is not None)
+
+
+class Pipeline:
+    def __init__(self, token_handler: TokenHandler, user_info: UserInfo, max_workers: int = 4) -> None:
+        """Initialize the Pipeline.
+
+        The pipeline compresses the input model once, then converts it for every target concurrently.
+        Each target is benchmarked as soon as its own conversion finishes, so the total time is bounded
+        by the slowest target. The conversions start from the launcher model uploaded by the compression,
+        and the other models are reused through the upload cache instead of being uploaded again.
+
+        Args:
+            token_handler (TokenHandler): The token handler of the logged in user.
+            user_info (UserInfo): The information of the logged in user.
+            max_workers (int): The maximum number of targets processed at the same time.
+        """
+
+        self.token_handler = token_handler
+        self.user_info = user_info
+        self.max_workers = max_workers
+        self.compressor = Compressor(token_handler=token_handler)
+        self.converter = Converter(token_handler=token_handler, user_info=user_info)
+        self.benchmarker = Benchmarker(token_handler=token_handler, user_info=user_info)
+        self.compression: Optional[Dict[str, Any]] = None
+        self.targets: List[PipelineTarget] = []
+
+    def compress(
+        self,
+        compression_method: CompressionMethod,
+        recommendation_method: RecommendationMethod,
+        recommendation_ratio: float,
+        input_shapes: List[Dict[str, int]],
+        framework: Framework = Framework.PYTORCH,
+        options: Options = Options(),
+        dataset_path: Optional[str] = None,
+    ) -> "Pipeline":
+        """Compress the input model with a recommendation before the conversions.
+
+        Args:
+            compression_method (CompressionMethod): The selected compression method.
+            recommendation_method (RecommendationMethod): The selected recommendation method.
+            recommendation_ratio (float): The compression ratio recommended by the recommendation method.
+            input_shapes (List[Dict[str, int]]): Input shapes of the model.
+            framework (Framework, optional): The framework of the model.
+            options(Options, optional): The options for pruning method.
+            dataset_path (str, optional): The path of the dataset used for nuclear norm compression method.
+
+        Returns:
+            Pipeline: The pipeline itself.
+        """
+        self.compression = {
+            "function": self.compressor.recommendation_compression,
+            "kwargs": {
+                "compression_method": compression_method,
+                "recommendation_method": recommendation_method,
+                "recommendation_ratio": recommendation_ratio,
+                "input_shapes": input_shapes,
+                "framework": framework,
+                "options": options,
+                "dataset_path": dataset_path,
+            },
+        }
+        return self
+
+    def automatic_compress(
+        self,
+        input_shapes: List[Dict[str, int]],
+        framework: Framework = Framework.PYTORCH,
+        compression_ratio: float = 0.5,
+    ) -> "Pipeline":
+        """Compress the input model automatically before the conversions.
+
+        Args:
+            input_shapes (List[Dict[str, int]]): Input shapes of the model.
+            framework (Framework, optional): The framework of the model.
+            compression_ratio (float, optional): The compression ratio for automatic compression.
+
+        Returns:
+            Pipeline: The pipeline itself.
+        """
+        self.compression = {
+            "function": self.compressor.automatic_compression,
+            "kwargs": {
+                "input_shapes": input_shapes,
+                "framework": framework,
+                "compression_ratio": compression_ratio,
+            },
+        }
+        return self
+
+    def add_target(
+        self,
+        target_framework: Union[str, Framework],
+        target_device_name: Union[str, DeviceName],
+        target_data_type: Union[str, DataType] = DataType.FP16,
+        target_software_version: Optional[Union[str, SoftwareVersion]] = None,
+        target_hardware_type: Optional[Union[str, HardwareType]] = None,
+        benchmark: bool = True,
+    ) -> "Pipeline":
+        """Add a conversion target.
+
+        Args:
+            target_framework (Union[str, Framework]): The target framework name.
+            target_device_name (Union[str, DeviceName]): Target device name.
+            target_data_type (Union[str, DataType]): Data type of the model. Default is DataType.FP16.
+            target_software_version (Union[str, SoftwareVersion], optional): Target software version.
+                Required if target_device_name is one of the Jetson devices.
+            target_hardware_type (Union[str, HardwareType], optional): Hardware type used for the benchmark.
+            benchmark (bool): If True, benchmark the converted model on the target device.
+
+        Returns:
+            Pipeline: The pipeline itself.
+        """
+        self.targets.append(
+            PipelineTarget(
+                target_framework=target_framework,
+                target_device_name=target_device_name,
+                target_data_type=target_data_type,
+                target_software_version=target_software_version,
+                target_hardware_type=target_hardware_type,
+                benchmark=benchmark,
+            )
+        )
+        return self
+
+    def _run_target(self, target: PipelineTarget, input_model_path: str, output_dir: Path) -> Dict:
+        conversion = self.converter.convert_model(
+            input_model_path=input_model_path,
+            output_dir=(output_dir / target.name).as_posix(),
+            target_framework=target.target_framework,
+            target_device_name=target.target_device_name,
+            target_data_type=target.target_data_type,
+            target_software_version=target.target_software_version,
+        )
+
+        benchmark = None
+        if target.benchmark:
+            benchmark = self.benchmarker.benchmark_model(
+                input_model_path=conversion["converted_model_path"],
+                target_device_name=target.target_device_name,
+                target_data_type=target.target_data_type,
+                target_software_version=target.target_software_version,
+                target_hardware_type=target.target_hardware_type,
+            )
+
+        return {"conversion": conversion, "benchmark": benchmark}
+
+    def run(self, input_model_path: str, output_dir: str = "./outputs/pipeline") -> Dict:
+        """Run the compression, the conversions and the benchmarks.
+
+        Args:
+            input_model_path (str): The file path where the model is located.
+            output_dir (str): The local folder path to save the results.
+
+        Raises:
+            e: If an error occurs during the compression. Errors of a target are recorded in its result instead.
+
+        Returns:
+            Dict: The compression metadata and the conversion and benchmark results of every target.
+        """
+
+        FileHandler.check_input_model_path(input_model_path)
+        if not self.targets:
+            raise ValueError("There is no target in the pipeline. Please add one with add_target.")
+
+        output_dir = Path(FileHandler.create_unique_folder(folder_path=output_dir))
+        result = {
+            "status": Status.IN_PROGRESS,
+            "input_model_path": Path(input_model_path).as_posix(),
+            "compression": None,
+            "targets": [{"name": target.name, "status": Status.IN_PROGRESS} for target in self.targets],
+        }
+        writer = MetadataWriter(folder_path=output_dir, file_name="pipeline")
+        writer.save(result)
+
+        try:
+            model_path = input_model_path
+            if self.compression is not None:
+                compression = self.compression["function"](
+                    input_model_path=input_model_path,
+                    output_dir=(output_dir / "compressed").as_posix(),
+                    **self.compression["kwargs"],
+                )
+                result["compression"] = compression
+                # The compression metadata records the launcher model, so the conversions skip the upload.
+                model_path = (Path(compression["compressed_model_path"]).parent / "metadata.json").as_posix()
+
+        except Exception as e:
+            logger.error(f"Pipeline failed. Error: {e}")
+            result["status"] = Status.ERROR
+            writer.save(result, flush=True)
+            raise e
+
+        logger.info(f"Converting the model for {len(self.targets)} targets...")
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._run_target, target, model_path, output_dir): idx
+                for idx, target in enumerate(self.targets)
+            }
+            for future in as_completed(futures):
+                target_result = result["targets"][futures[future]]
+                try:
+                    target_result.update(future.result())
+                    target_result["status"] = Status.COMPLETED
+                except Exception as e:
+                    logger.error(f"Pipeline target {target_result['name']} failed. Error: {e}")
+                    target_result["status"] = Status.ERROR
+                    target_result["error"] = str(e)
+                writer.save(result)
+
+        failed = any(target_result["status"] == Status.ERROR for target_result in result["targets"])
+        result["status"] = Status.ERROR if failed else Status.COMPLETED
+        writer.save(result, flush=True)
+
+        return result
@@ -1,9 +1,8 @@
-import time
-
 from loguru import logger
 
 from netspresso.clients.tao import tao_client
 from netspresso.enums.tao.action import ConvertAction
+from netspresso.utils.poller import BackoffPolicy, JobPoller
 
 
 class Dataset:
@@ -75,18 +74,25 @@ class Dataset:
             logger.error(f"Convert dataset failed. Error: {e}")
             raise e
 
-    def monitor_job_status(self, job_id, interval=15):
+    def monitor_job_status(self, job_id, interval=15, max_interval=None, timeout=None):
         try:
             logger.info("Monitoring dataset job stauts...")
 
-            while True:
-                response = tao_client.dataset.get_dataset_job(
+            poller = JobPoller(
+                fetch=lambda job_id: tao_client.dataset.get_dataset_job(
                     self.token_handler.user_id, self.id, job_id, self.token_handler.headers
-                )
-                logger.info(response)
-                if response.get("status") in ["Done", "Error", "Canceled"]:
-                    break
-                time.sleep(interval)
+                ),
+                is_done=lambda response: response.get("status") in ["Done", "Error", "Canceled"],
+                get_status=lambda response: response.get("status"),
+                policy=BackoffPolicy(
+                    initial_interval=interval,
+                    max_interval=max_interval if max_interval is not None else interval * 8,
+                    timeout=timeout,
+                ),
+                on_poll=lambda job_id, response: logger.info(response),
+            )
+
+            return poller.wait(job_id)
 
         except Exception as e:
             logger.error(f"Monitor dataset job staus failed. Error: {e}")
@@ -1,5 +1,4 @@
 import os
-import time
 from pathlib import Path
 from typing import List
 
@@ -7,6 +6,7 @@ from loguru import logger
 
 from netspresso.clients.tao import tao_client
 from netspresso.enums.tao.action import ExperimentAction
+from netspresso.utils.poller import BackoffPolicy, JobPoller
 
 
 class Experiment:
@@ -346,18 +346,25 @@ class Experiment:
             logger.error(f"Inference failed. Error: {e}")
             raise e
 
-    def monitor_job_status(self, job_id, interval=15):
+    def monitor_job_status(self, job_id, interval=15, max_interval=None, timeout=None):
         try:
             logger.info("Monitoring experiment job stauts...")
 
-            while True:
-                response = tao_client.experiment.get_experiment_job(
+            poller = JobPoller(
+                fetch=lambda job_id: tao_client.experiment.get_experiment_job(
                     self.token_handler.user_id, self.id, job_id, self.token_handler.headers
-                )
-                logger.info(response)
-                if response.get("status") in ["Done", "Error", "Canceled"]:
-                    break
-                time.sleep(interval)
+                ),
+                is_done=lambda response: response.get("status") in ["Done", "Error", "Canceled"],
+                get_status=lambda response: response.get("status"),
+                policy=BackoffPolicy(
+                    initial_interval=interval,
+                    max_interval=max_interval if max_interval is not None else interval * 8,
+                    timeout=timeout,
+                ),
+                on_poll=lambda job_id, response: logger.info(response),
+            )
+
+            return poller.wait(job_id)
 
         except Exception as e:
             logger.error(f"Monitor experiment job staus failed. Error: {e}")
@@ -1,3 +1,5 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from loguru import logger
@@ -6,16 +8,63 @@ from netspresso.clients.tao import TAOTokenHandler, tao_client
 from netspresso.enums.tao.experiment import CheckpointChooseMethod, EncryptionKey, NetworkArch
 from netspresso.tao.dataset import Dataset
 from netspresso.tao.experiment import Experiment
-from netspresso.tao.utils.file import split_tar_file
+from netspresso.tao.utils.file import TarSplit, iter_tar_splits
 
 
 class TAOTrainer:
     def __init__(self, token_handler: TAOTokenHandler) -> None:
         self.token_handler = token_handler
 
+    def _upload_split(self, dataset_id: str, split: TarSplit, progress_callback=None):
+        try:
+            logger.info(f"Uploading tar split {split.index + 1} ({split.num_members} files, {split.size} bytes)")
+            upload_dataset_response = tao_client.dataset.upload_dataset(
+                self.token_handler.user_id,
+                dataset_id,
+                split.source,
+                self.token_handler.headers,
+                progress_callback=progress_callback,
+            )
+            logger.info(upload_dataset_response["message"])
+            return upload_dataset_response
+        finally:
+            split.close()
+
     def upload_dataset(
-        self, name: str, dataset_type: str, dataset_format: str, dataset_path: str, split_name: str = "train"
+        self,
+        name: str,
+        dataset_type: str,
+        dataset_format: str,
+        dataset_path: str,
+        split_name: str = "train",
+        progress_callback=None,
+        max_split_size: int = 200 * 1024 * 1024,
+        max_workers: int = 4,
+        spool: bool = False,
     ):
+        """Create a dataset and upload the tar archive in splits.
+
+        The splits are uploaded concurrently while the next ones are being written, and every split is
+        deleted once uploaded. At most `2 * max_workers` splits wait for their upload at the same time,
+        which bounds the disk, or the memory if the splits are spooled.
+
+        Args:
+            name (str): The name of the dataset.
+            dataset_type (str): The type of the dataset.
+            dataset_format (str): The format of the dataset.
+            dataset_path (str): The path of the tar archive of the dataset.
+            split_name (str): The name of the dataset split, used for the folder of the tar splits.
+            progress_callback (Callable[[int, int], None], optional): Called with (bytes sent, total bytes) of every split.
+            max_split_size (int): The maximum size of a tar split in bytes.
+            max_workers (int): The maximum number of splits uploaded at the same time.
+            spool (bool): If True, the splits are kept in memory instead of written next to the dataset.
+
+        Raises:
+            e: If an error occurs while creating the dataset or uploading a split.
+
+        Returns:
+            Dataset: The uploaded dataset.
+        """
         try:
             logger.info("Creating dataset...")
             data = {"name": name, "type": dataset_type, "format": dataset_format}
@@ -23,15 +72,31 @@ class TAOTrainer:
             dataset_id = response["id"]
 
             dataset_path = Path(dataset_path)
-            output_dir = dataset_path.parent / "split" / split_name
-            split_tar_file(dataset_path, str(output_dir))
-
-            for idx, tar_dataset_path in enumerate(output_dir.iterdir()):
-                logger.info(f"Uploading {idx+1}/{len(list(output_dir.iterdir()))} tar split")
-                upload_dataset_response = tao_client.dataset.upload_dataset(
-                    self.token_handler.user_id, dataset_id, str(tar_dataset_path), self.token_handler.headers
-                )
-                logger.info(upload_dataset_response["message"])
+            output_dir = None if spool else dataset_path.parent / "split" / split_name
+            splits = iter_tar_splits(dataset_path, output_dir, max_split_size=max_split_size, spool=spool)
+
+            slots = threading.Semaphore(2 * max_workers)
+            futures = {}
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                try:
+                    for split in splits:
+                        slots.acquire()
+                        future = executor.submit(self._upload_split, dataset_id, split, progress_callback)
+                        future.add_done_callback(lambda _: slots.release())
+                        futures[future] = split
+                        if any(future.done() and future.exception() is not None for future in futures):
+                            break
+                finally:
+                    splits.close()
+                    # Stop the waiting uploads as soon as one failed, their splits are never opened.
+                    if any(future.done() and future.exception() is not None for future in futures):
+                        for future, split in futures.items():
+                            if future.cancel():
+                                split.close()
+
+            for future in futures:
+                future.result()
+            logger.info(f"Uploaded {len(futures)} tar splits")
 
             dataset = Dataset(id=response["id"], token_handler=self.token_handler)
 
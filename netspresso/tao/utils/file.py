@@ -1,26 +1,345 @@
+import copy
+import hashlib
+import heapq
+import json
 import os
 import tarfile
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 
+from loguru import logger
+
+from netspresso.clients.utils.common import get_file_sha256
+from netspresso.utils.lock import atomic_write_text
+
+COMPRESSIONS = ("gz", "bz2", "xz")
+MANIFEST_FILE_NAME = "manifest.json"
+
+
+@dataclass
+class TarSplit:
+    """A split archive produced by `iter_tar_splits`.
+
+    Attributes:
+        index (int): The position of the split, starting at 0.
+        name (str): The file name of the split.
+        size (int): The size of the split archive in bytes.
+        num_members (int): The number of members in the split.
+        path (Path, optional): The path of the split on disk. None if the split is spooled.
+        fileobj (BinaryIO, optional): The spooled split archive. None if the split is on disk.
+    """
+
+    index: int
+    name: str
+    size: int = 0
+    num_members: int = 0
+    path: Optional[Path] = None
+    fileobj: Optional[BinaryIO] = None
+
+    @property
+    def source(self) -> Union[Path, Tuple[str, BinaryIO]]:
+        """The split as accepted by the multipart upload: its path, or its (name, file object)."""
+        return self.path if self.path is not None else (self.name, self.fileobj)
+
+    def close(self) -> None:
+        """Free the split: delete the file on disk or release the spooled archive."""
+        if self.fileobj is not None:
+            self.fileobj.close()
+        if self.path is not None and self.path.exists():
+            self.path.unlink()
+
+
+def _open_split(
+    index: int, output_dir: Optional[Union[str, Path]], max_split_size: int, spool: bool
+) -> Tuple[tarfile.TarFile, TarSplit]:
+    name = f"smaller_file_{index}.tar"
+    if spool:
+        # Room for the end-of-archive blocks, so a full split stays in memory.
+        fileobj = tempfile.SpooledTemporaryFile(max_size=max_split_size + tarfile.RECORDSIZE)
+        return tarfile.open(fileobj=fileobj, mode="w"), TarSplit(index=index, name=name, fileobj=fileobj)
+
+    path = Path(output_dir) / name
+    return tarfile.open(path, "w"), TarSplit(index=index, name=name, path=path)
+
+
+def _finish_split(split: TarSplit) -> TarSplit:
+    if split.fileobj is not None:
+        split.size = split.fileobj.seek(0, os.SEEK_END)
+        split.fileobj.seek(0)
+    else:
+        split.size = split.path.stat().st_size
+    return split
 
-def split_tar_file(input_tar_path, output_dir, max_split_size=200 * 1024 * 1024):
-    os.makedirs(output_dir, exist_ok=True)
 
-    with tarfile.open(input_tar_path, "r") as original_tar:
-        members = original_tar.getmembers()
-        current_split_size = 0
-        current_split_number = 0
-        current_split_name = os.path.join(output_dir, f"smaller_file_{current_split_number}.tar")
-
-        with tarfile.open(current_split_name, "w") as split_tar:
-            for member in members:
-                if current_split_size + member.size <= max_split_size:
-                    split_tar.addfile(member, original_tar.extractfile(member))
-                    current_split_size += member.size
-                else:
+def _get_member_size(member: tarfile.TarInfo) -> int:
+    # The header and the data padded to whole blocks, plus the end-of-archive blocks and the record padding
+    # written on close. Long names add extension headers, which are not counted.
+    data_size = -(-member.size // tarfile.BLOCKSIZE) * tarfile.BLOCKSIZE
+    return tarfile.BLOCKSIZE + data_size + 2 * tarfile.RECORDSIZE
+
+
+def _copy_hardlink(
+    member: tarfile.TarInfo, target: Tuple[int, int, int], source_tar: tarfile.TarFile
+) -> Tuple[tarfile.TarInfo, BinaryIO]:
+    # The link is stored as a regular file with the data of its target, read again from the input.
+    _, offset_data, size = target
+    regular = copy.copy(member)
+    regular.type = tarfile.REGTYPE
+    regular.linkname = ""
+    regular.size = size
+    source_tar.fileobj.seek(offset_data)
+    return regular, source_tar.fileobj
+
+
+def iter_tar_splits(
+    input_tar_path: Union[str, Path],
+    output_dir: Optional[Union[str, Path]] = None,
+    max_split_size: int = 200 * 1024 * 1024,
+    spool: bool = False,
+) -> Iterator[TarSplit]:
+    """Split the tar archive, yielding every split as soon as it is written.
+
+    The input archive is read as a stream, so only the name and data offset of its files are kept in memory and the
+    consumer can upload a split while the next ones are being written. A member larger than
+    `max_split_size` is written alone in its own split.
+
+    Every split can be extracted on its own. A hardlink whose target is in an earlier split is
+    written as a regular file with the data of its target, read again from the input archive.
+
+    Args:
+        input_tar_path (Union[str, Path]): The tar archive to split. Compressed archives are supported.
+        output_dir (Union[str, Path], optional): The folder the splits are written in. Required unless spool is True.
+        max_split_size (int): The maximum size of a split in bytes.
+        spool (bool): If True, the splits are kept in memory instead of written to output_dir.
+            A split larger than max_split_size, made of a single oversized member, spills to an anonymous temporary file.
+
+    Raises:
+        ValueError: If output_dir is not given and spool is False.
+
+    Yields:
+        TarSplit: The splits, in order. Close each split once it is consumed to free it.
+    """
+    if output_dir is None and not spool:
+        raise ValueError("output_dir is required unless the splits are spooled.")
+    if output_dir is not None and not spool:
+        os.makedirs(output_dir, exist_ok=True)
+
+    split_tar: Optional[tarfile.TarFile] = None
+    split: Optional[TarSplit] = None
+    num_splits = 0
+    # The (split index, data offset, size) of every file that a hardlink can point to.
+    link_targets: Dict[str, Tuple[int, int, int]] = {}
+    source_tar: Optional[tarfile.TarFile] = None
+
+    try:
+        with tarfile.open(input_tar_path, "r|*") as original_tar:
+            for member in original_tar:
+                # Links and directories have no data.
+                data = original_tar.extractfile(member) if member.isreg() else None
+                target = link_targets.get(member.linkname) if member.islnk() else None
+                if target is not None and (
+                    split is None
+                    or target[0] != split.index
+                    or split_tar.offset + _get_member_size(member) > max_split_size
+                ):
+                    if source_tar is None:
+                        source_tar = tarfile.open(input_tar_path, "r:*")
+                    member, data = _copy_hardlink(member, target, source_tar)
+
+                if split is not None and split_tar.offset + _get_member_size(member) > max_split_size:
+                    finished, split = split, None
                     split_tar.close()
-                    current_split_number += 1
-                    current_split_name = os.path.join(output_dir, f"smaller_file_{current_split_number}.tar")
-                    current_split_size = 0
-                    split_tar = tarfile.open(current_split_name, "w")  # Open a new split tar archive
-                    split_tar.addfile(member, original_tar.extractfile(member))
-                    current_split_size += member.size
+                    yield _finish_split(finished)
+
+                if split is None:
+                    split_tar, split = _open_split(num_splits, output_dir, max_split_size, spool)
+                    num_splits += 1
+                split_tar.addfile(member, data)
+                split.num_members += 1
+                if target is not None:
+                    link_targets[member.name] = (split.index, *target[1:])
+                elif member.isreg():
+                    link_targets[member.name] = (split.index, member.offset_data, member.size)
+                # The tar file keeps every member read, drop them so the index is never held in memory.
+                original_tar.members.clear()
+
+        if split is not None:
+            finished, split = split, None
+            split_tar.close()
+            yield _finish_split(finished)
+
+    finally:
+        if source_tar is not None:
+            source_tar.close()
+        # The input failed or the consumer stopped before the split was finished.
+        if split is not None:
+            split_tar.close()
+            split.close()
+
+
+class _HashingWriter:
+    """Binary file wrapper computing the SHA-256 of the bytes written."""
+
+    def __init__(self, file: BinaryIO) -> None:
+        self.file = file
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data: bytes) -> int:
+        self.sha256.update(data)
+        self.size += len(data)
+        return self.file.write(data)
+
+    def tell(self) -> int:
+        return self.size
+
+    def flush(self) -> None:
+        self.file.flush()
+
+
+def _index_members(input_tar_path: Union[str, Path]) -> List[Tuple[List[int], int]]:
+    # The members are indexed as groups of (offsets, size). A hardlink is grouped with its target,
+    # so both are written in the same shard and the link can be extracted.
+    groups: List[Tuple[List[int], int]] = []
+    group_indices: Dict[str, int] = {}
+    with tarfile.open(input_tar_path, "r:") as tar:
+        while True:
+            member = tar.next()
+            if member is None:
+                break
+            size = _get_member_size(member) - 2 * tarfile.RECORDSIZE
+            if member.islnk():
+                group_index = group_indices.get(member.linkname)
+                if group_index is None:
+                    raise ValueError(
+                        f"The hardlink {member.name} points to {member.linkname}, which is not stored before it."
+                    )
+                offsets, group_size = groups[group_index]
+                groups[group_index] = (offsets + [member.offset], group_size + size)
+            else:
+                group_index = len(groups)
+                groups.append(([member.offset], size))
+            group_indices[member.name] = group_index
+            tar.members.clear()
+    return groups
+
+
+def _partition_members(groups: List[Tuple[List[int], int]], max_split_size: int) -> List[List[int]]:
+    # Every shard needs room for the end-of-archive blocks and the record padding.
+    capacity = max_split_size - 2 * tarfile.RECORDSIZE
+    oversized = [offsets for offsets, size in groups if size > capacity]
+    members = sorted(((size, offsets) for offsets, size in groups if size <= capacity), reverse=True)
+    if not members:
+        return oversized
+
+    # Largest members first into the emptiest shard, with one more shard until every shard fits.
+    num_shards = max(-(-sum(size for size, _ in members) // capacity), 1)
+    while True:
+        shards = [(0, idx, []) for idx in range(num_shards)]
+        for size, member_offsets in members:
+            shard_size, idx, offsets = heapq.heappop(shards)
+            offsets.extend(member_offsets)
+            heapq.heappush(shards, (shard_size + size, idx, offsets))
+        if max(shard_size for shard_size, _, _ in shards) <= capacity:
+            break
+        num_shards += 1
+
+    # Members are written in archive order, so the workers read the input sequentially
+    # and the target of a hardlink is extracted before the link.
+    return [sorted(offsets) for _, _, offsets in sorted(shards, key=lambda shard: shard[1])] + oversized
+
+
+def _write_shard(input_tar_path: str, shard_path: str, offsets: List[int], compression: Optional[str]) -> Dict:
+    with tarfile.open(input_tar_path, "r:") as original_tar, open(shard_path, "wb") as f:
+        writer = _HashingWriter(f)
+        with tarfile.open(fileobj=writer, mode=f"w:{compression}" if compression else "w") as shard_tar:
+            for offset in offsets:
+                original_tar.fileobj.seek(offset)
+                member = tarfile.TarInfo.fromtarfile(original_tar)
+                # The worker has no member list to resolve links, and links carry no data.
+                shard_tar.addfile(member, original_tar.extractfile(member) if member.isreg() else None)
+
+    return {
+        "name": Path(shard_path).name,
+        "size": writer.size,
+        "num_members": len(offsets),
+        "sha256": writer.sha256.hexdigest(),
+    }
+
+
+def split_tar_file(
+    input_tar_path: Union[str, Path],
+    output_dir: Union[str, Path],
+    max_split_size: int = 200 * 1024 * 1024,
+    num_workers: Optional[int] = None,
+    compression: Optional[str] = None,
+) -> Dict:
+    """Split the tar archive into balanced shards written in parallel worker processes.
+
+    The members are partitioned by size upfront, so every shard holds about the same amount of data
+    and stays under `max_split_size`. A member larger than `max_split_size` is written alone in its
+    own shard. The shards are listed with their SHA-256 in `manifest.json` in output_dir.
+
+    Only uncompressed archives can be read at random offsets by the workers. A compressed archive
+    is split sequentially with `iter_tar_splits`, and its shards are not compressed.
+
+    Args:
+        input_tar_path (Union[str, Path]): The tar archive to split.
+        output_dir (Union[str, Path]): The folder the shards and the manifest are written in.
+        max_split_size (int): The maximum size of a shard in bytes, before compression.
+        num_workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+        compression (str, optional): Compress every shard with "gz", "bz2" or "xz".
+
+    Raises:
+        ValueError: If compression is not supported.
+
+    Returns:
+        Dict: The manifest of the shards.
+    """
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f"compression should be one of {COMPRESSIONS}.")
+    os.makedirs(output_dir, exist_ok=True)
+
+    try:
+        index = _index_members(input_tar_path)
+    except tarfile.ReadError:
+        index = None
+
+    shards = []
+    if index is None:
+        if compression is not None:
+            logger.warning("The input archive is compressed, the shards are written without compression.")
+        for split in iter_tar_splits(input_tar_path, output_dir, max_split_size=max_split_size):
+            sha256 = get_file_sha256(split.path.as_posix())
+            shards.append({"name": split.name, "size": split.size, "num_members": split.num_members, "sha256": sha256})
+        compression = None
+    else:
+        partitions = _partition_members(index, max_split_size)
+        num_members = sum(len(offsets) for offsets in partitions)
+        suffix = f".tar.{compression}" if compression else ".tar"
+        shard_paths = [os.path.join(output_dir, f"smaller_file_{idx}{suffix}") for idx in range(len(partitions))]
+        logger.info(f"Splitting {num_members} files into {len(partitions)} shards...")
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            shards = list(
+                executor.map(
+                    _write_shard,
+                    [str(input_tar_path)] * len(partitions),
+                    shard_paths,
+                    partitions,
+                    [compression] * len(partitions),
+                )
+            )
+
+    manifest = {
+        "input_tar_path": Path(input_tar_path).as_posix(),
+        "max_split_size": max_split_size,
+        "compression": compression,
+        "num_members": sum(shard["num_members"] for shard in shards),
+        "shards": shards,
+    }
+    atomic_write_text(Path(output_dir) / MANIFEST_FILE_NAME, json.dumps(manifest, indent=4))
+
+    return manifest
@@ -1,5 +1,13 @@
 from .credit import check_credit_balance
 from .file import FileHandler
-from .plotter import Plotter
 
 __all__ = ["check_credit_balance", "FileHandler", "Plotter"]
+
+
+def __getattr__(name):
+    # Plotter imports matplotlib, so load it on first access.
+    if name == "Plotter":
+        from .plotter import Plotter
+
+        return Plotter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
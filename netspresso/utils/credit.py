@@ -1,9 +1,11 @@
 import sys
 
 
-def check_credit_balance(user_credit, service_credit):
+def check_credit_balance(user_credit, service_credit, task_count=1):
     service_name = service_credit.name.replace("_", " ").lower()
-    if user_credit < service_credit:
+    required_credit = service_credit * task_count
+    if user_credit < required_credit:
+        task_description = f"one {service_name} task" if task_count == 1 else f"{task_count} {service_name} tasks"
         sys.exit(
-            f"Your current balance of {user_credit} credits is insufficient to complete the task. \n{service_credit} credits are required for one {service_name} task. \nFor additional credit, please contact us at netspresso@nota.ai."
+            f"Your current balance of {user_credit} credits is insufficient to complete the task. \n{required_credit} credits are required for {task_description}. \nFor additional credit, please contact us at netspresso@nota.ai."
         )
@@ -0,0 +1,264 @@
+import hashlib
+import json
+import os
+import random
+import re
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple, Union
+
+from loguru import logger
+
+from netspresso.clients.utils.transport import HTTPTransport, transport
+
+DEFAULT_CHUNK_SIZE = 8 * 1024 * 1024
+DEFAULT_MAX_WORKERS = 4
+DEFAULT_TIMEOUT = (10, 60)
+STREAM_BLOCK_SIZE = 1024 * 1024
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class Downloader:
+    """Download files with parallel HTTP Range requests, resuming interrupted downloads.
+
+    The file is written into a preallocated `<save_path>.part` file. The finished chunks are
+    recorded in `<save_path>.part.json`, so an interrupted download continues where it stopped.
+    Servers without Range support are downloaded as a single stream.
+
+    Args:
+        transport (HTTPTransport): The HTTP transport used for the requests.
+        chunk_size (int): The size of every Range request.
+        max_workers (int): The maximum number of chunks downloaded at the same time.
+        max_retries (int): The number of retries of a failed chunk.
+        timeout (Tuple[float, float]): The connect and read timeouts of every request in seconds.
+    """
+
+    def __init__(
+        self,
+        transport: HTTPTransport = transport,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_retries: int = 3,
+        timeout: Tuple[float, float] = DEFAULT_TIMEOUT,
+    ) -> None:
+        self.transport = transport
+        self.chunk_size = chunk_size
+        self.max_workers = max_workers
+        self.max_retries = max_retries
+        self.timeout = timeout
+
+    @staticmethod
+    def _get_state_path(part_path: Path) -> Path:
+        return part_path.with_name(part_path.name + ".json")
+
+    @staticmethod
+    def _load_state(state_path: Path) -> Optional[Dict]:
+        try:
+            with open(state_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _save_state(state_path: Path, state: Dict) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=state_path.parent, prefix=f".{state_path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, state_path)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def _probe(self, url: str, verify: bool) -> Tuple[Optional[int], bool, Optional[str]]:
+        # Pre-signed URLs are often signed for GET only, so probe with a one byte Range GET instead of HEAD.
+        with self.transport.get(
+            url, headers={"Range": "bytes=0-0"}, stream=True, timeout=self.timeout, verify=verify
+        ) as response:
+            response.raise_for_status()
+            etag = response.headers.get("ETag")
+            if response.status_code == 206:
+                match = re.match(r"bytes \d+-\d+/(\d+)", response.headers.get("Content-Range", ""))
+                if match:
+                    return int(match.group(1)), True, etag
+            content_length = response.headers.get("Content-Length")
+            return (int(content_length) if content_length else None), False, etag
+
+    def _split(self, total_size: int) -> List[Tuple[int, int]]:
+        return [
+            (start, min(start + self.chunk_size, total_size) - 1) for start in range(0, total_size, self.chunk_size)
+        ]
+
+    def _download_range(self, url: str, part_path: Path, start: int, end: int, verify: bool, on_bytes) -> None:
+        for attempt in range(self.max_retries + 1):
+            written = 0
+            try:
+                # The chunk is retried here, so the transport does not retry it again.
+                with self.transport.get(
+                    url,
+                    headers={"Range": f"bytes={start}-{end}"},
+                    stream=True,
+                    timeout=self.timeout,
+                    verify=verify,
+                    max_retries=0,
+                ) as response:
+                    response.raise_for_status()
+                    if response.status_code != 206:
+                        raise OSError(f"The server ignored the Range request. Status code: {response.status_code}")
+                    with open(part_path, "r+b") as f:
+                        f.seek(start)
+                        for block in response.iter_content(chunk_size=STREAM_BLOCK_SIZE):
+                            f.write(block)
+                            written += len(block)
+                            on_bytes(len(block))
+                if written != end - start + 1:
+                    raise OSError(f"Received {written} bytes for the range {start}-{end}.")
+                return
+            except Exception as e:
+                on_bytes(-written)
+                if attempt == self.max_retries:
+                    raise e
+                delay = min(2**attempt, 30) * random.uniform(0.5, 1.5)
+                logger.warning(f"Download of bytes {start}-{end} failed. Retrying in {delay:.1f}s. Error: {e}")
+                time.sleep(delay)
+
+    def _download_ranges(
+        self,
+        url: str,
+        part_path: Path,
+        total_size: int,
+        etag: Optional[str],
+        verify: bool,
+        progress_callback: Optional[ProgressCallback],
+    ) -> None:
+        state_path = self._get_state_path(part_path)
+        ranges = self._split(total_size)
+        state = self._load_state(state_path)
+        resumable = (
+            state is not None
+            and part_path.exists()
+            and state.get("total_size") == total_size
+            and state.get("chunk_size") == self.chunk_size
+            and state.get("etag") == etag
+        )
+        if resumable:
+            done = set(state["done"])
+            logger.info(f"Resuming download. {len(done)}/{len(ranges)} chunks already downloaded.")
+        else:
+            done = set()
+            state = {"total_size": total_size, "chunk_size": self.chunk_size, "etag": etag, "done": []}
+            with open(part_path, "wb") as f:
+                f.truncate(total_size)
+            self._save_state(state_path, state)
+
+        lock = threading.Lock()
+        downloaded = [sum(end - start + 1 for idx, (start, end) in enumerate(ranges) if idx in done)]
+
+        def _on_bytes(count: int) -> None:
+            with lock:
+                downloaded[0] += count
+                if progress_callback is not None and count > 0:
+                    progress_callback(downloaded[0], total_size)
+
+        pending = [idx for idx in range(len(ranges)) if idx not in done]
+        error = None
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._download_range, url, part_path, *ranges[idx], verify, _on_bytes): idx
+                for idx in pending
+            }
+            for future in as_completed(futures):
+                # Keep recording the finished chunks after a failure, so they are not downloaded again on resume.
+                if future.exception() is not None:
+                    error = error or future.exception()
+                    continue
+                with lock:
+                    done.add(futures[future])
+                    state["done"] = sorted(done)
+                    self._save_state(state_path, state)
+
+        if error is not None:
+            raise error
+
+    def _download_stream(
+        self, url: str, part_path: Path, verify: bool, progress_callback: Optional[ProgressCallback]
+    ) -> None:
+        with self.transport.get(url, stream=True, timeout=self.timeout, verify=verify) as response:
+            response.raise_for_status()
+            total_size = int(response.headers.get("Content-Length") or 0)
+            downloaded = 0
+            with open(part_path, "wb") as f:
+                for block in response.iter_content(chunk_size=STREAM_BLOCK_SIZE):
+                    f.write(block)
+                    downloaded += len(block)
+                    if progress_callback is not None:
+                        progress_callback(downloaded, total_size)
+
+    @staticmethod
+    def _verify(part_path: Path, expected_size: Optional[int], sha256: Optional[str]) -> None:
+        size = part_path.stat().st_size
+        if expected_size is not None and size != expected_size:
+            raise OSError(f"The downloaded file size is {size} bytes, but {expected_size} bytes were expected.")
+        if sha256 is not None:
+            digest = hashlib.sha256()
+            with open(part_path, "rb") as f:
+                for block in iter(lambda: f.read(STREAM_BLOCK_SIZE), b""):
+                    digest.update(block)
+            if digest.hexdigest() != sha256.lower():
+                raise OSError(f"The checksum of the downloaded file does not match. Expected sha256: {sha256}")
+
+    def download(
+        self,
+        url: str,
+        save_path: Union[str, Path],
+        sha256: Optional[str] = None,
+        verify: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> Path:
+        """Download the file at the URL to the save path.
+
+        Args:
+            url (str): The URL of the file.
+            save_path (Union[str, Path]): The path where the file will be saved.
+            sha256 (str, optional): The expected SHA-256 hex digest of the file.
+            verify (bool): Whether to verify the SSL certificate.
+            progress_callback (Callable[[int, int], None], optional): Called with (bytes downloaded, total bytes).
+
+        Raises:
+            OSError: If the downloaded file does not have the expected size or checksum.
+
+        Returns:
+            Path: The path of the downloaded file.
+        """
+        save_path = Path(save_path)
+        part_path = save_path.with_name(save_path.name + ".part")
+        state_path = self._get_state_path(part_path)
+
+        total_size, accept_ranges, etag = self._probe(url, verify)
+        if accept_ranges and total_size:
+            self._download_ranges(url, part_path, total_size, etag, verify, progress_callback)
+        else:
+            self._download_stream(url, part_path, verify, progress_callback)
+
+        try:
+            self._verify(part_path, total_size, sha256)
+        except OSError:
+            # A corrupted part file cannot be resumed.
+            part_path.unlink()
+            if state_path.exists():
+                state_path.unlink()
+            raise
+
+        os.replace(part_path, save_path)
+        if state_path.exists():
+            state_path.unlink()
+
+        return save_path
+
+
+downloader = Downloader()
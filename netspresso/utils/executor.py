@@ -0,0 +1,36 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+DEFAULT_MAX_WORKERS = 32
+
+
+class AsyncExecutor:
+    """Run blocking NetsPresso calls from asyncio code on a shared thread pool.
+
+    The blocking calls keep using the pooled HTTP transport, so every coroutine
+    scheduled through the same executor shares its keep-alive connections.
+
+    Args:
+        max_workers (int): The maximum number of jobs running at the same time.
+    """
+
+    def __init__(self, max_workers: int = DEFAULT_MAX_WORKERS) -> None:
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="netspresso")
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run the given function on the thread pool and wait for its result.
+
+        Args:
+            func (Callable): The blocking function to run.
+
+        Returns:
+            Any: The return value of the function.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, *args, **kwargs))
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait)
@@ -1,9 +1,15 @@
 import json
+import os
+import re
 import shutil
 import sys
+import uuid
+from datetime import datetime
 from pathlib import Path
-from typing import Tuple, Union
-from urllib import request
+from typing import Optional, Tuple, Union
+
+from netspresso.utils.downloader import ProgressCallback, downloader
+from netspresso.utils.lock import FileLock
 
 FRAMEWORK_EXTENSION_MAP = {
     "tensorflow_keras": ".h5",
@@ -16,9 +22,15 @@ FRAMEWORK_EXTENSION_MAP = {
 }
 
 
+FOLDER_NAMINGS = ["counter", "timestamp", "probe"]
+
+
 class FileHandler:
     """Utility class for file-related operations."""
 
+    # The naming used by create_unique_folder when the folder already exists.
+    folder_naming: str = os.getenv("NETSPRESSO_FOLDER_NAMING", "counter")
+
     @staticmethod
     def check_exists(folder_path: str) -> bool:
         """Check if the file or folder exists.
@@ -71,19 +83,89 @@ class FileHandler:
             sys.exit(f"This folder already exists. Local Path: {Path(folder_path)}")
 
     @staticmethod
-    def create_unique_folder(folder_path: str) -> str:
-        folder_path = Path(folder_path)
-        if not folder_path.exists():
-            folder_path.mkdir(parents=True)
-        else:
-            count = 1
+    def _claim_folder(folder_path: Path) -> bool:
+        # mkdir is atomic, so exactly one process claims a name.
+        try:
+            folder_path.mkdir()
+            return True
+        except FileExistsError:
+            return False
+
+    @staticmethod
+    def _get_max_count(folder_path: Path) -> int:
+        pattern = re.compile(rf"^{re.escape(folder_path.name)} \((\d+)\)$")
+        counts = [int(match.group(1)) for match in map(pattern.match, os.listdir(folder_path.parent)) if match]
+        return max(counts, default=0)
+
+    @staticmethod
+    def _create_counter_folder(folder_path: Path) -> Path:
+        counter_path = folder_path.with_name(f".{folder_path.name}.counter")
+        with FileLock(counter_path):
+            try:
+                count = int(counter_path.read_text())
+            except (OSError, ValueError):
+                # Folders created before the counter existed are found with a single listing.
+                count = FileHandler._get_max_count(folder_path)
             while True:
+                count += 1
                 new_folder_path = folder_path.with_name(f"{folder_path.name} ({count})")
-                if not new_folder_path.exists():
-                    new_folder_path.mkdir(parents=True)
-                    folder_path = new_folder_path
+                if FileHandler._claim_folder(new_folder_path):
                     break
-                count += 1
+            counter_path.write_text(str(count))
+
+        return new_folder_path
+
+    @staticmethod
+    def _create_timestamp_folder(folder_path: Path) -> Path:
+        while True:
+            suffix = f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+            new_folder_path = folder_path.with_name(f"{folder_path.name}_{suffix}")
+            if FileHandler._claim_folder(new_folder_path):
+                return new_folder_path
+
+    @staticmethod
+    def _create_probe_folder(folder_path: Path) -> Path:
+        count = 1
+        while True:
+            new_folder_path = folder_path.with_name(f"{folder_path.name} ({count})")
+            if FileHandler._claim_folder(new_folder_path):
+                return new_folder_path
+            count += 1
+
+    @staticmethod
+    def create_unique_folder(folder_path: str, naming: Optional[str] = None) -> str:
+        """Create a new folder at the path, or next to it with a unique name if the path already exists.
+
+        Every name is claimed with an atomic mkdir, so concurrent processes never get the same folder.
+
+        Args:
+            folder_path (str): The path of the folder to be created.
+            naming (str, optional): The naming used if the folder already exists. Defaults to FileHandler.folder_naming.
+                "counter": `name (N)`, with the last N kept in a `.name.counter` file next to the folder.
+                "timestamp": `name_YYYYmmdd-HHMMSS-xxxxxxxx` with a random suffix, without any shared state.
+                "probe": `name (N)` with the smallest free N, checking the names one by one.
+
+        Raises:
+            ValueError: If the naming is not supported.
+
+        Returns:
+            str: The path of the created folder.
+        """
+        naming = naming or FileHandler.folder_naming
+        if naming not in FOLDER_NAMINGS:
+            raise ValueError(f"The folder naming should be one of {FOLDER_NAMINGS}.")
+
+        folder_path = Path(folder_path)
+        folder_path.parent.mkdir(parents=True, exist_ok=True)
+        if FileHandler._claim_folder(folder_path):
+            return str(folder_path)
+
+        if naming == "counter":
+            folder_path = FileHandler._create_counter_folder(folder_path)
+        elif naming == "timestamp":
+            folder_path = FileHandler._create_timestamp_folder(folder_path)
+        else:
+            folder_path = FileHandler._create_probe_folder(folder_path)
 
         return str(folder_path)
 
@@ -102,14 +184,25 @@ class FileHandler:
         return Path(folder_path) / (name + extension)
 
     @staticmethod
-    def download_file(url: str, save_path: Union[str, Path]) -> None:
+    def download_file(
+        url: str,
+        save_path: Union[str, Path],
+        sha256: Optional[str] = None,
+        verify: bool = True,
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> None:
         """Download a file from the given URL and save it to the specified path.
 
+        Large files are downloaded in parallel chunks and an interrupted download is resumed on the next call.
+
         Args:
             url (str): The URL of the file to be downloaded.
             save_path (Union[str, Path]): The path where the downloaded file will be saved.
+            sha256 (str, optional): The expected SHA-256 hex digest of the file.
+            verify (bool): Whether to verify the SSL certificate.
+            progress_callback (Callable[[int, int], None], optional): Called with (bytes downloaded, total bytes).
         """
-        request.urlretrieve(url, save_path)
+        downloader.download(url, save_path, sha256=sha256, verify=verify, progress_callback=progress_callback)
 
     @staticmethod
     def get_extension_by_framework(framework: str) -> str:
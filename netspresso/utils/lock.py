@@ -0,0 +1,99 @@
+import os
+import stat
+import tempfile
+import time
+from pathlib import Path
+from typing import Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    """Inter-process lock held on a `<path>.lock` file next to the protected file.
+
+    Shared locks allow concurrent readers on POSIX. On Windows every lock is exclusive.
+
+    Args:
+        path (Union[str, Path]): The path of the protected file.
+        shared (bool): If True, take a shared lock for reading instead of an exclusive one.
+    """
+
+    def __init__(self, path: Union[str, Path], shared: bool = False) -> None:
+        self.lock_path = Path(f"{path}.lock")
+        self.shared = shared
+        self._file = None
+
+    def acquire(self) -> None:
+        self._file = open(self.lock_path, "a+b")
+        if fcntl is not None:
+            fcntl.flock(self._file.fileno(), fcntl.LOCK_SH if self.shared else fcntl.LOCK_EX)
+            return
+
+        while True:
+            try:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError:
+                # LK_LOCK gives up after 10 seconds, keep waiting like flock does.
+                time.sleep(0.1)
+
+    def release(self) -> None:
+        if self._file is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+            else:
+                self._file.seek(0)
+                msvcrt.locking(self._file.fileno(), msvcrt.LK_UNLCK, 1)
+        finally:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "FileLock":
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
+def _read_umask() -> int:
+    # The umask can only be read by setting it, so it is read once at import, before any writer thread runs.
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+
+_UMASK = _read_umask()
+
+
+def _get_file_mode(path: Path) -> int:
+    # Keep the mode of the replaced file, or use the mode a new file would get from the umask.
+    try:
+        return stat.S_IMODE(os.stat(path).st_mode)
+    except FileNotFoundError:
+        return 0o666 & ~_UMASK
+
+
+def atomic_write_text(path: Union[str, Path], text: str) -> None:
+    """Write the text to a temporary file in the same folder and move it over the path in one step."""
+    path = Path(path)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        # mkstemp creates owner-only files, which would make shared result folders unreadable to others.
+        os.chmod(tmp_path, _get_file_mode(path))
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
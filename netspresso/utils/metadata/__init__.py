@@ -1,3 +1,13 @@
 from .handler import MetadataHandler
+from .index import ResultIndex, result_index
+from .store import BenchmarkStore
+from .writer import BenchmarkResultWriter, MetadataWriter
 
-__all__ = ["MetadataHandler"]
+__all__ = [
+    "MetadataHandler",
+    "BenchmarkStore",
+    "MetadataWriter",
+    "BenchmarkResultWriter",
+    "ResultIndex",
+    "result_index",
+]
@@ -0,0 +1,57 @@
+"""Manage the local index of NetsPresso results.
+
+python -m netspresso.utils.metadata rebuild ./outputs --workers 8
+python -m netspresso.utils.metadata query --task-type benchmark --device Jetson-Nx --data-type INT8 --max-size 5 --order-by latency --limit 1
+"""
+
+import json
+from argparse import ArgumentParser
+
+from .index import ORDER_COLUMNS, ResultIndex
+
+
+def get_args():
+    parser = ArgumentParser(description="Manage the local index of NetsPresso results.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    rebuild_parser = subparsers.add_parser("rebuild", help="Scan output folders and re-index their results")
+    rebuild_parser.add_argument("root_dirs", nargs="+", help="The output folders to scan recursively")
+    rebuild_parser.add_argument("--workers", type=int, default=None, help="The number of worker processes")
+
+    query_parser = subparsers.add_parser("query", help="Print the indexed results as JSON Lines")
+    query_parser.add_argument("--task-type", default=None)
+    query_parser.add_argument("--device", default=None)
+    query_parser.add_argument("--data-type", default=None)
+    query_parser.add_argument("--status", default=None)
+    query_parser.add_argument("--max-latency", type=float, default=None)
+    query_parser.add_argument("--max-size", type=float, default=None)
+    query_parser.add_argument("--order-by", default=None, choices=ORDER_COLUMNS)
+    query_parser.add_argument("--limit", type=int, default=None)
+
+    return parser.parse_args()
+
+
+def main():
+    args = get_args()
+    index = ResultIndex(enabled=True)
+
+    if args.command == "rebuild":
+        index.rebuild(args.root_dirs, max_workers=args.workers)
+    else:
+        rows = index.query(
+            task_type=args.task_type,
+            target_device=args.device,
+            data_type=args.data_type,
+            status=args.status,
+            max_latency=args.max_latency,
+            max_model_size=args.max_size,
+            order_by=args.order_by,
+            limit=args.limit,
+        )
+        for row in rows:
+            row.pop("data")
+            print(json.dumps(row))
+
+
+if __name__ == "__main__":
+    main()
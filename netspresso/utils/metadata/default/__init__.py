@@ -1,6 +1,6 @@
-from .benchmarker import BenchmarkerMetadata
+from .benchmarker import BenchmarkerMetadata, LatencyDistribution
 from .compressor import CompressorMetadata
 from .converter import ConverterMetadata
 from .trainer import TrainerMetadata
 
-__all__ = ["TrainerMetadata", "CompressorMetadata", "ConverterMetadata", "BenchmarkerMetadata"]
+__all__ = ["TrainerMetadata", "CompressorMetadata", "ConverterMetadata", "BenchmarkerMetadata", "LatencyDistribution"]
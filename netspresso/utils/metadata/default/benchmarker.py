@@ -1,4 +1,5 @@
 import json
+import math
 from dataclasses import asdict, dataclass, field
 from typing import Any, Dict, List
 
@@ -28,6 +29,75 @@ class BenchmarkInfo:
     devicefarm_model_uuid: str = ""
 
 
+def _percentile(sorted_values: List[float], percent: float) -> float:
+    position = (len(sorted_values) - 1) * percent / 100
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+
+@dataclass
+class LatencyDistribution:
+    """Distribution of the timed latencies in ms. Warmup runs are excluded.
+
+    The histogram has `len(histogram_counts)` equal-width buckets between `min` and `max`,
+    and `histogram_edges` holds their `len(histogram_counts) + 1` edges.
+    """
+
+    iterations: int = 0
+    warmup: int = 0
+    mean: float = 0
+    std: float = 0
+    min: float = 0
+    max: float = 0
+    p50: float = 0
+    p90: float = 0
+    p99: float = 0
+    histogram_edges: List[float] = field(default_factory=list)
+    histogram_counts: List[int] = field(default_factory=list)
+
+    @classmethod
+    def from_latencies(cls, latencies: List[float], warmup: int = 0, num_buckets: int = 20) -> "LatencyDistribution":
+        """Summarize the latencies of the timed runs.
+
+        Args:
+            latencies (List[float]): The latency of every timed run in ms.
+            warmup (int): The number of untimed runs before the timed runs.
+            num_buckets (int): The number of histogram buckets.
+
+        Returns:
+            LatencyDistribution: The summary of the latencies.
+        """
+        if not latencies:
+            return cls(warmup=warmup)
+
+        values = sorted(latencies)
+        count = len(values)
+        mean = sum(values) / count
+        std = math.sqrt(sum((value - mean) ** 2 for value in values) / count)
+
+        low, high = values[0], values[-1]
+        width = (high - low) / num_buckets
+        counts = [0] * num_buckets
+        for value in values:
+            bucket = int((value - low) / width) if width > 0 else 0
+            counts[min(bucket, num_buckets - 1)] += 1
+
+        return cls(
+            iterations=count,
+            warmup=warmup,
+            mean=mean,
+            std=std,
+            min=low,
+            max=high,
+            p50=_percentile(values, 50),
+            p90=_percentile(values, 90),
+            p99=_percentile(values, 99),
+            histogram_edges=[low + width * idx for idx in range(num_buckets + 1)],
+            histogram_counts=counts,
+        )
+
+
 @dataclass
 class Result:
     memory_footprint_gpu: int = 0
@@ -36,6 +106,7 @@ class Result:
     ram_size: int = 0
     power_consumption: int = 0
     file_size: int = 0
+    latency_distribution: LatencyDistribution = field(default_factory=LatencyDistribution)
 
 
 @dataclass
@@ -91,3 +162,6 @@ class BenchmarkerMetadata:
         self.result.ram_size = ram_size
         self.result.power_consumption = power_consumption
         self.result.file_size = file_size
+
+    def update_latency_distribution(self, latency_distribution: LatencyDistribution) -> None:
+        self.result.latency_distribution = latency_distribution
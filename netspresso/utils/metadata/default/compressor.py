@@ -40,6 +40,29 @@ class CompressionInfo:
     layers: List[Dict] = field(default_factory=list)
 
 
+@dataclass
+class Checkpoint:
+    """Remote progress of a compression, saved after every step so the compression can be resumed.
+
+    Attributes:
+        step (str): The last completed CompressionStep. Empty before the first remote call.
+        compression_type (str): "advanced", "recommendation" or "automatic".
+        original_model_id (str): The ID of the uploaded model.
+        compression_id (str): The ID of the compression.
+        new_model_id (str): The ID of the compressed model.
+        credit_consumed (bool): Whether the consumed credit has been recorded.
+        request (Dict[str, Any]): The arguments needed to run the remaining steps.
+    """
+
+    step: str = ""
+    compression_type: str = ""
+    original_model_id: str = ""
+    compression_id: str = ""
+    new_model_id: str = ""
+    credit_consumed: bool = False
+    request: Dict[str, Any] = field(default_factory=dict)
+
+
 @dataclass
 class Results:
     original_model: Model = field(default_factory=Model)
@@ -56,6 +79,10 @@ class CompressorMetadata:
     model_info: ModelInfo = field(default_factory=ModelInfo)
     compression_info: CompressionInfo = field(default_factory=CompressionInfo)
     available_devices: List[TargetDevice] = field(default_factory=list)
+    launcher_model_uuid: str = ""
+    launcher_model_input_shape: Optional[Dict[str, Any]] = None
+    launcher_model_data_type: str = ""
+    checkpoint: Checkpoint = field(default_factory=Checkpoint)
 
     def asdict(self) -> Dict:
         _dict = json.loads(json.dumps(asdict(self)))
@@ -106,3 +133,16 @@ class CompressorMetadata:
             )
             for device in available_devices
         ]
+
+    def update_launcher_model_uuid(self, launcher_model_uuid):
+        self.launcher_model_uuid = launcher_model_uuid
+
+    def update_launcher_model(self, launcher_model):
+        self.launcher_model_uuid = launcher_model.model_uuid
+        input_shape = launcher_model.input_shape
+        self.launcher_model_input_shape = input_shape.dict() if input_shape is not None else None
+        self.launcher_model_data_type = launcher_model.data_type or ""
+
+    def update_checkpoint(self, **kwargs):
+        for key, value in kwargs.items():
+            setattr(self.checkpoint, key, value)
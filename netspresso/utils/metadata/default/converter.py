@@ -52,6 +52,8 @@ class ConverterMetadata:
     def update_model_info(self, data_type: str, framework: str, input_shape: Any) -> None:
         self.model_info.data_type = data_type
         self.model_info.framework = framework
+        if input_shape is None:
+            return
         self.model_info.input_shapes = [
             InputShape(
                 batch=input_shape.batch,
@@ -1,28 +1,87 @@
 import json
+import os
+import threading
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from netspresso.enums import TaskType
 
+from ..lock import atomic_write_text
 from .default import BenchmarkerMetadata, CompressorMetadata, ConverterMetadata, TrainerMetadata
+from .index import result_index
+from .store import BenchmarkStore
 
 
 class MetadataHandler:
+    # Compact JSON drops the indentation, which shrinks large available_devices and layers payloads.
+    compact: bool = os.getenv("NETSPRESSO_COMPACT_METADATA", "0") == "1"
+    # The writers of the metadata files with pending saves, released when the task is saved with flush.
+    _writers: Dict[Path, Any] = {}
+    _writers_lock = threading.Lock()
+
+    @staticmethod
+    def dumps(data: Any, compact: Optional[bool] = None) -> str:
+        """Serialize the data to JSON text.
+
+        Args:
+            data (Any): The data to be serialized.
+            compact (bool, optional): If True, write compact JSON. Defaults to MetadataHandler.compact.
+
+        Returns:
+            str: The JSON text.
+        """
+        if compact is None:
+            compact = MetadataHandler.compact
+        if compact:
+            return json.dumps(data, separators=(",", ":"))
+        return json.dumps(data, indent=4)
+
     @staticmethod
-    def save_json(data: dict, folder_path: str, file_name: str = "metadata") -> None:
+    def save_json(data: dict, folder_path: str, file_name: str = "metadata", compact: Optional[bool] = None) -> None:
         """Save dictionary data to a JSON file.
 
+        The data is written to a temporary file which then replaces the JSON file, so a crash
+        never leaves a truncated file behind. Task metadata is also added to the local result index.
+
         Args:
             data (dict): The dictionary data to be saved.
-            file_path (str): The path to the JSON file.
+            folder_path (str): The path to the folder of the JSON file.
+            file_name (str): The name of the JSON file without the extension.
+            compact (bool, optional): If True, write compact JSON. Defaults to MetadataHandler.compact.
 
         Returns:
             None
         """
         file_path = Path(folder_path) / f"{file_name}.json"
+        atomic_write_text(file_path, MetadataHandler.dumps(data, compact=compact))
+        result_index.update(file_path, data)
+
+    @staticmethod
+    def save_metadata(data: dict, folder_path: str, file_name: str = "metadata", flush: bool = False) -> None:
+        """Save the metadata of a running task, coalescing rapid successive saves of the same file.
 
-        with open(file_path, "w") as json_file:
-            json.dump(data, json_file, indent=4)
+        Intermediate saves go through a shared MetadataWriter of the file, so a burst of status changes
+        becomes a single write. Terminal states, and steps that must survive a crash, are saved with
+        `flush=True`, which writes at once and releases the writer.
+
+        Args:
+            data (dict): The dictionary data to be saved.
+            folder_path (str): The path to the folder of the JSON file.
+            file_name (str): The name of the JSON file without the extension.
+            flush (bool): If True, write at once.
+        """
+        # Imported here, the writer serializes with MetadataHandler.
+        from .writer import MetadataWriter
+
+        file_path = (Path(folder_path) / f"{file_name}.json").resolve()
+        with MetadataHandler._writers_lock:
+            writer = MetadataHandler._writers.get(file_path)
+            if writer is None:
+                writer = MetadataWriter(folder_path=folder_path, file_name=file_name)
+                MetadataHandler._writers[file_path] = writer
+            if flush:
+                del MetadataHandler._writers[file_path]
+        writer.save(data, flush=flush)
 
     @staticmethod
     def load_json(file_path: str) -> Dict[str, Any]:
@@ -73,3 +132,15 @@ class MetadataHandler:
         MetadataHandler.save_json(default_metadata.asdict(), folder_path, file_name=file_name)
 
         return default_metadata
+
+    @staticmethod
+    def get_benchmark_store(folder_path: str) -> BenchmarkStore:
+        """Get the benchmark result store of a model folder.
+
+        Args:
+            folder_path (str): The folder of the benchmarked model.
+
+        Returns:
+            BenchmarkStore: The append-only store of the benchmark results.
+        """
+        return BenchmarkStore(folder_path)
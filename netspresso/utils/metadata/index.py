@@ -0,0 +1,347 @@
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from loguru import logger
+
+DEFAULT_INDEX_PATH = Path.home() / ".netspresso" / "index.db"
+METADATA_FILE_NAME = "metadata.json"
+BENCHMARK_FILE_NAMES = ["benchmark.jsonl", "benchmark.json"]
+
+COLUMNS = [
+    "path",
+    "record_id",
+    "folder",
+    "task_type",
+    "status",
+    "framework",
+    "target_device",
+    "data_type",
+    "software_version",
+    "hardware_type",
+    "latency",
+    "model_size",
+    "flops",
+    "compression_ratio",
+    "updated_at",
+    "data",
+]
+ORDER_COLUMNS = ["latency", "model_size", "flops", "compression_ratio", "updated_at"]
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS results (
+    path TEXT NOT NULL,
+    record_id TEXT NOT NULL,
+    folder TEXT NOT NULL,
+    task_type TEXT,
+    status TEXT,
+    framework TEXT,
+    target_device TEXT,
+    data_type TEXT,
+    software_version TEXT,
+    hardware_type TEXT,
+    latency REAL,
+    model_size REAL,
+    flops REAL,
+    compression_ratio REAL,
+    updated_at REAL,
+    data TEXT,
+    PRIMARY KEY (path, record_id)
+);
+CREATE INDEX IF NOT EXISTS results_task_type ON results (task_type, target_device, data_type);
+CREATE INDEX IF NOT EXISTS results_folder ON results (folder);
+"""
+
+
+def _get(data: Dict, *keys: str) -> Any:
+    for key in keys:
+        if not isinstance(data, dict):
+            return None
+        data = data.get(key)
+    return data if data != "" else None
+
+
+def extract_row(file_path: Union[str, Path], data: Dict, record_id: str = "") -> Optional[Dict[str, Any]]:
+    """Extract the indexed columns of a metadata or benchmark record.
+
+    Args:
+        file_path (Union[str, Path]): The file the record is saved in.
+        data (Dict): The metadata of the record.
+        record_id (str): The id of the record inside the file. Empty for metadata.json.
+
+    Returns:
+        Optional[Dict[str, Any]]: The row, or None if the data is not a task metadata.
+    """
+    if not isinstance(data, dict) or "task_type" not in data:
+        return None
+
+    file_path = Path(file_path).resolve()
+    task_type = data["task_type"]
+    row = dict.fromkeys(COLUMNS)
+    row.update(
+        path=file_path.as_posix(),
+        record_id=record_id,
+        folder=file_path.parent.as_posix(),
+        task_type=task_type,
+        status=data.get("status"),
+        updated_at=time.time(),
+        data=json.dumps(data, separators=(",", ":")),
+    )
+
+    if task_type == "compress":
+        row.update(
+            framework=_get(data, "model_info", "framework"),
+            model_size=_get(data, "results", "compressed_model", "size"),
+            flops=_get(data, "results", "compressed_model", "flops"),
+            compression_ratio=_get(data, "compression_info", "ratio"),
+        )
+    elif task_type == "convert":
+        row.update(
+            framework=_get(data, "convert_info", "target_framework"),
+            target_device=_get(data, "convert_info", "target_device_name"),
+            data_type=_get(data, "convert_info", "data_type"),
+            software_version=_get(data, "convert_info", "software_version"),
+        )
+    elif task_type == "benchmark":
+        row.update(
+            target_device=_get(data, "benchmark_info", "target_device"),
+            data_type=_get(data, "benchmark_info", "data_type"),
+            software_version=_get(data, "benchmark_info", "software_version"),
+            hardware_type=_get(data, "benchmark_info", "hardware_type"),
+            latency=_get(data, "result", "latency"),
+            model_size=_get(data, "result", "file_size"),
+        )
+    elif task_type == "train":
+        row.update(framework=_get(data, "model_info", "framework"))
+
+    return row
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def scan_folder(folder_path: str) -> List[Dict[str, Any]]:
+    """Extract the rows of the result files directly inside the folder."""
+    rows = []
+    folder = Path(folder_path)
+
+    metadata_path = folder / METADATA_FILE_NAME
+    if metadata_path.is_file():
+        try:
+            with open(metadata_path, "r") as f:
+                row = extract_row(metadata_path, json.load(f))
+            if row is not None:
+                rows.append(row)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skip {metadata_path}. Error: {e}")
+
+    # The files are only read. A legacy benchmark.json is indexed as it is and left for BenchmarkStore to migrate.
+    jsonl_path = folder / BENCHMARK_FILE_NAMES[0]
+    json_path = folder / BENCHMARK_FILE_NAMES[1]
+    try:
+        if jsonl_path.is_file():
+            from .store import latest_lines
+
+            with open(jsonl_path, "r", encoding="utf-8") as f:
+                records = [json.loads(line) for line in latest_lines(f)]
+            records = [(record.pop("record_id"), record) for record in records]
+            rows.extend(extract_row(jsonl_path, record, record_id) for record_id, record in records)
+        if json_path.is_file():
+            with open(json_path, "r") as f:
+                records = json.load(f)
+            rows.extend(extract_row(json_path, record, str(idx)) for idx, record in enumerate(records))
+    except (OSError, ValueError) as e:
+        logger.warning(f"Skip the benchmark results in {folder}. Error: {e}")
+
+    return [row for row in rows if row is not None]
+
+
+class ResultIndex:
+    """Local SQLite catalog of the results saved in the output folders.
+
+    `MetadataHandler.save_json` and `BenchmarkStore` update the index on every save, so results can be
+    queried without walking and parsing every output folder. Failures of the index never fail a save.
+
+    Args:
+        db_path (Union[str, Path], optional): The path of the SQLite database.
+        enabled (bool): If False, updates are ignored.
+    """
+
+    def __init__(self, db_path: Optional[Union[str, Path]] = None, enabled: bool = True) -> None:
+        self.db_path = Path(db_path or os.getenv("NETSPRESSO_INDEX_PATH", DEFAULT_INDEX_PATH))
+        self.enabled = enabled and os.getenv("NETSPRESSO_RESULT_INDEX", "1") != "0"
+        self._initialized = False
+
+    def _connect(self) -> sqlite3.Connection:
+        if not self._initialized:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        connection = sqlite3.connect(self.db_path, timeout=30)
+        if not self._initialized:
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(SCHEMA)
+            self._initialized = True
+        return connection
+
+    @staticmethod
+    def _upsert(connection: sqlite3.Connection, rows: Iterable[Dict[str, Any]]) -> None:
+        placeholders = ", ".join("?" for _ in COLUMNS)
+        connection.executemany(
+            f"INSERT OR REPLACE INTO results ({', '.join(COLUMNS)}) VALUES ({placeholders})",
+            [tuple(row[column] for column in COLUMNS) for row in rows],
+        )
+
+    def update(self, file_path: Union[str, Path], data: Dict, record_id: str = "") -> None:
+        """Index one saved record.
+
+        Args:
+            file_path (Union[str, Path]): The file the record is saved in.
+            data (Dict): The metadata of the record.
+            record_id (str): The id of the record inside the file. Empty for metadata.json.
+        """
+        self.update_many(file_path, [(record_id, data)])
+
+    def update_many(self, file_path: Union[str, Path], records: List[Tuple[str, Dict]]) -> None:
+        """Index many records saved in the same file.
+
+        Args:
+            file_path (Union[str, Path]): The file the records are saved in.
+            records (List[Tuple[str, Dict]]): The (record_id, metadata) of every record.
+        """
+        if not self.enabled:
+            return
+        try:
+            rows = [extract_row(file_path, data, record_id) for record_id, data in records]
+            rows = [row for row in rows if row is not None]
+            if not rows:
+                return
+            with closing(self._connect()) as connection, connection:
+                self._upsert(connection, rows)
+        except Exception as e:
+            logger.debug(f"Failed to update the result index. Error: {e}")
+
+    def query(
+        self,
+        task_type: Optional[str] = None,
+        target_device: Optional[str] = None,
+        data_type: Optional[str] = None,
+        status: Optional[str] = None,
+        framework: Optional[str] = None,
+        max_latency: Optional[float] = None,
+        max_model_size: Optional[float] = None,
+        min_compression_ratio: Optional[float] = None,
+        max_compression_ratio: Optional[float] = None,
+        folder: Optional[Union[str, Path]] = None,
+        order_by: Optional[str] = None,
+        limit: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """Query the indexed results.
+
+        Sizes and latencies are compared in the units recorded in the metadata.
+
+        Args:
+            task_type (str, optional): The task type. ex) "compress", "convert", "benchmark"
+            target_device (str, optional): The device name.
+            data_type (str, optional): The data type of the model.
+            status (str, optional): The status of the task.
+            framework (str, optional): The framework of the model.
+            max_latency (float, optional): The maximum benchmark latency.
+            max_model_size (float, optional): The maximum model size.
+            min_compression_ratio (float, optional): The minimum compression ratio.
+            max_compression_ratio (float, optional): The maximum compression ratio.
+            folder (Union[str, Path], optional): Only return results saved under this folder.
+            order_by (str, optional): Sort ascending by one of latency, model_size, flops, compression_ratio, updated_at.
+            limit (int, optional): The maximum number of results.
+
+        Raises:
+            ValueError: If order_by is not a sortable column.
+
+        Returns:
+            List[Dict[str, Any]]: The matching rows, with the full metadata under "data".
+        """
+        conditions, params = [], []
+        equals = {
+            "task_type": task_type,
+            "target_device": target_device,
+            "data_type": data_type,
+            "status": status,
+            "framework": framework,
+        }
+        for column, value in equals.items():
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(str(getattr(value, "value", value)))
+        ranges = [
+            ("latency <= ?", max_latency),
+            ("model_size <= ?", max_model_size),
+            ("compression_ratio >= ?", min_compression_ratio),
+            ("compression_ratio <= ?", max_compression_ratio),
+        ]
+        for condition, value in ranges:
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        if folder is not None:
+            folder = Path(folder).resolve().as_posix()
+            conditions.append("(folder = ? OR folder LIKE ? ESCAPE '\\')")
+            params.extend([folder, f"{_escape_like(folder)}/%"])
+
+        sql = f"SELECT {', '.join(COLUMNS)} FROM results"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        if order_by is not None:
+            if order_by not in ORDER_COLUMNS:
+                raise ValueError(f"order_by should be one of {ORDER_COLUMNS}.")
+            sql += f" ORDER BY {order_by} IS NULL, {order_by}"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+
+        with closing(self._connect()) as connection:
+            rows = connection.execute(sql, params).fetchall()
+
+        results = []
+        for values in rows:
+            row = dict(zip(COLUMNS, values))
+            row["data"] = json.loads(row["data"])
+            results.append(row)
+        return results
+
+    def rebuild(self, root_dirs: List[Union[str, Path]], max_workers: Optional[int] = None) -> int:
+        """Re-index every result folder under the root folders, parsing the folders in parallel.
+
+        Args:
+            root_dirs (List[Union[str, Path]]): The folders to scan recursively.
+            max_workers (int, optional): The number of worker processes. Defaults to the number of CPUs.
+
+        Returns:
+            int: The number of indexed records.
+        """
+        roots = [Path(root_dir).resolve() for root_dir in root_dirs]
+        folders = []
+        for root in roots:
+            for dirpath, _, filenames in os.walk(root):
+                if METADATA_FILE_NAME in filenames or any(name in filenames for name in BENCHMARK_FILE_NAMES):
+                    folders.append(dirpath)
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            rows = [row for folder_rows in executor.map(scan_folder, folders, chunksize=16) for row in folder_rows]
+
+        with closing(self._connect()) as connection, connection:
+            for root in roots:
+                connection.execute(
+                    "DELETE FROM results WHERE folder = ? OR folder LIKE ? ESCAPE '\\'",
+                    [root.as_posix(), f"{_escape_like(root.as_posix())}/%"],
+                )
+            self._upsert(connection, rows)
+
+        logger.info(f"Indexed {len(rows)} results from {len(folders)} folders.")
+        return len(rows)
+
+
+result_index = ResultIndex()
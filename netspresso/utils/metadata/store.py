@@ -0,0 +1,197 @@
+import json
+import os
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+from loguru import logger
+
+from ..lock import FileLock, atomic_write_text
+from .index import result_index
+
+RECORD_PREFIX = '{"record_id":"'
+RECORD_ID_LENGTH = 36
+
+
+def _dumps(data: Any) -> str:
+    return json.dumps(data, separators=(",", ":"))
+
+
+def latest_lines(lines: Iterable[str]) -> List[str]:
+    """Keep the last version of every record of benchmark.jsonl lines.
+
+    Args:
+        lines (Iterable[str]): The lines of the file.
+
+    Returns:
+        List[str]: The last line of every record, in the order the records were created.
+    """
+    latest = {}
+    for line in lines:
+        # A line without a newline is an interrupted write.
+        if not line.startswith(RECORD_PREFIX) or not line.endswith("\n"):
+            continue
+        record_id = line[len(RECORD_PREFIX) : len(RECORD_PREFIX) + RECORD_ID_LENGTH]
+        # Assigning an existing key keeps the position of its first version.
+        latest[record_id] = line
+
+    return list(latest.values())
+
+
+class BenchmarkStore:
+    """Append-only store of the benchmark results of a model folder, saved as `benchmark.jsonl`.
+
+    Every line is one version of a benchmark record. Updating a record appends a new version
+    with the same `record_id`, and readers keep the last version of every record. Writers take
+    an exclusive file lock, so concurrent processes never interleave lines.
+
+    A legacy `benchmark.json` in the folder is imported on first use and renamed to `benchmark.json.migrated`.
+
+    Args:
+        folder_path (Union[str, Path]): The folder of the benchmarked model.
+    """
+
+    FILE_NAME = "benchmark.jsonl"
+    LEGACY_FILE_NAME = "benchmark.json"
+
+    def __init__(self, folder_path: Union[str, Path]) -> None:
+        self.folder_path = Path(folder_path)
+        self.file_path = self.folder_path / self.FILE_NAME
+        self._migrate()
+
+    def _migrate(self) -> None:
+        legacy_path = self.folder_path / self.LEGACY_FILE_NAME
+        if not legacy_path.exists():
+            return
+
+        with FileLock(self.file_path):
+            if not legacy_path.exists():
+                return
+            with open(legacy_path, "r") as json_file:
+                records = json.load(json_file)
+            lines = self.file_path.read_text(encoding="utf-8") if self.file_path.exists() else ""
+            lines += "".join(self._encode(str(uuid.uuid4()), record) for record in records)
+            atomic_write_text(self.file_path, lines)
+            os.replace(legacy_path, legacy_path.with_name(f"{self.LEGACY_FILE_NAME}.migrated"))
+            logger.info(f"Migrated {len(records)} benchmark results to {self.file_path}")
+
+    @staticmethod
+    def _encode(record_id: str, data: Dict) -> str:
+        # The record_id is always the first key, so readers can find it without parsing the line.
+        return _dumps({"record_id": record_id, **data}) + "\n"
+
+    def append(self, data: Dict, record_id: Optional[str] = None) -> str:
+        """Append a benchmark record, or a new version of an existing record.
+
+        Args:
+            data (Dict): The benchmark metadata.
+            record_id (str, optional): The id of the record to update. A new record is created if None.
+
+        Returns:
+            str: The id of the record.
+        """
+        return self.append_many([data], [record_id])[0]
+
+    def append_many(self, data_list: List[Dict], record_ids: Optional[List[Optional[str]]] = None) -> List[str]:
+        """Append many benchmark records with a single write.
+
+        Args:
+            data_list (List[Dict]): The benchmark metadata of every record.
+            record_ids (List[Optional[str]], optional): The ids of the records to update. New records are created for None.
+
+        Returns:
+            List[str]: The ids of the records.
+        """
+        if record_ids is None:
+            record_ids = [None] * len(data_list)
+        record_ids = [record_id or str(uuid.uuid4()) for record_id in record_ids]
+        lines = "".join(self._encode(record_id, data) for record_id, data in zip(record_ids, data_list))
+
+        with FileLock(self.file_path), open(self.file_path, "a", encoding="utf-8") as f:
+            f.write(lines)
+            f.flush()
+        result_index.update_many(self.file_path, list(zip(record_ids, data_list)))
+
+        return record_ids
+
+    def update(self, record_id: str, data: Dict) -> None:
+        """Save a new version of the record.
+
+        Args:
+            record_id (str): The id of the record.
+            data (Dict): The benchmark metadata.
+        """
+        self.append(data, record_id=record_id)
+
+    def _read_latest_lines(self) -> List[str]:
+        if not self.file_path.exists():
+            return []
+
+        with FileLock(self.file_path, shared=True), open(self.file_path, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+
+        return latest_lines(lines)
+
+    def query(
+        self,
+        target_device: Optional[str] = None,
+        data_type: Optional[str] = None,
+        status: Optional[str] = None,
+        software_version: Optional[str] = None,
+        hardware_type: Optional[str] = None,
+    ) -> Iterator[Dict]:
+        """Iterate over the latest version of the records matching every given filter.
+
+        The filters are matched against the raw lines first, so only the candidate lines are parsed.
+
+        Args:
+            target_device (str, optional): The device name of the benchmark.
+            data_type (str, optional): The data type of the benchmarked model.
+            status (str, optional): The status of the benchmark.
+            software_version (str, optional): The software version of the device.
+            hardware_type (str, optional): The hardware type of the device.
+
+        Yields:
+            Dict: The benchmark metadata with its `record_id`.
+        """
+        filters = {
+            "target_device": target_device,
+            "data_type": data_type,
+            "software_version": software_version,
+            "hardware_type": hardware_type,
+        }
+        filters = {key: value for key, value in filters.items() if value is not None}
+        tokens = [f'"{key}":{_dumps(value)}' for key, value in filters.items()]
+        if status is not None:
+            tokens.append(f'"status":{_dumps(status)}')
+
+        for line in self._read_latest_lines():
+            if not all(token in line for token in tokens):
+                continue
+            record = json.loads(line)
+            benchmark_info = record.get("benchmark_info", {})
+            if any(benchmark_info.get(key) != value for key, value in filters.items()):
+                continue
+            if status is not None and record.get("status") != status:
+                continue
+            yield record
+
+    def load(self) -> List[Dict]:
+        """Load the latest version of every record.
+
+        Returns:
+            List[Dict]: The benchmark metadata of every record, in the order they were created.
+        """
+        return list(self.query())
+
+    def compact(self) -> None:
+        """Rewrite the file keeping only the latest version of every record."""
+        with FileLock(self.file_path):
+            if not self.file_path.exists():
+                return
+            lines = {}
+            with open(self.file_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith(RECORD_PREFIX) and line.endswith("\n"):
+                        lines[line[len(RECORD_PREFIX) : len(RECORD_PREFIX) + RECORD_ID_LENGTH]] = line
+            atomic_write_text(self.file_path, "".join(lines.values()))
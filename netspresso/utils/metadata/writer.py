@@ -0,0 +1,167 @@
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Union
+
+from ..lock import atomic_write_text
+from .handler import MetadataHandler
+from .index import result_index
+from .store import BenchmarkStore
+
+
+class MetadataWriter:
+    """Save one metadata file, coalescing rapid successive saves into a single atomic write.
+
+    The first save is written at once. Saves within `interval` seconds of the last write only replace
+    the pending content, which is written when the interval is over. Content equal to the last write
+    is skipped. Terminal states should be saved with `flush=True`, or by closing the writer.
+    Task metadata is also added to the local result index on every write.
+
+    Args:
+        folder_path (Union[str, Path]): The folder of the metadata file.
+        file_name (str): The name of the metadata file without the extension.
+        interval (float): The minimum number of seconds between two writes.
+        compact (bool, optional): If True, write compact JSON. Defaults to MetadataHandler.compact.
+    """
+
+    def __init__(
+        self,
+        folder_path: Union[str, Path],
+        file_name: str = "metadata",
+        interval: float = 1.0,
+        compact: Optional[bool] = None,
+    ) -> None:
+        self.file_path = Path(folder_path) / f"{file_name}.json"
+        self.interval = interval
+        self.compact = compact
+        self._lock = threading.Lock()
+        self._pending: Optional[str] = None
+        self._written: Optional[str] = None
+        self._last_write = 0.0
+        self._timer: Optional[threading.Timer] = None
+
+    def _write(self) -> None:
+        # Called with the lock held.
+        text, self._pending = self._pending, None
+        if text is None or text == self._written:
+            return
+        atomic_write_text(self.file_path, text)
+        result_index.update(self.file_path, json.loads(text))
+        self._written = text
+        self._last_write = time.monotonic()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._write()
+
+    def save(self, data: Any, flush: bool = False) -> None:
+        """Save the metadata.
+
+        Args:
+            data (Any): The JSON serializable metadata. It is serialized immediately, so it can be changed afterwards.
+            flush (bool): If True, write at once instead of waiting for the interval.
+        """
+        text = MetadataHandler.dumps(data, compact=self.compact)
+        with self._lock:
+            self._pending = text
+            wait = self.interval - (time.monotonic() - self._last_write)
+            if flush or wait <= 0:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                self._write()
+            elif self._timer is None:
+                self._timer = threading.Timer(wait, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Write the pending metadata, if any."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._write()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "MetadataWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class BenchmarkResultWriter:
+    """Save the records of a BenchmarkStore, coalescing the updates of many records into batched appends.
+
+    The first update is appended at once. Updates within `interval` seconds of the last append are kept
+    pending, with only the latest version of each record, and appended together when the interval is over.
+
+    Args:
+        store (BenchmarkStore): The store of the records.
+        interval (float): The minimum number of seconds between two appends.
+    """
+
+    def __init__(self, store: BenchmarkStore, interval: float = 1.0) -> None:
+        self.store = store
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict] = {}
+        self._last_write = 0.0
+        self._timer: Optional[threading.Timer] = None
+
+    def _write(self) -> None:
+        # Called with the lock held.
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        self.store.append_many(list(pending.values()), list(pending.keys()))
+        self._last_write = time.monotonic()
+
+    def _on_timer(self) -> None:
+        with self._lock:
+            self._timer = None
+            self._write()
+
+    def save(self, record_id: str, data: Dict, flush: bool = False) -> None:
+        """Save a new version of the record.
+
+        Args:
+            record_id (str): The id of the record.
+            data (Dict): The benchmark metadata. It is copied immediately, so it can be changed afterwards.
+            flush (bool): If True, append at once with the other pending updates.
+        """
+        data = json.loads(json.dumps(data))
+        with self._lock:
+            self._pending[record_id] = data
+            wait = self.interval - (time.monotonic() - self._last_write)
+            if flush or wait <= 0:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                self._write()
+            elif self._timer is None:
+                self._timer = threading.Timer(wait, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def flush(self) -> None:
+        """Append the pending updates, if any."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            self._write()
+
+    def close(self) -> None:
+        self.flush()
+
+    def __enter__(self) -> "BenchmarkResultWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
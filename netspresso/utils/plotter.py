@@ -566,3 +566,74 @@ class Plotter:
 
             plt.tight_layout()
             plt.show()
+
+    @staticmethod
+    def _get_latency_distributions(benchmark_results, labels):
+        if isinstance(benchmark_results, dict):
+            benchmark_results = [benchmark_results]
+        if labels is None:
+            labels = [
+                result["benchmark_info"]["target_device"] or f"Model {idx}"
+                for idx, result in enumerate(benchmark_results)
+            ]
+        distributions = [result["result"].get("latency_distribution") for result in benchmark_results]
+        if not all(distribution and distribution["iterations"] for distribution in distributions):
+            raise ValueError("Every benchmark result should have a latency distribution. Benchmark with LocalBackend.")
+
+        return distributions, labels
+
+    @staticmethod
+    def plot_latency_distribution(benchmark_results, labels=None):
+        distributions, labels = Plotter._get_latency_distributions(benchmark_results, labels)
+
+        fig, axs = plt.subplots(ncols=len(distributions), figsize=(6 * len(distributions), 5), squeeze=False)
+
+        for ax, distribution, label in zip(axs[0], distributions, labels):
+            edges = np.array(distribution["histogram_edges"])
+            widths = np.diff(edges) if edges[-1] > edges[0] else np.ones(len(edges) - 1) * 0.01
+            ax.bar(edges[:-1], distribution["histogram_counts"], width=widths, align="edge", color="dodgerblue")
+            for percentile, color in [("p50", "slategray"), ("p90", "orange"), ("p99", "red")]:
+                ax.axvline(
+                    distribution[percentile],
+                    color=color,
+                    linestyle="--",
+                    label=f"{percentile}: {distribution[percentile]:.2f} ms",
+                )
+            ax.set_xlabel("Latency (ms)")
+            ax.set_ylabel("Count")
+            ax.set_title(f"{label} ({distribution['iterations']} iterations)")
+            ax.legend()
+            ax.grid(axis="y")
+
+        plt.tight_layout()
+        plt.show()
+
+    @staticmethod
+    def compare_latency_percentiles(benchmark_results, labels=None):
+        distributions, labels = Plotter._get_latency_distributions(benchmark_results, labels)
+        keys = ["mean", "p50", "p90", "p99", "max"]
+
+        fig, ax = plt.subplots(figsize=(12, 6))
+        x = np.arange(len(keys))
+        width = 0.8 / len(distributions)
+
+        for idx, (distribution, label) in enumerate(zip(distributions, labels)):
+            bars = ax.bar(x + idx * width, [distribution[key] for key in keys], width, label=label)
+            for bar in bars:
+                ax.text(
+                    bar.get_x() + bar.get_width() / 2,
+                    bar.get_height(),
+                    f"{bar.get_height():.2f}",
+                    ha="center",
+                    va="bottom",
+                )
+
+        ax.set_ylabel("Latency (ms)")
+        ax.set_title("Latency Percentiles")
+        ax.set_xticks(x + width * (len(distributions) - 1) / 2)
+        ax.set_xticklabels(keys)
+        ax.legend()
+        ax.grid(axis="y")
+
+        plt.tight_layout()
+        plt.show()
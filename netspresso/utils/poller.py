@@ -0,0 +1,156 @@
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from loguru import logger
+
+
+class JobTimeoutError(TimeoutError):
+    """Raised when the polled jobs do not finish within the timeout."""
+
+
+@dataclass
+class BackoffPolicy:
+    """Polling intervals with exponential backoff and jitter.
+
+    Attributes:
+        initial_interval (float): Seconds to wait before the second poll.
+        max_interval (float): Upper bound of the interval between two polls.
+        multiplier (float): Factor applied to the interval after every poll without a status change.
+        jitter (float): Random spread applied to every interval, as a fraction of the interval.
+        timeout (float, optional): Seconds after which the waiting is aborted. Wait forever if None.
+        max_fetch_errors (int): Number of consecutive failed polls tolerated for a job before the error is raised.
+    """
+
+    initial_interval: float = 1.0
+    max_interval: float = 30.0
+    multiplier: float = 1.5
+    jitter: float = 0.1
+    timeout: Optional[float] = None
+    max_fetch_errors: int = 3
+
+    def next_interval(self, interval: Optional[float] = None) -> float:
+        if interval is None:
+            return self.initial_interval
+        return min(interval * self.multiplier, self.max_interval)
+
+    def apply_jitter(self, interval: float) -> float:
+        return max(interval * (1 + random.uniform(-self.jitter, self.jitter)), 0.0)
+
+
+@dataclass
+class _PollState:
+    result: Any = None
+    status: Any = None
+    interval: Optional[float] = None
+    next_poll_at: float = 0.0
+    fetch_errors: int = 0
+
+
+class JobPoller:
+    """Wait for remote jobs, polling each of them with its own backoff in a single loop.
+
+    Args:
+        fetch (Callable[[str], Any]): Returns the current state of the job with the given id.
+        is_done (Callable[[Any], bool]): Returns True when the fetched state is final.
+        get_status (Callable[[Any], Any]): Extracts the status from the fetched state. Defaults to the state itself.
+        policy (BackoffPolicy, optional): The polling intervals and timeout.
+        on_status_change (Callable[[str, Any, Any, Any], None], optional): Called with
+            (job_id, previous_status, status, state) every time the status of a job changes.
+        on_poll (Callable[[str, Any], None], optional): Called with (job_id, state) after every successful poll.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Any],
+        is_done: Callable[[Any], bool],
+        get_status: Callable[[Any], Any] = lambda state: state,
+        policy: Optional[BackoffPolicy] = None,
+        on_status_change: Optional[Callable[[str, Any, Any, Any], None]] = None,
+        on_poll: Optional[Callable[[str, Any], None]] = None,
+    ) -> None:
+        self.fetch = fetch
+        self.is_done = is_done
+        self.get_status = get_status
+        self.policy = policy if policy is not None else BackoffPolicy()
+        self.on_status_change = on_status_change
+        self.on_poll = on_poll
+
+    def _poll(self, job_id: str, state: _PollState) -> bool:
+        try:
+            result = self.fetch(job_id)
+            state.fetch_errors = 0
+        except Exception as e:
+            state.fetch_errors += 1
+            if state.fetch_errors > self.policy.max_fetch_errors:
+                raise e
+            logger.warning(f"Failed to get the status of {job_id}. Retrying. Error: {e}")
+            state.interval = self.policy.next_interval(state.interval)
+            return False
+
+        if self.on_poll is not None:
+            self.on_poll(job_id, result)
+        status = self.get_status(result)
+        if status != state.status:
+            if self.on_status_change is not None:
+                self.on_status_change(job_id, state.status, status, result)
+            # The job moved on, so check it again soon.
+            state.interval = None
+        state.result = result
+        state.status = status
+        state.interval = self.policy.next_interval(state.interval)
+
+        return self.is_done(result)
+
+    def wait(self, job_id: str) -> Any:
+        """Wait until the job is done.
+
+        Args:
+            job_id (str): The id of the job.
+
+        Raises:
+            JobTimeoutError: If the job is not done within the timeout of the policy.
+
+        Returns:
+            Any: The final state of the job.
+        """
+        return self.wait_all([job_id])[job_id]
+
+    def wait_all(self, job_ids: Iterable[str]) -> Dict[str, Any]:
+        """Wait until every job is done, polling all of them in a single loop.
+
+        Args:
+            job_ids (Iterable[str]): The ids of the jobs.
+
+        Raises:
+            JobTimeoutError: If any job is not done within the timeout of the policy.
+
+        Returns:
+            Dict[str, Any]: The final state of every job.
+        """
+        started_at = time.monotonic()
+        states = {job_id: _PollState(next_poll_at=started_at) for job_id in job_ids}
+        pending = set(states)
+
+        while pending:
+            now = time.monotonic()
+            for job_id in [job_id for job_id in pending if states[job_id].next_poll_at <= now]:
+                state = states[job_id]
+                if self._poll(job_id, state):
+                    pending.discard(job_id)
+                else:
+                    state.next_poll_at = time.monotonic() + self.policy.apply_jitter(state.interval)
+
+            if not pending:
+                break
+
+            if self.policy.timeout is not None and time.monotonic() - started_at > self.policy.timeout:
+                raise JobTimeoutError(f"Jobs are not done within {self.policy.timeout} seconds: {sorted(pending)}")
+
+            next_poll_at = min(states[job_id].next_poll_at for job_id in pending)
+            if self.policy.timeout is not None:
+                next_poll_at = min(next_poll_at, started_at + self.policy.timeout + 0.001)
+            time.sleep(max(next_poll_at - time.monotonic(), 0))
+
+        return {job_id: state.result for job_id, state in states.items()}
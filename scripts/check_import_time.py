@@ -0,0 +1,88 @@
+"""Guard the cold-start cost of `import netspresso`.
+
+Imports the package in fresh interpreters, fails if the median import time exceeds the budget
+or if a heavy optional dependency is imported eagerly.
+
+    python scripts/check_import_time.py --budget 1.0
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+from argparse import ArgumentParser
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# These are only needed by Trainer, Plotter, export_onnx and TAOTrainer and must be imported on first use.
+LAZY_MODULES = ["torch", "matplotlib", "netspresso_trainer", "omegaconf", "pkg_resources"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import netspresso
+elapsed = time.perf_counter() - start
+print(json.dumps({"elapsed": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def run_probe():
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", PROBE],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    # -X importtime reports "import time: self [us] | cumulative | imported package" lines on stderr.
+    cumulative = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:") :].split("|")
+        cumulative[name.strip()] = int(cumulative_us)
+
+    return json.loads(result.stdout.strip().splitlines()[-1]), cumulative
+
+
+def get_args():
+    parser = ArgumentParser()
+    parser.add_argument("--budget", type=float, default=1.0, help="The maximum median import time in seconds")
+    parser.add_argument("--runs", type=int, default=5, help="The number of fresh interpreters to measure")
+    parser.add_argument("--top", type=int, default=10, help="The number of slowest top-level imports to show")
+
+    return parser.parse_args()
+
+
+def main():
+    args = get_args()
+
+    elapsed_times = []
+    for _ in range(args.runs):
+        probe, cumulative = run_probe()
+        elapsed_times.append(probe["elapsed"])
+    median = statistics.median(elapsed_times)
+
+    print(
+        f"import netspresso: median {median * 1000:.1f} ms over {args.runs} runs (budget {args.budget * 1000:.0f} ms)"
+    )
+    top_level = {name: us for name, us in cumulative.items() if "." not in name}
+    for name, us in sorted(top_level.items(), key=lambda item: item[1], reverse=True)[: args.top]:
+        print(f"  {us / 1000:8.1f} ms  {name}")
+
+    failures = []
+    eager_modules = [module for module in LAZY_MODULES if module in probe["modules"]]
+    if eager_modules:
+        failures.append(f"Heavy modules are imported eagerly: {eager_modules}")
+    if median > args.budget:
+        failures.append(f"The median import time {median:.3f}s exceeds the budget of {args.budget:.3f}s")
+
+    for failure in failures:
+        print(failure, file=sys.stderr)
+
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())